@@ -46,6 +46,7 @@ LOG = Logger(level=logging.ERROR, to_file=False, to_stdout=True)
 
 
 from ansys.mechanical.core._version import __version__
+from ansys.mechanical.core.aio import AsyncMechanical
 
 # import few classes / functions
 from ansys.mechanical.core.mechanical import (
@@ -68,7 +69,7 @@ except:
 LOCAL_PORTS = []
 """Manage the package level ports."""
 
-from ansys.mechanical.core.pool import LocalMechanicalPool
+from ansys.mechanical.core.pool import DistributedMechanicalPool, LocalMechanicalPool
 
 BUILDING_GALLERY = False
 """Whether or not to build gallery examples."""
@@ -0,0 +1,358 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Asynchronous client for a Mechanical gRPC session."""
+
+import asyncio
+import fnmatch
+import os
+import pathlib
+import socket
+
+import ansys.api.mechanical.v0.mechanical_pb2 as mechanical_pb2
+import ansys.api.mechanical.v0.mechanical_pb2_grpc as mechanical_pb2_grpc
+import grpc
+
+from ansys.mechanical.core import LOG
+from ansys.mechanical.core.mechanical import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_FILE_CHUNK_SIZE,
+    MAX_MESSAGE_LENGTH,
+    MECHANICAL_DEFAULT_PORT,
+    is_result_conversion_error,
+    run_script_request,
+)
+from ansys.mechanical.core.misc import check_valid_ip
+from ansys.mechanical.core.transfer import FileSink
+
+
+class AsyncMechanical:
+    """Connects to a Mechanical gRPC server through an ``asyncio`` client.
+
+    The methods that call the server are coroutines, so a single event loop
+    can drive many sessions without a thread per call. Local file reads and
+    writes run in the default executor of the event loop.
+
+    Parameters
+    ----------
+    ip : str, optional
+        IP address to connect to the server. The default is ``None``,
+        in which case ``localhost`` is used.
+    port : int, optional
+        Port to connect to the Mechanical server. The default is ``None``,
+        in which case ``10000`` is used.
+    channel : grpc.aio.Channel, optional
+        ``grpc.aio`` channel to use for the connection. The default is ``None``.
+        You can use this parameter as an alternative to the ``ip`` and ``port``
+        parameters.
+    loglevel : str, optional
+        Level of messages to print to the console. The default is ``"WARNING"``.
+
+    Examples
+    --------
+    Run a script on a Mechanical instance that is already running locally on
+    the default port.
+
+    >>> import asyncio
+    >>> from ansys.mechanical.core import AsyncMechanical
+    >>> async def main():
+    ...     async with AsyncMechanical() as mechanical:
+    ...         return await mechanical.run_python_script("2+3")
+    >>> asyncio.run(main())
+    '5'
+
+    Run scripts on several instances concurrently.
+
+    >>> async def main(ports):
+    ...     sessions = [AsyncMechanical(port=port) for port in ports]
+    ...     await asyncio.gather(*(session.wait_until_ready() for session in sessions))
+    ...     return await asyncio.gather(
+    ...         *(session.run_python_script("2+3") for session in sessions)
+    ...     )
+    """
+
+    def __init__(self, ip=None, port=None, channel=None, loglevel="WARNING"):
+        """Initialize the client. No call is made to the server."""
+        if channel is not None:
+            if ip is not None or port is not None:
+                raise ValueError(
+                    "If `channel` is specified, neither `port` nor `ip` can be specified."
+                )
+        else:
+            ip = "127.0.0.1" if ip is None else socket.gethostbyname(ip)
+            check_valid_ip(ip)
+            port = MECHANICAL_DEFAULT_PORT if port is None else port
+            channel = grpc.aio.insecure_channel(
+                f"{ip}:{port}",
+                options=[
+                    ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+                ],
+            )
+
+        self._ip = ip
+        self._port = port
+        self._channel = channel
+        self._stub = mechanical_pb2_grpc.MechanicalServiceStub(channel)
+        self._exited = False
+        self._log = LOG.add_instance_logger(self.name, self, level=loglevel)
+
+    def __repr__(self):
+        """Get the representation of the client."""
+        return f"AsyncMechanical({self.name})"
+
+    async def __aenter__(self):
+        """Wait until the server is ready."""
+        await self.wait_until_ready()
+        return self
+
+    async def __aexit__(self, *args):
+        """Close the channel. Mechanical is not exited."""
+        await self.close()
+
+    @property
+    def name(self):
+        """Name (unique identifier) of the Mechanical instance."""
+        if self._ip is not None:
+            return f"GRPC_{self._ip}:{self._port}"
+        return f"GRPC_instance_{id(self)}"
+
+    async def wait_until_ready(self, timeout=60.0):
+        """Wait until the channel is connected and the server can run scripts.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum allowable time in seconds for the server to get ready. The
+            default is ``60.0``.
+
+        Raises
+        ------
+        asyncio.TimeoutError
+            If the server is not ready within ``timeout`` seconds.
+        """
+
+        async def wait():
+            await self._channel.channel_ready()
+            while True:
+                try:
+                    await self.run_python_script("ExtAPI.DataModel.Project.ProductVersion")
+                    return
+                except grpc.RpcError:
+                    await asyncio.sleep(0.5)
+
+        await asyncio.wait_for(wait(), timeout)
+
+    async def close(self):
+        """Close the channel. Mechanical is not exited."""
+        await self._channel.close()
+
+    async def run_python_script(
+        self, script_block, enable_logging=False, log_level="WARNING", progress_interval=2000
+    ):
+        """Run a Python script block inside Mechanical.
+
+        It returns the string value of the last executed statement. If the value cannot be
+        returned as a string, it returns an empty string.
+
+        Parameters
+        ----------
+        script_block : str
+            Script block (one or more lines) to run.
+        enable_logging: bool, optional
+            Whether to enable logging. The default is ``False``.
+        log_level: str
+            Level of logging. The default is ``"WARNING"``. Options are ``"DEBUG"``,
+            ``"INFO"``, ``"WARNING"``, and ``"ERROR"``.
+        progress_interval: int, optional
+            Frequency in milliseconds for getting log messages from the server.
+            The default is ``2000``.
+
+        Returns
+        -------
+        str
+            Script result.
+        """
+        request = run_script_request(script_block, enable_logging, log_level, progress_interval)
+        try:
+            async for response in self._stub.RunPythonScript(request):
+                if response.log_info == "__done__":
+                    return response.script_result
+                if enable_logging:
+                    getattr(self._log, log_level.lower())(response.log_info)
+        except grpc.RpcError as error:
+            # For the given script, return value cannot be converted to string.
+            if not is_result_conversion_error(error):
+                raise
+        return ""
+
+    async def project_directory(self):
+        """Get the project directory of the Mechanical instance."""
+        return await self.run_python_script("ExtAPI.DataModel.Project.ProjectDirectory")
+
+    async def list_files(self):
+        """List the files in the working directory of Mechanical.
+
+        Returns
+        -------
+        list
+            List of files in the working directory of Mechanical.
+        """
+        result = await self.run_python_script(
+            "import pymechanical_helpers\npymechanical_helpers.GetAllProjectFiles(ExtAPI)"
+        )
+        return result.splitlines()
+
+    async def upload(
+        self, file_name, file_location_destination=None, chunk_size=DEFAULT_FILE_CHUNK_SIZE
+    ):
+        """Upload a file to the Mechanical instance.
+
+        Parameters
+        ----------
+        file_name : str
+            Local file to upload.
+        file_location_destination : str, optional
+            File location on the Mechanical server to upload the file to. The default is
+            ``None``, in which case the project directory is used.
+        chunk_size : int, optional
+            Chunk size in bytes. The default is ``1048576``.
+
+        Returns
+        -------
+        str
+            Base name of the uploaded file.
+        """
+        if not os.path.isfile(file_name):
+            raise FileNotFoundError(f"Unable to locate filename {file_name}.")
+
+        if file_location_destination is None:
+            file_location_destination = await self.project_directory()
+
+        base_name = os.path.basename(file_name)
+        loop = asyncio.get_running_loop()
+
+        async def requests():
+            with open(file_name, "rb") as f:
+                while True:
+                    piece = await loop.run_in_executor(None, f.read, chunk_size)
+                    if not piece:
+                        return
+                    yield mechanical_pb2.FileUploadRequest(
+                        file_name=base_name,
+                        file_location=file_location_destination,
+                        chunk=mechanical_pb2.Chunk(payload=piece, size=len(piece)),
+                    )
+
+        response = await self._stub.UploadFile(requests())
+        if not response.is_ok:  # pragma: no cover
+            raise IOError("File failed to upload.")
+        return base_name
+
+    async def download(
+        self, files, target_dir=None, chunk_size=DEFAULT_CHUNK_SIZE, max_concurrency=4
+    ):
+        """Download files from the working directory of the Mechanical instance.
+
+        Parameters
+        ----------
+        files : str, list[str], tuple(str)
+            One or more files on the Mechanical server to download. You can specify
+            *glob expressions* to match the files listed by :meth:`list_files`.
+        target_dir : str, optional
+            Directory to copy the downloaded files to. The default is ``None``, in
+            which case the current working directory is used.
+        chunk_size : int, optional
+            Chunk size in bytes. The default is ``262144``. The value must be less than 4 MB.
+        max_concurrency : int, optional
+            Maximum number of files to download concurrently. The default is ``4``.
+
+        Returns
+        -------
+        List[str]
+            List of local file paths.
+        """
+        if chunk_size > 4 * 1024 * 1024:  # 4MB
+            raise ValueError(
+                "Chunk sizes bigger than 4 MB can generate unstable behaviour in PyMechanical. "
+                "Decrease the ``chunk_size`` value."
+            )
+
+        if isinstance(files, str):
+            files = [files]
+        if any("*" in file for file in files):
+            server_files = await self.list_files()
+            matched = []
+            for file in files:
+                if "*" in file:
+                    matched.extend(fnmatch.filter(server_files, file))
+                else:
+                    matched.append(file)
+            files = matched
+
+        target_dir = target_dir or os.getcwd()
+        pathlib.Path(target_dir).mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def download_one(file):
+            # the server could be on Windows or Linux
+            out_file_name = os.path.join(target_dir, file.replace("\\", "/").split("/")[-1])
+            async with semaphore:
+                await self._download(file, out_file_name, chunk_size)
+            return out_file_name
+
+        return list(await asyncio.gather(*(download_one(file) for file in files)))
+
+    async def _download(self, target_name, out_file_name, chunk_size):
+        """Download a file from the Mechanical instance."""
+        loop = asyncio.get_running_loop()
+        request = mechanical_pb2.FileDownloadRequest(file_path=target_name, chunk_size=chunk_size)
+        sink = FileSink(out_file_name)
+        try:
+            async for response in self._stub.DownloadFile(request):
+                await loop.run_in_executor(
+                    None, sink.write, response.chunk.payload, response.file_size
+                )
+        finally:
+            sink.close()
+
+        if not sink.size:
+            raise FileNotFoundError(f'File "{out_file_name}" is empty or does not exist')
+        self._log.info(f"{out_file_name} with size {sink.size} has been written.")
+
+    async def exit(self, force=False):
+        """Exit Mechanical and close the channel.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Whether to force Mechanical to exit. The default is ``False``, in which case
+            only Mechanical in UI mode asks for confirmation.
+        """
+        if self._exited:
+            return
+
+        try:
+            await self._stub.Shutdown(mechanical_pb2.ShutdownRequest(force_exit=force))
+        except grpc.RpcError as error:
+            self._log.warning(f"Mechanical exit failed: {str(error)}.")
+        self._exited = True
+        await self.close()
@@ -0,0 +1,179 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Process-wide registry of the gRPC channels to Mechanical servers."""
+
+import os
+import threading
+
+from ansys.mechanical.core import LOG
+
+DEFAULT_IDLE_TIMEOUT = 60
+"""Default time in seconds that an unused channel stays open."""
+
+DEFAULT_CLOSE_DELAY = 1.0
+"""Default delay in seconds before a released channel is closed.
+
+The connectivity polling thread of gRPC keeps checking a channel for up to
+0.2 seconds after its last subscriber, such as a channel ready future, is
+done, and it fails if the channel is closed in that time.
+"""
+
+
+class _Entry:
+    """Channel of the registry with its reference count."""
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.refcount = 0
+        self.timer = None
+
+
+class ChannelRegistry:
+    """Share gRPC channels between the clients that connect to the same server.
+
+    Channels are reference counted. When the last client releases a channel,
+    the channel stays open for ``idle_timeout`` seconds, so a client that
+    reconnects to the same server in that time reuses the connection instead
+    of setting up a new one. The registry is thread-safe, and it starts empty
+    in processes forked from a process that uses it.
+
+    Parameters
+    ----------
+    idle_timeout : float, optional
+        Time in seconds that an unused channel stays open. The default is ``60``.
+        If ``0``, unused channels are closed immediately.
+    close_delay : float, optional
+        Delay in seconds before a channel released with ``close=True``, or with an
+        idle timeout of ``0``, is closed. The default is ``1.0``. The channel is
+        removed from the registry right away.
+    """
+
+    def __init__(self, idle_timeout=DEFAULT_IDLE_TIMEOUT, close_delay=DEFAULT_CLOSE_DELAY):
+        """Initialize the registry."""
+        self.idle_timeout = idle_timeout
+        self.close_delay = close_delay
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._pid = os.getpid()
+
+    def _check_fork(self):
+        """Forget the channels of the parent process in a forked process."""
+        if self._pid != os.getpid():
+            self._entries = {}
+            self._pid = os.getpid()
+
+    def acquire(self, key, create_channel):
+        """Get the channel for a key, creating it if needed.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the channel, such as its target and options.
+        create_channel : callable
+            Function without arguments that creates the channel if the
+            registry does not have one for the key.
+
+        Returns
+        -------
+        grpc.Channel
+            Channel for the key.
+        """
+        with self._lock:
+            self._check_fork()
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(create_channel())
+                LOG.debug(f"Opened a shared channel for {key}.")
+            elif entry.timer is not None:
+                entry.timer.cancel()
+                entry.timer = None
+            entry.refcount += 1
+            return entry.channel
+
+    def release(self, key, close=False):
+        """Release a channel acquired with the :meth:`acquire` method.
+
+        Parameters
+        ----------
+        key : hashable
+            Key of the channel.
+        close : bool, optional
+            Whether to close the channel instead of keeping it open while it is
+            idle if no other client uses it, for example because the server was
+            shut down. The default is ``False``.
+        """
+        with self._lock:
+            self._check_fork()
+            entry = self._entries.get(key)
+            if entry is None or entry.refcount == 0:
+                return
+            entry.refcount -= 1
+            if entry.refcount:
+                return
+            if not close and self.idle_timeout:
+                entry.timer = threading.Timer(self.idle_timeout, self._evict, (key, entry))
+                entry.timer.daemon = True
+                entry.timer.start()
+                return
+            del self._entries[key]
+        if self.close_delay:
+            timer = threading.Timer(self.close_delay, self._close, (key, entry))
+            timer.daemon = True
+            timer.start()
+        else:
+            self._close(key, entry)
+
+    def _evict(self, key, entry):
+        """Close a channel that has been idle for the idle timeout."""
+        with self._lock:
+            if self._entries.get(key) is not entry or entry.refcount:
+                return
+            del self._entries[key]
+        self._close(key, entry)
+
+    def _close(self, key, entry):
+        entry.channel.close()
+        LOG.debug(f"Closed the shared channel for {key}.")
+
+    def refcount(self, key):
+        """Get the number of clients that use the channel for a key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return 0 if entry is None else entry.refcount
+
+    def clear(self):
+        """Close all channels, including the ones that are in use."""
+        with self._lock:
+            entries, self._entries = self._entries, {}
+        for key, entry in entries.items():
+            if entry.timer is not None:
+                entry.timer.cancel()
+            self._close(key, entry)
+
+    def __len__(self):
+        """Get the number of open channels, including idle ones."""
+        return len(self._entries)
+
+
+CHANNEL_REGISTRY = ChannelRegistry()
+"""Registry of the channels shared by the Mechanical clients of this process."""
@@ -22,11 +22,12 @@
 
 """Connect to Mechanical gRPC server and issues commands."""
 import atexit
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
-import datetime
 import fnmatch
 from functools import wraps
 import glob
+import hashlib
 import os
 import pathlib
 import socket
@@ -46,6 +47,7 @@ import grpc
 
 import ansys.mechanical.core as pymechanical
 from ansys.mechanical.core import LOG
+from ansys.mechanical.core.channels import CHANNEL_REGISTRY
 from ansys.mechanical.core.errors import (
     MechanicalExitedError,
     MechanicalRuntimeError,
@@ -59,6 +61,55 @@ from ansys.mechanical.core.misc import (
     check_valid_start_instance,
     threaded,
 )
+from ansys.mechanical.core.ports import find_mechanical_servers, scan_ports
+from ansys.mechanical.core.scripting import (
+    DEFAULT_PIPELINE_DEPTH,
+    RUN_PYTHON_SCRIPT_METHOD,
+    STREAM_RESULT_SCRIPT,
+    UNREGISTERED_SCRIPT,
+    ScriptPipeline,
+    batch_script,
+    check_pipeline_depth,
+    decode_typed_result,
+    parse_batch_results,
+    registered_script_call,
+    registration_script,
+    split_last_expression,
+    typed_result_script,
+)
+from ansys.mechanical.core.transfer import (
+    COMPRESS_FILE_SCRIPT,
+    COMPRESSION_ALGORITHMS,
+    COMPRESSION_SAMPLE_SIZE,
+    COMPRESSION_WBITS,
+    COPY_TAIL_SCRIPT,
+    DEFAULT_MESSAGE_LENGTH,
+    DIGEST_BLOCK_SIZE,
+    FILE_DIGESTS_SCRIPT,
+    MAX_AUTO_CHUNK_SIZE,
+    MERGE_PARTS_SCRIPT,
+    MESSAGE_OVERHEAD,
+    REMOVE_FILES_SCRIPT,
+    RENAME_FILE_SCRIPT,
+    AdaptiveChunkSizer,
+    BufferSink,
+    FileSink,
+    FileTransfer,
+    MmapSink,
+    TransferStats,
+    check_compression,
+    compressed_file_name,
+    decompress_responses,
+    file_digest,
+    is_compressible,
+    merged_file_name,
+    parse_file_digests,
+    part_file_name,
+    partial_file_name,
+    split_byte_ranges,
+    tail_file_name,
+    transfer_token,
+)
 
 # Check if PyPIM is installed
 try:
@@ -90,6 +141,16 @@ DEFAULT_CHUNK_SIZE = 256 * 1024  # 256 kB
 DEFAULT_FILE_CHUNK_SIZE = 1024 * 1024  # 1MB
 """Default file chunk size."""
 
+# Delays between readiness checks while Mechanical is starting
+READY_RETRY_DELAY = 0.01
+"""Delay in seconds before the first retry of the readiness check."""
+MAX_READY_RETRY_DELAY = 0.5
+"""Maximum delay in seconds between retries of the readiness check."""
+RECONNECT_BACKOFF_MS = 100
+"""Delay in milliseconds before the channel first tries to reconnect."""
+MAX_RECONNECT_BACKOFF_MS = 2000
+"""Maximum delay in milliseconds between reconnection attempts of the channel."""
+
 
 def setup_logger(loglevel="INFO", log_file=True, mechanical_instance=None):
     """Initialize the logger for the given mechanical instance."""
@@ -169,11 +230,13 @@ def port_in_use(port, host=LOCALHOST):
 
 
 def check_ports(port_range, ip="localhost"):
-    """Check the state of ports in a port range."""
-    ports = {}
-    for port in port_range:
-        ports[port] = port_in_use(port, ip)
-    return ports
+    """Check the state of ports in a port range.
+
+    The ports are probed concurrently. Ports that do not answer within the
+    timeout of :func:`scan_ports <ansys.mechanical.core.ports.scan_ports>`
+    are reported as not in use.
+    """
+    return {port: bool(state) for port, state in scan_ports(port_range, ip).items()}
 
 
 def close_all_local_instances(port_range=None, use_thread=True):
@@ -216,13 +279,13 @@ def close_all_local_instances(port_range=None, use_thread=True):
         except OSError:  # pragma: no cover
             pass
 
-    ports = check_ports(port_range)
-    for port_temp, state in ports.items():
-        if state:
-            if use_thread:
-                close_mechanical_threaded(port_temp)
-            else:
-                close_mechanical(port_temp)
+    # only connect to the ports with a gRPC server, so that other
+    # services on the port range do not stall the cleanup
+    for port_temp in find_mechanical_servers(port_range):
+        if use_thread:
+            close_mechanical_threaded(port_temp)
+        else:
+            close_mechanical(port_temp)
 
 
 def create_ip_file(ip, path):
@@ -288,12 +351,99 @@ client_to_server_loglevel = {
 }
 
 
+def run_script_request(script_code, enable_logging, log_level, progress_interval):
+    """Build the request for running a Python script block on the server.
+
+    Parameters
+    ----------
+    script_code : str
+        Script block (one or more lines) to run.
+    enable_logging : bool
+        Whether to enable logging.
+    log_level : str
+        Level of logging. Options are ``"DEBUG"``, ``"INFO"``, ``"WARNING"``,
+        and ``"ERROR"``.
+    progress_interval : int
+        Frequency in milliseconds for getting log messages from the server.
+
+    Returns
+    -------
+    mechanical_pb2.RunScriptRequest
+        Request for the ``RunPythonScript`` call.
+    """
+    request = mechanical_pb2.RunScriptRequest()
+    request.script_code = script_code
+    request.enable_logging = enable_logging
+    request.logger_severity = Mechanical.convert_to_server_log_level(log_level)
+    request.progress_interval = progress_interval
+    return request
+
+
+def is_result_conversion_error(error):
+    """Check whether a ``RunPythonScript`` error means that the result is not a string.
+
+    Parameters
+    ----------
+    error : grpc.RpcError
+        Error raised by the ``RunPythonScript`` call.
+    """
+    error_info = error.details() or ""
+    return (
+        "the expected result" in error_info.lower()
+        and "cannot be return via this API." in error_info
+    )
+
+
+class StartupTimings:
+    """Breakdown of the time it took Mechanical to start.
+
+    Parameters
+    ----------
+    launch : float or None
+        Time in seconds to launch the Mechanical process, or ``None`` if
+        PyMechanical connected to a running instance.
+    channel_ready : float
+        Time in seconds from the start of the connection until the gRPC channel
+        was ready.
+    app_ready : float
+        Time in seconds from the channel being ready until Mechanical could run
+        scripts.
+    queued : float, optional
+        Time in seconds that the launch waited for its turn, such as in a pool
+        that limits the number of instances launching at a time. The default is
+        ``None``.
+    """
+
+    def __init__(self, launch, channel_ready, app_ready, queued=None):
+        """Initialize the startup timings."""
+        self.launch = launch
+        self.channel_ready = channel_ready
+        self.app_ready = app_ready
+        self.queued = queued
+
+    @property
+    def total(self):
+        """Total startup time in seconds."""
+        return (self.queued or 0.0) + (self.launch or 0.0) + self.channel_ready + self.app_ready
+
+    def __repr__(self):
+        """Get the string representation of the startup timings."""
+        launch = "None" if self.launch is None else f"{self.launch:.3f}"
+        queued = "" if self.queued is None else f"queued={self.queued:.3f}, "
+        return (
+            f"StartupTimings({queued}launch={launch}, channel_ready={self.channel_ready:.3f}, "
+            f"app_ready={self.app_ready:.3f})"
+        )
+
+
 class Mechanical(object):
     """Connects to a gRPC Mechanical server and allows commands to be passed."""
 
     # Required by `_name` method to be defined before __init__ be
     _ip = None
     _port = None
+    _channel_key = None
+    _channel_finalizer = None
 
     def __init__(
         self,
@@ -307,6 +457,8 @@ class Mechanical(object):
         channel=None,
         remote_instance=None,
         keep_connection_alive=True,
+        compression=None,
+        share_channel=True,
         **kwargs,
     ):
         """Initialize the member variable based on the arguments.
@@ -356,6 +508,19 @@ class Mechanical(object):
         keep_connection_alive : bool, optional
             Whether to keep the gRPC connection alive by running a background thread
             and making dummy calls for remote connections. The default is ``True``.
+        compression : str, optional
+            Compression algorithm for the messages sent to the server and for file
+            transfers. Options are ``"gzip"``, ``"deflate"``, and ``"none"``. The
+            default is ``None``, in which case nothing is compressed. Files that are
+            already compressed are sent as they are. This parameter is ignored
+            for the messages of a channel given by the ``channel`` parameter.
+        share_channel : bool, optional
+            Whether to share the gRPC channel with the other ``Mechanical`` objects of
+            the process that connect to the same server. The default is ``True``. Shared
+            channels stay open for a minute after the last object that uses them is
+            exited or garbage collected, so reconnecting to the same server reuses the
+            existing connection. This parameter is ignored if a channel is given by
+            the ``channel`` parameter.
 
         Examples
         --------
@@ -421,6 +586,12 @@ class Mechanical(object):
         self._exited = None
 
         self._version = None
+        self._transfer_stats = None
+        self._script_pipeline = None
+        self._script_pipeline_depth = DEFAULT_PIPELINE_DEPTH
+        self._script_pipeline_lock = threading.Lock()
+        self._registered_scripts = {}
+        self._startup_timings = None
 
         if port is None:
             port = MECHANICAL_DEFAULT_PORT
@@ -428,12 +599,28 @@ class Mechanical(object):
 
         self._stub = None
         self._timeout = timeout
+        self._compression = check_compression(compression) if compression else "none"
+        self._share_channel = share_channel
+        self._channel_key = None
+        self._channel_finalizer = None
 
         if channel is None:
             self._channel = self._create_channel(ip_temp, port)
         else:
             self._channel = channel
 
+        # Chunk sizes for ``chunk_size="auto"``. The receive limit of a channel
+        # created by the caller, and of the server, is assumed to be the gRPC default.
+        max_message_length = MAX_MESSAGE_LENGTH if channel is None else DEFAULT_MESSAGE_LENGTH
+        self._download_chunk_sizer = AdaptiveChunkSizer(
+            DEFAULT_CHUNK_SIZE,
+            maximum=min(max_message_length, MAX_AUTO_CHUNK_SIZE + MESSAGE_OVERHEAD)
+            - MESSAGE_OVERHEAD,
+        )
+        self._upload_chunk_sizer = AdaptiveChunkSizer(
+            DEFAULT_FILE_CHUNK_SIZE, maximum=DEFAULT_MESSAGE_LENGTH - MESSAGE_OVERHEAD
+        )
+
         self._logLevel = loglevel
         self._log_file = log_file
         self._log_mechanical = log_mechanical
@@ -545,6 +732,43 @@ class Mechanical(object):
         """Instance is in use within a pool."""
         self._locked = new_value
 
+    @property
+    def transfer_stats(self):
+        """Statistics for the last upload or batch of downloaded files.
+
+        Returns
+        -------
+        ansys.mechanical.core.transfer.TransferStats
+            Aggregate throughput, per-file timings, and chunk sizes. ``None`` is
+            returned if no files have been transferred yet.
+        """
+        return self._transfer_stats
+
+    @property
+    def script_pipeline_depth(self):
+        """Maximum number of scripts queued with ``submit_script()`` that are in flight.
+
+        The default is ``1``, in which case each script is sent when the previous one
+        finishes. With a greater depth, the next scripts are already on the server
+        when a script finishes, which hides the network latency. Scripts are always
+        sent in submission order, but a greater depth is safe only if the server runs
+        the scripts in the order that they arrive.
+
+        Examples
+        --------
+        Keep up to four scripts in flight.
+
+        >>> mechanical.script_pipeline_depth = 4
+        """
+        return self._script_pipeline_depth
+
+    @script_pipeline_depth.setter
+    def script_pipeline_depth(self, depth):
+        self._script_pipeline_depth = check_pipeline_depth(depth)
+        with self._script_pipeline_lock:
+            if self._script_pipeline is not None:
+                self._script_pipeline.depth = depth
+
     def _multi_connect(self, n_attempts=5, timeout=60):
         """Try to connect over a series of attempts to the channel.
 
@@ -563,11 +787,12 @@ class Mechanical(object):
             f"timetout:{timeout} n_attempts:{n_attempts} attempt_timeout={attempt_timeout}"
         )
 
+        time_start = time.perf_counter()
         max_time = time.time() + timeout
         i = 1
         while time.time() < max_time and i <= n_attempts:
             self.log_debug(f"Connection attempt {i} with attempt timeout {attempt_timeout}s")
-            connected = self._connect(timeout=attempt_timeout)
+            connected = self._connect(timeout=attempt_timeout, time_start=time_start)
 
             if connected:
                 self.log_debug(f"Connection attempt {i} succeeded.")
@@ -593,7 +818,7 @@ class Mechanical(object):
                 return self._channel._channel.target().decode()
         return ""  # pragma: no cover
 
-    def _connect(self, timeout=12, enable_health_check=False):
+    def _connect(self, timeout=12, enable_health_check=False, time_start=None, launch=None):
         """Connect a gRPC channel to a remote or local Mechanical instance.
 
         Parameters
@@ -604,21 +829,36 @@ class Mechanical(object):
         enable_health_check : bool, optional
             Whether to enable a check to see if the connection is healthy.
             The default is ``False``.
+        time_start : float, optional
+            Value of ``time.perf_counter()`` when the connection started, which the
+            startup timings are measured from. The default is ``None``, in which case
+            the time of this call is used.
+        launch : float, optional
+            Time in seconds that it took to launch the Mechanical process, which is
+            recorded in the startup timings. The default is ``None``.
         """
+        if time_start is None:
+            time_start = time.perf_counter()
         self._state = grpc.channel_ready_future(self._channel)
         self._stub = mechanical_pb2_grpc.MechanicalServiceStub(self._channel)
 
-        # verify connection
-        time_start = time.time()
-        while ((time.time() - time_start) < timeout) and not self._state._matured:
-            time.sleep(0.01)
-
-        if not self._state._matured:  # pragma: no cover
+        # verify connection, the future is resolved by the channel connectivity callbacks
+        try:
+            self._state.result(timeout=timeout)
+        except grpc.FutureTimeoutError:  # pragma: no cover
+            self._state.cancel()
             return False
 
+        time_channel_ready = time.perf_counter()
         self.log_debug("Established a connection to the Mechanical gRPC server.")
 
         self.wait_till_mechanical_is_ready(timeout)
+        self._startup_timings = StartupTimings(
+            launch=launch,
+            channel_ready=time_channel_ready - time_start,
+            app_ready=time.perf_counter() - time_channel_ready,
+        )
+        self.log_debug(f"Startup timings: {self._startup_timings}")
 
         # keeps Mechanical session alive
         self._timer = None
@@ -706,19 +946,57 @@ class Mechanical(object):
             #     continue
 
     def _create_channel(self, ip, port):
-        """Create an unsecured gRPC channel."""
+        """Create an unsecured gRPC channel, or get the shared channel to the server."""
         check_valid_ip(ip)
 
-        # open the channel
         channel_str = f"{ip}:{port}"
+        if not self._share_channel:
+            return self._open_channel(channel_str)
+
+        self._channel_key = (channel_str, self._compression)
+        channel = CHANNEL_REGISTRY.acquire(
+            self._channel_key, lambda: self._open_channel(channel_str)
+        )
+        # release the channel when this object is garbage collected
+        self._channel_finalizer = weakref.finalize(
+            self, CHANNEL_REGISTRY.release, self._channel_key
+        )
+        return channel
+
+    def _release_channel(self, close=False):
+        """Release the shared channel of this object, if any.
+
+        Parameters
+        ----------
+        close : bool, optional
+            Whether to close the channel right away if no other object uses it.
+            The default is ``False``.
+        """
+        if self._channel_finalizer is not None and self._channel_finalizer.detach():
+            CHANNEL_REGISTRY.release(self._channel_key, close=close)
+        self._channel_finalizer = None
+
+    def _open_channel(self, channel_str):
+        """Open an unsecured gRPC channel."""
         LOG.debug(f"Opening insecure channel at {channel_str}.")
         return grpc.insecure_channel(
             channel_str,
             options=[
                 ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+                # retry quickly while the server is starting instead of after 1s, 1.6s, ...
+                ("grpc.initial_reconnect_backoff_ms", RECONNECT_BACKOFF_MS),
+                ("grpc.min_reconnect_backoff_ms", RECONNECT_BACKOFF_MS),
+                ("grpc.max_reconnect_backoff_ms", MAX_RECONNECT_BACKOFF_MS),
             ],
+            compression=COMPRESSION_ALGORITHMS[self._compression],
         )
 
+    def _resolve_compression(self, compression):
+        """Get the compression algorithm of a call, defaulting to the one of the session."""
+        if compression is None:
+            return self._compression
+        return check_compression(compression)
+
     @property
     def is_alive(self) -> bool:
         """Whether there is an active connection to the Mechanical gRPC server."""
@@ -824,6 +1102,7 @@ class Mechanical(object):
         batch = self._start_parm.get("batch", True)
         additional_switches = self._start_parm.get("additional_switches", None)
         additional_envs = self._start_parm.get("additional_envs", None)
+        time_start = time.perf_counter()
         port = launch_grpc(
             exec_file=exec_file,
             batch=batch,
@@ -831,74 +1110,115 @@ class Mechanical(object):
             additional_envs=additional_envs,
             verbose=True,
         )
+        launch_time = time.perf_counter() - time_start
         # update the new cleanup behavior
         self._cleanup_on_exit = cleanup_on_exit
         self._port = port
+        self._release_channel()
         self._channel = self._create_channel(self._ip, port)
-        self._connect(port)
+        # the timings of the previous connection do not apply to this launch
+        self._startup_timings = None
+        self._connect(port, launch=launch_time)
 
         self.log_info("Mechanical is ready to accept gRPC calls.")
 
     def wait_till_mechanical_is_ready(self, wait_time=-1):
         """Wait until Mechanical is ready.
 
+        A readiness script is sent with the ``wait_for_ready`` option, so the call is
+        queued until the channel is ready and returns as soon as Mechanical can run
+        scripts. If Mechanical rejects the script because it is still starting, the
+        script is sent again after a delay that doubles on each attempt.
+
         Parameters
         ----------
         wait_time : float, optional
             Maximum allowable time in seconds for connecting to the Mechanical gRPC server.
         """
-        time_1 = datetime.datetime.now()
-
-        sleep_time = 0.5
+        time_1 = time.perf_counter()
+        max_time = None
         if wait_time == -1:  # pragma: no cover
             self.log_info("Waiting for Mechanical to be ready...")
         else:
             self.log_info(f"Waiting for Mechanical to be ready. Maximum wait time: {wait_time}s")
+            if self._timeout != -1:
+                max_time = time_1 + wait_time
 
-        while not self.__isMechanicalReady():
-            time_2 = datetime.datetime.now()
-            time_interval = time_2 - time_1
-            time_interval_seconds = int(time_interval.total_seconds())
+        retry_delay = READY_RETRY_DELAY
+        while not self.__isMechanicalReady(
+            None if max_time is None else max(max_time - time.perf_counter(), 0)
+        ):
+            time_interval_seconds = int(time.perf_counter() - time_1)
 
             self.log_debug(
                 f"Mechanical is not ready. You've been waiting for {time_interval_seconds}."
             )
-            if self._timeout != -1:
-                if time_interval_seconds > wait_time:
-                    self.log_debug(
-                        f"Allowed wait time {wait_time}s. "
-                        f"Waited so for {time_interval_seconds}s, "
-                        f"before throwing the error."
-                    )
-                    raise RuntimeError(
-                        f"Couldn't connect to Mechanical. " f"Waited for {time_interval_seconds}s."
-                    )
+            if max_time is not None and time.perf_counter() + retry_delay > max_time:
+                self.log_debug(
+                    f"Allowed wait time {wait_time}s. "
+                    f"Waited so for {time_interval_seconds}s, "
+                    f"before throwing the error."
+                )
+                raise RuntimeError(
+                    f"Couldn't connect to Mechanical. " f"Waited for {time_interval_seconds}s."
+                )
 
-            time.sleep(sleep_time)
+            time.sleep(retry_delay)
+            retry_delay = min(retry_delay * 2, MAX_READY_RETRY_DELAY)
 
-        time_2 = datetime.datetime.now()
-        time_interval = time_2 - time_1
-        time_interval_seconds = int(time_interval.total_seconds())
+        time_interval_seconds = time.perf_counter() - time_1
 
-        self.log_info(f"Mechanical is ready. It took {time_interval_seconds} seconds to verify.")
+        self.log_info(
+            f"Mechanical is ready. It took {time_interval_seconds:.2f} seconds to verify."
+        )
 
-    def __isMechanicalReady(self):
+    def __isMechanicalReady(self, timeout=None):
         """Whether the Mechanical gRPC server is ready.
 
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait for the channel to be ready and for the
+            readiness script to finish. The default is ``None``, in which case
+            there is no limit.
+
         Returns
         -------
         bool
             ``True`` if Mechanical is ready, ``False`` otherwise.
         """
+        script = "ExtAPI.DataModel.Project.ProductVersion"
         try:
-            script = "ExtAPI.DataModel.Project.ProductVersion"
-            self.run_python_script(script)
+            responses = self._stub.RunPythonScript(
+                run_script_request(script, False, "WARNING", 2000),
+                timeout=timeout,
+                wait_for_ready=True,
+            )
+            self._read_script_result(responses, (script, False, "WARNING"))
         except grpc.RpcError as error:
             self.log_debug(f"Mechanical is not ready. Error:{error}.")
             return False
 
         return True
 
+    @property
+    def startup_timings(self):
+        """Breakdown of the time it took to launch and connect to Mechanical.
+
+        Returns
+        -------
+        StartupTimings
+            Times in seconds to launch the process, for the gRPC channel to be ready,
+            and for Mechanical to be able to run scripts.
+
+        Examples
+        --------
+        >>> mechanical = launch_mechanical()
+        >>> mechanical.startup_timings
+        StartupTimings(launch=0.012, channel_ready=21.342, app_ready=3.174)
+        """
+        return self._startup_timings
+
     @staticmethod
     def convert_to_server_log_level(log_level):
         """Convert the log level to the server log level.
@@ -1062,150 +1382,616 @@ class Mechanical(object):
         self.log_debug(f"run_python_script_from_file started")
         return self.run_python_script(script_code, enable_logging, log_level, progress_interval)
 
-    def exit(self, force=False):
-        """Exit Mechanical.
+    def run_python_scripts(
+        self,
+        script_blocks,
+        enable_logging=False,
+        log_level="WARNING",
+        progress_interval=2000,
+        stop_on_error=True,
+    ):
+        """Run several Python script blocks inside Mechanical in a single call.
+
+        The blocks run in order in the same scope as the scripts that the
+        ``run_python_script()`` method runs. The result of a block is the string value of
+        its last expression, or an empty string if the block does not end with an
+        expression.
 
         Parameters
         ----------
-        force : bool, optional
-            Whether to force Mechanical to exit. The default is ``False``, in which case
-            only Mechanical in UI mode asks for confirmation. This parameter overrides
-            any environment variables that may inhibit exiting Mechanical.
+        script_blocks : list[str]
+            Script blocks (one or more lines each) to run.
+        enable_logging: bool, optional
+            Whether to enable logging. The default is ``False``.
+        log_level: str
+            Level of logging. The default is ``"WARNING"``. Options are ``"DEBUG"``,
+            ``"INFO"``, ``"WARNING"``, and ``"ERROR"``.
+        progress_interval: int, optional
+            Frequency in milliseconds for getting log messages from the server.
+            The default is ``2000``.
+        stop_on_error : bool, optional
+            Whether to skip the blocks that follow a failed block. The default is ``True``.
+
+        Returns
+        -------
+        list
+            For each block, the result string, a
+            :class:`MechanicalRuntimeError <ansys.mechanical.core.errors.MechanicalRuntimeError>`
+            instance with the error message if the block failed, or ``None`` if the
+            block was skipped.
+
+        Notes
+        -----
+        The last expression of each block is found by parsing the block on the client.
+        Blocks that the client cannot parse, for example because they use IronPython 2
+        syntax, still run, but their result is an empty string.
 
         Examples
         --------
-        Exit Mechanical.
-
-        >>> mechanical.Exit(force=True)
+        Set up a model in one call and check the results.
 
+        >>> results = mechanical.run_python_scripts(
+        ...     ["model = ExtAPI.DataModel.Project.Model", "model.Name", "1/0", "2+3"]
+        ... )
+        >>> results
+        ['', 'Model', MechanicalRuntimeError('ZeroDivisionError: ...'), None]
         """
-        if not force:
-            if not get_start_instance():
-                self.log_info("Ignoring exit due to PYMECHANICAL_START_INSTANCE=False")
-                return
+        self.verify_valid_connection()
+        if not script_blocks:
+            return []
+
+        result = self.__call_run_python_script(
+            batch_script(script_blocks, stop_on_error),
+            enable_logging,
+            log_level,
+            progress_interval,
+            logged_script="\n".join(script_blocks),
+        )
 
-            # or building the gallery
-            if pymechanical.BUILDING_GALLERY:
-                self._log.info("Ignoring exit due to BUILDING_GALLERY=True")
-                return
+        results = parse_batch_results(result)
+        if enable_logging:
+            for index, block_result in enumerate(results):
+                if isinstance(block_result, Exception):
+                    self.log_message(log_level, f"Script block {index} failed: {block_result}")
+        return results
 
-        if self._exited:
-            return
+    def run_python_script_stream(
+        self,
+        script_block: str,
+        enable_logging=False,
+        log_level="WARNING",
+        progress_interval=2000,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+    ):
+        """Run a Python script block inside Mechanical and stream its result in chunks.
 
-        self.verify_valid_connection()
+        The result is written to a temporary file on the server, which is then
+        downloaded in chunks, so large results do not have to fit in a single gRPC
+        message. If the value of the last expression is iterable, such as a list or a
+        generator, each item is written on its own line. Otherwise, the string value of
+        the last expression is written.
 
-        self._exiting = True
+        The script runs when the first chunk is requested.
 
-        self.log_debug("In shutdown.")
-        request = mechanical_pb2.ShutdownRequest(force_exit=force)
-        self.log_debug("Shutting down...")
+        Parameters
+        ----------
+        script_block : str
+            Script block (one or more lines) to run.
+        enable_logging: bool, optional
+            Whether to enable logging. The default is ``False``.
+        log_level: str
+            Level of logging. The default is ``"WARNING"``. Options are ``"DEBUG"``,
+            ``"INFO"``, ``"WARNING"``, and ``"ERROR"``.
+        progress_interval: int, optional
+            Frequency in milliseconds for getting log messages from the server.
+            The default is ``2000``.
+        chunk_size : int or str, optional
+            Chunk size in bytes. The default is ``262144``. The value must be less than 4 MB.
+            If ``"auto"``, the chunk size is chosen from the round-trip time and
+            throughput measured on earlier downloads.
 
-        self._busy = True
-        try:
-            self._stub.Shutdown(request)
-        except grpc._channel._InactiveRpcError as error:
-            self.log_warning("Mechanical exit failed: {str(error}.")
-        finally:
-            self._busy = False
+        Yields
+        ------
+        bytes
+            Chunks of the UTF-8 encoded result.
 
-        self._exited = True
-        self._stub = None
+        Examples
+        --------
+        Parse the node coordinates of the mesh into a NumPy array without building the
+        whole table as a string on either side.
 
-        if self._remote_instance is not None:  # pragma: no cover
-            self.log_debug("PyPIM delete has started.")
-            try:
-                self._remote_instance.delete()
-            except Exception as error:
-                self.log_warning("Remote instance delete failed: {str(error}.")
-            self.log_debug("PyPIM delete has finished.")
+        >>> from ansys.mechanical.core.scripting import load_csv
+        >>> script='''
+            mesh = ExtAPI.DataModel.MeshDataByName("Global")
+            ("%s,%s,%s" % (node.X, node.Y, node.Z) for node in mesh.Nodes)
+            '''
+        >>> nodes = load_csv(mechanical.run_python_script_stream(script))
+        """
+        self.verify_valid_connection()
 
-            self._remote_instance = None
-            self._channel = None
-        else:
-            self.log_debug("No PyPIM cleanup is needed.")
+        if chunk_size != "auto" and chunk_size > 4 * 1024 * 1024:  # 4MB
+            raise ValueError(
+                "Chunk sizes bigger than 4 MB can generate unstable behaviour in PyMechanical. "
+                "Decrease the ``chunk_size`` value."
+            )
 
-        local_ports = pymechanical.LOCAL_PORTS
-        if self._local and self._port in local_ports:
-            local_ports.remove(self._port)
+        result_path = self.__call_run_python_script(
+            STREAM_RESULT_SCRIPT % split_last_expression(script_block),
+            enable_logging,
+            log_level,
+            progress_interval,
+            logged_script=script_block,
+        )
 
-        self.log_info("Shutdown has finished.")
+        try:
+            sizer = None
+            if chunk_size == "auto":
+                sizer = self._download_chunk_sizer
+                chunk_size = sizer.chunk_size
+            responses, _ = self._request_download(result_path, chunk_size, sizer=sizer)
+            for response in responses:
+                yield response.chunk.payload
+        finally:
+            self._remove_server_files("", [result_path])
 
-    @protect_grpc
-    def upload(
+    def run_python_script_typed(
         self,
-        file_name,
-        file_location_destination=None,
-        chunk_size=DEFAULT_FILE_CHUNK_SIZE,
-        progress_bar=True,
+        script_block: str,
+        enable_logging=False,
+        log_level="WARNING",
+        progress_interval=2000,
+        as_array=True,
     ):
-        """Upload a file to the Mechanical instance.
+        """Run a Python script block inside Mechanical and return its result with its type.
+
+        Unlike the ``run_python_script()`` method, which returns the string value of the
+        last expression, this method returns numbers as ``int``, ``float``, or ``bool``
+        and sequences of numbers as NumPy arrays. Numbers are transferred in a compact
+        binary encoding, so they are not parsed on the client and keep their full
+        precision. Strings, ``None``, and values that can be encoded as JSON, such as
+        dictionaries and lists of strings, are returned as the corresponding Python
+        objects. Other values are returned as their string value.
 
         Parameters
         ----------
-        file_name : str
-            Local file to upload. Only the file name is needed if the file
-            is relative to the current working directory. Otherwise, the full path
-            is needed.
-        file_location_destination : str, optional
-            File location on the Mechanical server to upload the file to. The default is
-            ``None``, in which case the project directory is used.
-        chunk_size : int, optional
-            Chunk size in bytes. The default is ``1048576``.
-        progress_bar : bool, optional
-            Whether to show a progress bar using ``tqdm``. The default is ``True``.
-            A progress bar is helpful for viewing upload progress.
+        script_block : str
+            Script block (one or more lines) to run.
+        enable_logging: bool, optional
+            Whether to enable logging. The default is ``False``.
+        log_level: str
+            Level of logging. The default is ``"WARNING"``. Options are ``"DEBUG"``,
+            ``"INFO"``, ``"WARNING"``, and ``"ERROR"``.
+        progress_interval: int, optional
+            Frequency in milliseconds for getting log messages from the server.
+            The default is ``2000``.
+        as_array : bool, optional
+            Whether to return sequences of numbers as NumPy arrays. The default is
+            ``True``, which requires the ``numpy`` package. If ``False``, they are
+            returned as lists, or lists of lists for two-dimensional sequences.
 
         Returns
         -------
-        str
-            Base name of the uploaded file.
+        object
+            Script result.
 
         Examples
         --------
-        Upload the ``hsec.x_t`` file  with the progress bar not shown.
-
-        >>> mechanical.upload('hsec.x_t', progress_bar=False)
-        """
-        self.verify_valid_connection()
-
-        if not os.path.isfile(file_name):
-            raise FileNotFoundError(f"Unable to locate filename {file_name}.")
+        Return a number.
 
-        self._log.debug(f"Uploading file '{file_name}' to the Mechanical instance.")
+        >>> mechanical.run_python_script_typed('2.0/3')
+        0.6666666666666666
 
-        if file_location_destination is None:
-            file_location_destination = self.project_directory
+        Return the coordinates of the mesh nodes as a two-dimensional array.
 
-        self._busy = True
+        >>> script='''
+            mesh = ExtAPI.DataModel.MeshDataByName("Global")
+            [(node.X, node.Y, node.Z) for node in mesh.Nodes]
+            '''
+        >>> mechanical.run_python_script_typed(script).shape
+        (1260, 3)
+        """
+        self.verify_valid_connection()
         try:
-            chunks_generator = self.get_file_chunks(
-                file_location_destination,
-                file_name,
-                chunk_size=chunk_size,
-                progress_bar=progress_bar,
+            result = self.__call_run_python_script(
+                typed_result_script(script_block),
+                enable_logging,
+                log_level,
+                progress_interval,
+                logged_script=script_block,
+                ignore_conversion_error=False,
             )
-            response = self._stub.UploadFile(chunks_generator)
-            self.log_debug(f"upload_file response is {response.is_ok}.")
-        finally:
-            self._busy = False
+        except grpc.RpcError as error:
+            if not is_result_conversion_error(error):
+                raise
+            raise ValueError(
+                f"The result of the script could not be converted: {error.details()}"
+            ) from error
+        return decode_typed_result(result, as_array=as_array)
 
-        if not response.is_ok:  # pragma: no cover
-            raise IOError("File failed to upload.")
-        return os.path.basename(file_name)
+    def register_script(self, script_block: str):
+        r"""Register a Python script block inside Mechanical to run it by its handle.
 
-    def get_file_chunks(self, file_location, file_name, chunk_size, progress_bar):
-        """Construct the file upload request for the server.
+        The script block is compiled and kept on the server, so running it with the
+        ``run_registered_script()`` method only sends the handle and the arguments,
+        and the server does not parse the script block again. Registering the same
+        script block again returns the same handle.
 
         Parameters
         ----------
-        file_location_destination : str, optional
-            Directory where the file to upload to the server is located.
-        file_name : str
-            Name of the file to upload.
-        chunk_size : int
-            Chunk size in bytes.
-        progress_bar : bool
-            Whether to show a progress bar using ``tqdm``.
+        script_block : str
+            Script block (one or more lines) to register.
+
+        Returns
+        -------
+        str
+            Handle of the script block.
+
+        Examples
+        --------
+        Register a script block and run it with different arguments.
+
+        >>> handle = mechanical.register_script("import math\nmath.pow(base, 2)")
+        >>> mechanical.run_registered_script(handle, {"base": 3})
+        '9.0'
+        """
+        self.verify_valid_connection()
+        handle, script_code = registration_script(script_block)
+        self.__call_run_python_script(
+            script_code, False, "WARNING", 2000, logged_script=script_block
+        )
+        self._registered_scripts[handle] = script_block
+        return handle
+
+    def register_script_from_file(self, file_path):
+        """Register the contents of a Python file inside Mechanical to run it by its handle.
+
+        Parameters
+        ----------
+        file_path :
+            Path for the Python file.
+
+        Returns
+        -------
+        str
+            Handle of the script.
+        """
+        return self.register_script(Mechanical.__readfile(file_path))
+
+    def run_registered_script(
+        self,
+        handle,
+        arguments=None,
+        enable_logging=False,
+        log_level="WARNING",
+        progress_interval=2000,
+    ):
+        """Run a script block registered with the ``register_script()`` method.
+
+        It returns the string value of the last expression of the script block, like the
+        ``run_python_script()`` method. If the server no longer knows the handle, for
+        example because Mechanical was restarted, the script block is registered again.
+
+        Parameters
+        ----------
+        handle : str
+            Handle of the script block.
+        arguments : dict, optional
+            Global variables to set before running the script block. The values must be
+            serializable to JSON. The default is ``None``.
+        enable_logging: bool, optional
+            Whether to enable logging. The default is ``False``.
+        log_level: str
+            Level of logging. The default is ``"WARNING"``. Options are ``"DEBUG"``,
+            ``"INFO"``, ``"WARNING"``, and ``"ERROR"``.
+        progress_interval: int, optional
+            Frequency in milliseconds for getting log messages from the server.
+            The default is ``2000``.
+
+        Returns
+        -------
+        str
+            Script result.
+        """
+        self.verify_valid_connection()
+        if handle not in self._registered_scripts:
+            raise ValueError(f"No script is registered with the handle {handle!r}.")
+
+        script_block = self._registered_scripts[handle]
+        script_code = registered_script_call(handle, arguments)
+        result = self.__call_run_python_script(
+            script_code, enable_logging, log_level, progress_interval, logged_script=script_block
+        )
+        if result == UNREGISTERED_SCRIPT:
+            self.log_debug(f"Registering the script {handle} again.")
+            self.register_script(script_block)
+            result = self.__call_run_python_script(
+                script_code,
+                enable_logging,
+                log_level,
+                progress_interval,
+                logged_script=script_block,
+            )
+        return result
+
+    def submit_script(
+        self, script_block: str, enable_logging=False, log_level="WARNING", progress_interval=2000
+    ):
+        """Queue a Python script block to run inside Mechanical without waiting for it.
+
+        Scripts are sent in the order that they are submitted. The request for each
+        script is serialized by the calling thread, and the next script is sent as
+        soon as the previous one finishes, so the caller can prepare more scripts
+        while the server runs them. To also hide the network latency, increase the
+        :attr:`script_pipeline_depth` attribute.
+
+        Parameters
+        ----------
+        script_block : str
+            Script block (one or more lines) to run.
+        enable_logging: bool, optional
+            Whether to enable logging. The default is ``False``.
+        log_level: str
+            Level of logging. The default is ``"WARNING"``. Options are ``"DEBUG"``,
+            ``"INFO"``, ``"WARNING"``, and ``"ERROR"``.
+        progress_interval: int, optional
+            Frequency in milliseconds for getting log messages from the server.
+            The default is ``2000``.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the script result, which is the same string that the
+            ``run_python_script()`` method returns. Futures complete in submission order.
+
+        Notes
+        -----
+        Submitted scripts can run concurrently with calls made through the blocking
+        methods. Wait for the futures before making a call that depends on them.
+
+        Examples
+        --------
+        Update a parameter for many design points and wait for the last update.
+
+        >>> futures = [
+        ...     mechanical.submit_script(f"parameter.Value = {value}") for value in values
+        ... ]
+        >>> futures[-1].result()
+
+        Get the results in submission order.
+
+        >>> futures = [mechanical.submit_script(f"{i}*2") for i in range(3)]
+        >>> [future.result() for future in futures]
+        ['0', '2', '4']
+        """
+        self.verify_valid_connection()
+        request = run_script_request(script_block, enable_logging, log_level, progress_interval)
+        with self._script_pipeline_lock:
+            if self._script_pipeline is None:
+                run_python_script = self._channel.unary_stream(
+                    RUN_PYTHON_SCRIPT_METHOD,
+                    response_deserializer=mechanical_pb2.RunScriptResponse.FromString,
+                )
+                self._script_pipeline = ScriptPipeline(
+                    run_python_script, self._read_script_result, self._script_pipeline_depth
+                )
+        return self._script_pipeline.submit(
+            request.SerializeToString(), (script_block, enable_logging, log_level)
+        )
+
+    def exit(self, force=False):
+        """Exit Mechanical.
+
+        Parameters
+        ----------
+        force : bool, optional
+            Whether to force Mechanical to exit. The default is ``False``, in which case
+            only Mechanical in UI mode asks for confirmation. This parameter overrides
+            any environment variables that may inhibit exiting Mechanical.
+
+        Examples
+        --------
+        Exit Mechanical.
+
+        >>> mechanical.Exit(force=True)
+
+        """
+        if not force:
+            if not get_start_instance():
+                self.log_info("Ignoring exit due to PYMECHANICAL_START_INSTANCE=False")
+                return
+
+            # or building the gallery
+            if pymechanical.BUILDING_GALLERY:
+                self._log.info("Ignoring exit due to BUILDING_GALLERY=True")
+                return
+
+        if self._exited:
+            return
+
+        self.verify_valid_connection()
+
+        self._exiting = True
+
+        with self._script_pipeline_lock:
+            if self._script_pipeline is not None:
+                self._script_pipeline.close()
+                self._script_pipeline = None
+
+        self.log_debug("In shutdown.")
+        request = mechanical_pb2.ShutdownRequest(force_exit=force)
+        self.log_debug("Shutting down...")
+
+        self._busy = True
+        try:
+            self._stub.Shutdown(request)
+        except grpc._channel._InactiveRpcError as error:
+            self.log_warning("Mechanical exit failed: {str(error}.")
+        finally:
+            self._busy = False
+
+        self._exited = True
+        self._stub = None
+        self._release_channel(close=True)
+
+        if self._remote_instance is not None:  # pragma: no cover
+            self.log_debug("PyPIM delete has started.")
+            try:
+                self._remote_instance.delete()
+            except Exception as error:
+                self.log_warning("Remote instance delete failed: {str(error}.")
+            self.log_debug("PyPIM delete has finished.")
+
+            self._remote_instance = None
+            self._channel = None
+        else:
+            self.log_debug("No PyPIM cleanup is needed.")
+
+        local_ports = pymechanical.LOCAL_PORTS
+        if self._local and self._port in local_ports:
+            local_ports.remove(self._port)
+
+        self.log_info("Shutdown has finished.")
+
+    @protect_grpc
+    def upload(
+        self,
+        file_name,
+        file_location_destination=None,
+        chunk_size=DEFAULT_FILE_CHUNK_SIZE,
+        progress_bar=True,
+        n_streams=1,
+        compression=None,
+    ):
+        """Upload a file to the Mechanical instance.
+
+        Parameters
+        ----------
+        file_name : str
+            Local file to upload. Only the file name is needed if the file
+            is relative to the current working directory. Otherwise, the full path
+            is needed.
+        file_location_destination : str, optional
+            File location on the Mechanical server to upload the file to. The default is
+            ``None``, in which case the project directory is used.
+        chunk_size : int or str, optional
+            Chunk size in bytes. The default is ``1048576``. If ``"auto"``, the chunk
+            size adapts to the throughput measured during the upload, and the chosen
+            size is kept for later uploads.
+        progress_bar : bool, optional
+            Whether to show a progress bar using ``tqdm``. The default is ``True``.
+            A progress bar is helpful for viewing upload progress.
+        n_streams : int, optional
+            Number of concurrent upload streams. The default is ``1``, in which
+            case the file is sent through a single stream. When greater than ``1``,
+            the file is split into byte ranges that are uploaded in parallel over the
+            existing channel and reassembled on the server. The SHA-256 digest of
+            each range is verified after reassembly.
+        compression : str, optional
+            Compression algorithm for the chunks. Options are ``"gzip"``,
+            ``"deflate"``, and ``"none"``. The default is ``None``, in which case the
+            compression algorithm of the session is used. Files that are already
+            compressed, or whose leading bytes do not shrink, are sent uncompressed.
+
+        Returns
+        -------
+        str
+            Base name of the uploaded file.
+
+        Examples
+        --------
+        Upload the ``hsec.x_t`` file  with the progress bar not shown.
+
+        >>> mechanical.upload('hsec.x_t', progress_bar=False)
+
+        Upload a large file over four parallel streams.
+
+        >>> mechanical.upload('model.mechdb', n_streams=4)
+        """
+        self.verify_valid_connection()
+
+        if not os.path.isfile(file_name):
+            raise FileNotFoundError(f"Unable to locate filename {file_name}.")
+
+        self._log.debug(f"Uploading file '{file_name}' to the Mechanical instance.")
+
+        if file_location_destination is None:
+            file_location_destination = self.project_directory
+
+        sizer = None
+        if chunk_size == "auto":
+            sizer = self._upload_chunk_sizer
+            chunk_size = sizer.chunk_size
+
+        compression = self._resolve_compression(compression)
+        if compression != "none" and not is_compressible(file_name):
+            self.log_debug(f"Uploading {file_name} uncompressed because it is incompressible.")
+            compression = "none"
+        compression = COMPRESSION_ALGORITHMS[compression]
+
+        file_size = os.path.getsize(file_name)
+        time_start = time.perf_counter()
+        if n_streams > 1 and file_size > chunk_size:
+            self._busy = True
+            try:
+                self._upload_parallel(
+                    file_name,
+                    file_location_destination,
+                    chunk_size,
+                    n_streams,
+                    progress_bar,
+                    sizer=sizer,
+                    compression=compression,
+                )
+            finally:
+                self._busy = False
+        else:
+            self._busy = True
+            try:
+                chunks_generator = self.get_file_chunks(
+                    file_location_destination,
+                    file_name,
+                    chunk_size=chunk_size,
+                    progress_bar=progress_bar,
+                    sizer=sizer,
+                )
+                response = self._stub.UploadFile(chunks_generator, compression=compression)
+                self.log_debug(f"upload_file response is {response.is_ok}.")
+            finally:
+                self._busy = False
+
+            if not response.is_ok:  # pragma: no cover
+                raise IOError("File failed to upload.")
+
+        stats = TransferStats()
+        stats.elapsed = time.perf_counter() - time_start
+        stats.add(
+            FileTransfer(
+                file_name,
+                os.path.join(file_location_destination, os.path.basename(file_name)),
+                file_size,
+                stats.elapsed,
+                chunk_size=chunk_size if sizer is None else sizer.chunk_size,
+            )
+        )
+        self._transfer_stats = stats
+        return os.path.basename(file_name)
+
+    def get_file_chunks(self, file_location, file_name, chunk_size, progress_bar, sizer=None):
+        """Construct the file upload request for the server.
+
+        Parameters
+        ----------
+        file_location_destination : str, optional
+            Directory where the file to upload to the server is located.
+        file_name : str
+            Name of the file to upload.
+        chunk_size : int
+            Chunk size in bytes.
+        progress_bar : bool
+            Whether to show a progress bar using ``tqdm``.
+        sizer : ansys.mechanical.core.transfer.AdaptiveChunkSizer, optional
+            Sizer that measures the time to send each chunk and chooses the size of
+            the next one. The default is ``None``, in which case ``chunk_size`` is used.
         """
         pbar = None
         if progress_bar:
@@ -1229,6 +2015,8 @@ class Mechanical(object):
 
         with open(file_name, "rb") as f:
             while True:
+                if sizer is not None:
+                    chunk_size = sizer.chunk_size
                 piece = f.read(chunk_size)
                 length = len(piece)
                 if length == 0:
@@ -1240,9 +2028,167 @@ class Mechanical(object):
                     pbar.update(length)
 
                 chunk = mechanical_pb2.Chunk(payload=piece, size=length)
+                time_sent = time.perf_counter()
                 yield mechanical_pb2.FileUploadRequest(
                     file_name=os.path.basename(file_name), file_location=file_location, chunk=chunk
                 )
+                if sizer is not None:
+                    # gRPC asks for the next chunk once flow control accepts this one
+                    sizer.add_sample(length, time.perf_counter() - time_sent)
+
+    def _upload_parallel(
+        self,
+        file_name,
+        file_location,
+        chunk_size,
+        n_streams,
+        progress_bar,
+        sizer=None,
+        compression=None,
+    ):
+        """Upload a file over several concurrent streams and reassemble it on the server."""
+        file_size = os.path.getsize(file_name)
+        base_name = os.path.basename(file_name)
+        ranges = split_byte_ranges(file_size, n_streams, min_length=chunk_size)
+        # concurrent uploads of files with the same name do not share temporary files
+        token = transfer_token()
+        part_names = [part_file_name(base_name, index, token) for index in range(len(ranges))]
+        merged_name = merged_file_name(base_name, token)
+        self.log_debug(f"Uploading {base_name} in {len(ranges)} parallel streams.")
+
+        pbar = None
+        if progress_bar:
+            if not _HAS_TQDM:  # pragma: no cover
+                raise ModuleNotFoundError(
+                    "To use the keyword argument 'progress_bar', you must have "
+                    "installed the 'tqdm' package. To avoid this message, you can "
+                    "set 'progress_bar=False'."
+                )
+            pbar = tqdm(
+                total=file_size,
+                desc=f"Uploading {base_name} to {self._channel_str}:{file_location}.",
+                unit="B",
+                unit_scale=True,
+                unit_divisor=1024,
+            )
+
+        digests = [hashlib.sha256() for _ in ranges]
+        try:
+            with ThreadPoolExecutor(
+                max_workers=len(ranges), thread_name_prefix="pymechanical_upload"
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        self._stub.UploadFile,
+                        self.get_file_range_chunks(
+                            file_location,
+                            file_name,
+                            part_name,
+                            offset,
+                            length,
+                            chunk_size,
+                            pbar=pbar,
+                            digest=digest,
+                            sizer=sizer,
+                        ),
+                        compression=compression,
+                    )
+                    for part_name, (offset, length), digest in zip(part_names, ranges, digests)
+                ]
+                responses = [future.result() for future in futures]
+        except Exception:
+            self._remove_server_files(file_location, part_names)
+            raise
+        finally:
+            if pbar is not None:
+                pbar.close()
+
+        if not all(response.is_ok for response in responses):  # pragma: no cover
+            self._remove_server_files(file_location, part_names)
+            raise IOError("File failed to upload.")
+
+        try:
+            server_digests = self.run_python_script(
+                MERGE_PARTS_SCRIPT
+                % (file_location, merged_name, part_names, DEFAULT_FILE_CHUNK_SIZE)
+            )
+        except Exception:
+            self._remove_server_files(file_location, [merged_name])
+            raise
+        if server_digests.split(",") != [digest.hexdigest() for digest in digests]:
+            # a later job must not use the corrupted file
+            self._remove_server_files(file_location, [merged_name])
+            raise IOError(f"Integrity check failed for the upload of {base_name}.")
+        # the previous version of the file is only replaced by a complete file
+        self.run_python_script(RENAME_FILE_SCRIPT % (file_location, merged_name, base_name))
+
+    def _remove_server_files(self, directory, file_names):
+        """Remove files from a directory on the server, ignoring failures."""
+        try:
+            self.run_python_script(REMOVE_FILES_SCRIPT % (directory, file_names))
+        except grpc.RpcError as error:  # pragma: no cover
+            self.log_warning(f"Unable to remove temporary files on the server: {error}")
+
+    def get_file_range_chunks(
+        self,
+        file_location,
+        file_name,
+        part_name,
+        offset,
+        length,
+        chunk_size,
+        pbar=None,
+        digest=None,
+        sizer=None,
+    ):
+        """Construct the upload request for a byte range of a file.
+
+        Parameters
+        ----------
+        file_location : str
+            Directory on the server to upload the byte range to.
+        file_name : str
+            Name of the local file to read the byte range from.
+        part_name : str
+            Name of the file on the server that receives the byte range.
+        offset : int
+            Offset of the byte range in bytes.
+        length : int
+            Length of the byte range in bytes.
+        chunk_size : int
+            Chunk size in bytes.
+        pbar : tqdm.tqdm, optional
+            Progress bar to update. The default is ``None``.
+        digest : hashlib._Hash, optional
+            Hash object to update with the bytes that are sent. The default is ``None``.
+        sizer : ansys.mechanical.core.transfer.AdaptiveChunkSizer, optional
+            Sizer that chooses the size of each chunk. The default is ``None``, in
+            which case ``chunk_size`` is used.
+        """
+        with open(file_name, "rb") as f:
+            f.seek(offset)
+            remaining = length
+            while remaining > 0:
+                if sizer is not None:
+                    chunk_size = sizer.chunk_size
+                piece = f.read(min(chunk_size, remaining))
+                piece_length = len(piece)
+                if piece_length == 0:  # pragma: no cover
+                    return
+                remaining -= piece_length
+
+                if digest is not None:
+                    digest.update(piece)
+                if pbar is not None:
+                    pbar.update(piece_length)
+
+                chunk = mechanical_pb2.Chunk(payload=piece, size=piece_length)
+                time_sent = time.perf_counter()
+                yield mechanical_pb2.FileUploadRequest(
+                    file_name=part_name, file_location=file_location, chunk=chunk
+                )
+                if sizer is not None:
+                    sizer.add_sample(piece_length, time.perf_counter() - time_sent)
 
     @property
     def project_directory(self):
@@ -1282,9 +2228,7 @@ class Mechanical(object):
             self.log_warning("No files listed")
         return files_out
 
-    def _get_files(self, files, recursive=False):
-        self_files = self.list_files()  # to avoid calling it too much
-
+    def _get_files(self, files, recursive=False, self_files=None):
         if isinstance(files, str):
             if self._local:  # pragma: no cover
                 # in local mode
@@ -1307,6 +2251,9 @@ class Mechanical(object):
                         f"The files parameter ('{files}') does not match any file or pattern."
                     )
             else:  # Remote or looking into Mechanical working directory
+                if self_files is None:
+                    self_files = self.list_files()  # to avoid calling it too much
+
                 if files in self_files:
                     list_files = [files]
                 elif "*" in files:
@@ -1349,6 +2296,10 @@ class Mechanical(object):
         chunk_size=DEFAULT_CHUNK_SIZE,
         progress_bar=None,
         recursive=False,
+        max_workers=1,
+        resume=False,
+        use_mmap=False,
+        compression=None,
     ):  # pragma: no cover
         """Download files from the working directory of the Mechanical instance.
 
@@ -1367,14 +2318,36 @@ class Mechanical(object):
         target_dir: str
             Default directory to copy the downloaded files to. The default is ``None`` and
             current working directory will be used as target directory.
-        chunk_size : int, optional
+        chunk_size : int or str, optional
             Chunk size in bytes. The default is ``262144``. The value must be less than 4 MB.
+            If ``"auto"``, the chunk size of each file is chosen from the round-trip time
+            and throughput measured on earlier downloads, within the message size limit
+            of the channel.
         progress_bar : bool, optional
             Whether to show a progress bar using  ``tqdm``. The default is ``None``, in
-            which case a progress bar is shown. A progress bar is helpful for viewing download
-            progress.
+            which case a progress bar is shown if the files are downloaded one at a time.
+            A progress bar is helpful for viewing download progress.
         recursive : bool, optional
             Whether to use recursion when using a glob pattern search. The default is ``False``.
+        max_workers : int, optional
+            Maximum number of files to download concurrently. The default is ``1``.
+        resume : bool, optional
+            Whether to use resumable, delta-aware transfers. The default is ``False``.
+            When ``True``, files whose local copy has the same SHA-256 digest as the
+            file on the server are skipped. Other files are written to a partial file
+            next to the target. If a partial file is left over from an interrupted
+            download, the download restarts at the end of the partial file once its
+            digest matches the start of the file on the server.
+        use_mmap : bool, optional
+            Whether to write the downloaded chunks into a memory-mapped file that is
+            preallocated to the size of the file on the server. The default is ``False``.
+        compression : str, optional
+            Compression algorithm for the transfer. Options are ``"gzip"``,
+            ``"deflate"``, and ``"none"``. The default is ``None``, in which case the
+            compression algorithm of the session is used. The server compresses each
+            file into a temporary file, which is decompressed as it is downloaded.
+            Files that are already compressed, or whose leading bytes do not shrink,
+            are downloaded as they are.
 
         Returns
         -------
@@ -1414,7 +2387,7 @@ class Mechanical(object):
         """
         self.verify_valid_connection()
 
-        if chunk_size > 4 * 1024 * 1024:  # 4MB
+        if chunk_size != "auto" and chunk_size > 4 * 1024 * 1024:  # 4MB
             raise ValueError(
                 "Chunk sizes bigger than 4 MB can generate unstable behaviour in PyMechanical. "
                 "Decrease the ``chunk_size`` value."
@@ -1428,36 +2401,273 @@ class Mechanical(object):
         else:
             target_dir = os.getcwd()
 
-        out_files = []
+        # Getting only the name of the file.
+        # We try to avoid that when the full path is supplied. It crashes when trying
+        # to do `os.path.join(target_dir"os.getcwd()", file_name "full filename path"`
+        # This produces the file structure to flat out, but it is fine,
+        # because recursive does not work in remote.
+        file_pairs = [
+            (each_file, os.path.join(target_dir, os.path.basename(each_file)))
+            for each_file in list_files
+        ]
 
-        for each_file in list_files:
-            try:
-                file_name = os.path.basename(each_file)  # Getting only the name of the file.
-                #  We try to avoid that when the full path is supplied. It crashes when trying
-                # to do `os.path.join(target_dir"os.getcwd()", file_name "full filename path"`
-                # This produces the file structure to flat out, but it is fine,
-                # because recursive does not work in remote.
-                self._busy = True
-                out_file_path = self._download(
-                    each_file,
-                    out_file_name=os.path.join(target_dir, file_name),
-                    chunk_size=chunk_size,
-                    progress_bar=progress_bar,
+        return self._download_files(
+            file_pairs,
+            chunk_size=chunk_size,
+            progress_bar=progress_bar,
+            max_workers=max_workers,
+            resume=resume,
+            use_mmap=use_mmap,
+            compression=self._resolve_compression(compression),
+        )
+
+    def _download_files(
+        self,
+        file_pairs,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        progress_bar=None,
+        max_workers=1,
+        resume=False,
+        use_mmap=False,
+        compression="none",
+    ):
+        """Download files from the Mechanical instance using a bounded pool of workers.
+
+        Parameters
+        ----------
+        file_pairs : list[tuple(str, str)]
+            List of ``(server_path, local_path)`` tuples. The parent directory of each
+            local path is created if it does not exist.
+        chunk_size : int or str, optional
+            Chunk size in bytes, or ``"auto"`` for adaptive chunk sizes. The default
+            is ``DEFAULT_CHUNK_SIZE``.
+        progress_bar : bool, optional
+            Whether to show a progress bar using ``tqdm``. The default is ``None``, in
+            which case a progress bar is shown if the files are downloaded one at a time.
+        max_workers : int, optional
+            Maximum number of files to download concurrently. The default is ``1``.
+        resume : bool, optional
+            Whether to skip files that are up to date and resume partial downloads.
+            The default is ``False``.
+        use_mmap : bool, optional
+            Whether to write the downloaded chunks into memory-mapped files. The
+            default is ``False``.
+        compression : str, optional
+            Compression algorithm for the transfers. The default is ``"none"``.
+
+        Returns
+        -------
+        List[str]
+            List of local file paths, in the same order as ``file_pairs``.
+        """
+        stats = TransferStats()
+        n_workers = max(1, min(max_workers, len(file_pairs) or 1))
+        if progress_bar is None:
+            # the progress bars of concurrent downloads would overwrite each other
+            progress_bar = _HAS_TQDM and n_workers == 1
+
+        self._busy = True
+        time_start = time.perf_counter()
+        try:
+            plans = [None] * len(file_pairs)
+            if resume and file_pairs:
+                plans = self._plan_resumable_downloads(file_pairs)
+
+            sizer = self._download_chunk_sizer if chunk_size == "auto" else None
+
+            def download_one(server_path, local_path, plan):
+                local_directory = os.path.dirname(local_path)
+                if local_directory:
+                    pathlib.Path(local_directory).mkdir(parents=True, exist_ok=True)
+                file_chunk_size = chunk_size if sizer is None else sizer.chunk_size
+                time_start = time.perf_counter()
+                offset = 0
+                try:
+                    if plan is None:
+                        out_file_path = self._download(
+                            server_path,
+                            out_file_name=local_path,
+                            chunk_size=file_chunk_size,
+                            progress_bar=progress_bar,
+                            use_mmap=use_mmap,
+                            sizer=sizer,
+                            compression=compression,
+                        )
+                    else:
+                        offset, digest = plan
+                        out_file_path = self._download_resumable(
+                            server_path,
+                            local_path,
+                            offset,
+                            digest,
+                            chunk_size=file_chunk_size,
+                            progress_bar=progress_bar,
+                            use_mmap=use_mmap,
+                            sizer=sizer,
+                            compression=compression,
+                        )
+                except FileNotFoundError:
+                    # So far the gRPC interface returns the size of the file equal
+                    # zero, if the file does not exist, or if its size is zero,
+                    # but they are two different things.
+                    # In theory, since we are obtaining the files name from
+                    # `mechanical.list_files()`, they do exist, so
+                    # if there is any error, it means their size is zero.
+                    return None  # This is not the best.
+                elapsed = time.perf_counter() - time_start
+                size = os.path.getsize(out_file_path) - offset
+                return FileTransfer(
+                    server_path,
+                    out_file_path,
+                    size,
+                    elapsed,
+                    offset=offset,
+                    chunk_size=file_chunk_size,
                 )
-                out_files.append(out_file_path)
-            except FileNotFoundError:
-                # So far the gRPC interface returns the size of the file equal
-                # zero, if the file does not exist, or if its size is zero,
-                # but they are two different things.
-                # In theory, since we are obtaining the files name from
-                # `mechanical.list_files()`, they do exist, so
-                # if there is any error, it means their size is zero.
-                pass  # This is not the best.
-            finally:
-                self._busy = False
 
+            jobs = []
+            for (server_path, local_path), plan in zip(file_pairs, plans):
+                if plan == "skip":
+                    stats.skip(server_path, local_path)
+                    jobs.append(local_path)
+                else:
+                    jobs.append((server_path, local_path, plan))
+
+            with ThreadPoolExecutor(
+                max_workers=n_workers,
+                thread_name_prefix="pymechanical_download",
+            ) as executor:
+                futures = [
+                    job if isinstance(job, str) else executor.submit(download_one, *job)
+                    for job in jobs
+                ]
+                transfers = [
+                    future if isinstance(future, str) else future.result() for future in futures
+                ]
+        finally:
+            self._busy = False
+            stats.elapsed = time.perf_counter() - time_start
+
+        out_files = []
+        for transfer in transfers:
+            if isinstance(transfer, str):
+                out_files.append(transfer)
+            elif transfer is not None:
+                stats.add(transfer)
+                out_files.append(transfer.destination)
+
+        self._transfer_stats = stats
+        self.log_info(
+            f"Downloaded {len(stats.files)} files ({stats.total_bytes} bytes) in "
+            f"{stats.elapsed:.2f}s ({stats.bytes_per_second / 1024**2:.2f} MB/s). "
+            f"Skipped {len(stats.skipped)} files that are up to date."
+        )
         return out_files
 
+    def _plan_resumable_downloads(self, file_pairs):
+        """Compare local files with their server-side digests in a single script call.
+
+        Returns
+        -------
+        list
+            For each file pair, ``"skip"`` if the local file is up to date, ``None`` if
+            the file does not exist on the server, or an ``(offset, digest)`` tuple with
+            the verified offset to resume from and the digest of the complete file.
+        """
+        requests = []
+        for _, local_path in file_pairs:
+            partial_path = partial_file_name(local_path)
+            prefix_length = os.path.getsize(partial_path) if os.path.isfile(partial_path) else 0
+            requests.append((prefix_length, partial_path))
+
+        server_digests = parse_file_digests(
+            self.run_python_script(
+                FILE_DIGESTS_SCRIPT
+                % (
+                    [
+                        (server_path, prefix_length)
+                        for (server_path, _), (prefix_length, _) in zip(file_pairs, requests)
+                    ],
+                    DIGEST_BLOCK_SIZE,
+                )
+            )
+        )
+
+        plans = []
+        for (_, local_path), (prefix_length, partial_path), server_digest in zip(
+            file_pairs, requests, server_digests
+        ):
+            if server_digest is None:
+                plans.append(None)
+                continue
+
+            size, digest, prefix_digest = server_digest
+            if os.path.isfile(local_path) and os.path.getsize(local_path) == size:
+                if file_digest(local_path) == digest:
+                    plans.append("skip")
+                    continue
+
+            offset = 0
+            if 0 < prefix_length <= size and file_digest(partial_path) == prefix_digest:
+                offset = prefix_length
+            plans.append((offset, digest))
+        return plans
+
+    def _download_resumable(
+        self,
+        target_name,
+        out_file_name,
+        offset,
+        digest,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        progress_bar=None,
+        use_mmap=False,
+        sizer=None,
+        compression="none",
+    ):
+        """Download a file through a partial file, starting at a verified offset.
+
+        The partial file is kept if the download fails, so that a later call can
+        resume from it. It is renamed to ``out_file_name`` once the SHA-256 digest
+        of the complete file matches ``digest``.
+        """
+        partial_path = partial_file_name(out_file_name)
+        if offset == 0:
+            server_path = target_name
+        else:
+            self.log_info(f"Resuming the download of {target_name} at byte {offset}.")
+            # concurrent downloads of the same file do not share the tail
+            tail_path = tail_file_name(target_name, transfer_token())
+            server_path = self.run_python_script(
+                COPY_TAIL_SCRIPT % (target_name, tail_path, offset, DIGEST_BLOCK_SIZE)
+            )
+
+        try:
+            self._download(
+                server_path,
+                out_file_name=partial_path,
+                chunk_size=chunk_size,
+                progress_bar=progress_bar,
+                append=offset > 0,
+                use_mmap=use_mmap,
+                sizer=sizer,
+                compression=compression,
+            )
+        except FileNotFoundError:
+            # the tail is empty when the partial file already holds every byte
+            if offset == 0:
+                raise
+        finally:
+            if offset > 0:
+                self._remove_server_files("", [server_path])
+
+        if file_digest(partial_path) != digest:
+            os.remove(partial_path)
+            raise IOError(f"Integrity check failed for the download of {target_name}.")
+
+        os.replace(partial_path, out_file_name)
+        return out_file_name
+
     @protect_grpc
     def _download(
         self,
@@ -1465,6 +2675,10 @@ class Mechanical(object):
         out_file_name,
         chunk_size=DEFAULT_CHUNK_SIZE,
         progress_bar=None,
+        append=False,
+        use_mmap=False,
+        sizer=None,
+        compression="none",
     ):
         """Download a file from the Mechanical instance.
 
@@ -1484,6 +2698,17 @@ class Mechanical(object):
             Whether to show a progress bar using  ``tqdm``. The default is ``None``, in
             which case a progress bar is shown. A progress bar is helpful for showing download
             progress.
+        append : bool, optional
+            Whether to append the downloaded bytes to ``out_file_name`` instead of
+            overwriting it. The default is ``False``.
+        use_mmap : bool, optional
+            Whether to write the downloaded chunks into a memory-mapped file. The
+            default is ``False``.
+        sizer : ansys.mechanical.core.transfer.AdaptiveChunkSizer, optional
+            Sizer to update with the round-trip time and throughput of the download.
+            The default is ``None``.
+        compression : str, optional
+            Compression algorithm for the transfer. The default is ``"none"``.
 
         Examples
         --------
@@ -1493,16 +2718,24 @@ class Mechanical(object):
         """
         self.verify_valid_connection()
 
-        if not progress_bar and _HAS_TQDM:
-            progress_bar = True
-
-        request = mechanical_pb2.FileDownloadRequest(file_path=target_name, chunk_size=chunk_size)
+        if progress_bar is None:
+            progress_bar = _HAS_TQDM
 
-        responses = self._stub.DownloadFile(request)
-
-        file_size = self.save_chunks_to_file(
-            responses, out_file_name, progress_bar=progress_bar, target_name=target_name
+        responses, compressed_path = self._request_download(
+            target_name, chunk_size, sizer=sizer, compression=compression
         )
+        try:
+            file_size = self.save_chunks_to_file(
+                responses,
+                out_file_name,
+                progress_bar=progress_bar,
+                target_name=target_name,
+                append=append,
+                use_mmap=use_mmap,
+            )
+        finally:
+            if compressed_path:
+                self._remove_server_files("", [compressed_path])
 
         if not file_size:  # pragma: no cover
             raise FileNotFoundError(f'File "{out_file_name}" is empty or does not exist')
@@ -1511,7 +2744,55 @@ class Mechanical(object):
 
         return out_file_name
 
-    def save_chunks_to_file(self, responses, filename, progress_bar=False, target_name=""):
+    def _request_download(self, target_name, chunk_size, sizer=None, compression="none"):
+        """Request the chunks of a file, compressing it on the server first if requested.
+
+        Returns
+        -------
+        tuple
+            Stream of responses with the uncompressed payloads and the path of the
+            temporary compressed file on the server, which is ``None`` if the file
+            is not compressed.
+        """
+        compressed_path = None
+        if compression != "none" and is_compressible(target_name, sample=False):
+            result = self.run_python_script(
+                COMPRESS_FILE_SCRIPT
+                % (
+                    target_name,
+                    compressed_file_name(target_name),
+                    COMPRESSION_WBITS[compression],
+                    COMPRESSION_SAMPLE_SIZE,
+                    DIGEST_BLOCK_SIZE,
+                )
+            )
+            if result:
+                file_size, compressed_path = result.split(",", 1)
+            else:
+                self.log_debug(
+                    f"Downloading {target_name} uncompressed because it is incompressible."
+                )
+
+        request = mechanical_pb2.FileDownloadRequest(
+            file_path=compressed_path or target_name, chunk_size=chunk_size
+        )
+        time_start = time.perf_counter()
+        responses = self._stub.DownloadFile(request)
+        if sizer is not None:
+            responses = sizer.measure(responses, time_start)
+        if compressed_path:
+            responses = decompress_responses(responses, compression, int(file_size))
+        return responses, compressed_path
+
+    def save_chunks_to_file(
+        self,
+        responses,
+        filename,
+        progress_bar=False,
+        target_name="",
+        append=False,
+        use_mmap=False,
+    ):
         """Save chunks to a local file.
 
         Parameters
@@ -1525,12 +2806,34 @@ class Mechanical(object):
             Name of the target file on the server. The default is ``""``. The file
             must be in the same directory as the Mechanical instance. You can use the
             ``mechanical.list_files()`` function to list current files.
+        append : bool, optional
+            Whether to append the chunks to the file instead of overwriting it.
+            The default is ``False``.
+        use_mmap : bool, optional
+            Whether to preallocate the file from the file size reported by the server
+            and write the chunks into a memory map of it. The default is ``False``.
 
         Returns
         -------
         file_size : int
             File size saved in bytes.  If ``0`` is returned, no file was written.
         """
+        sink = MmapSink(filename, append=append) if use_mmap else FileSink(filename, append=append)
+        return self._write_chunks(
+            responses,
+            sink,
+            progress_bar=progress_bar,
+            description=f"Downloading {self._channel_str}:{target_name} to {filename}",
+        )
+
+    def _write_chunks(self, responses, sink, progress_bar=False, description=""):
+        """Write the chunks of a ``DownloadFile`` response stream to a sink.
+
+        Returns
+        -------
+        int
+            Number of bytes written.
+        """
         pbar = None
         if progress_bar:
             if not _HAS_TQDM:  # pragma: no cover
@@ -1540,29 +2843,118 @@ class Mechanical(object):
                 )
 
         file_size = 0
-        with open(filename, "wb") as f:
+        try:
             for response in responses:
-                f.write(response.chunk.payload)
-                payload_size = len(response.chunk.payload)
+                payload_size = sink.write(response.chunk.payload, response.file_size)
                 file_size += payload_size
-                if pbar is None:
-                    pbar = tqdm(
-                        total=response.file_size,
-                        desc=f"Downloading {self._channel_str}:{target_name} to {filename}",
-                        unit="B",
-                        unit_scale=True,
-                        unit_divisor=1024,
-                    )
-                    pbar.update(payload_size)
-                else:
+                if progress_bar:
+                    if pbar is None:
+                        pbar = tqdm(
+                            total=response.file_size,
+                            desc=description,
+                            unit="B",
+                            unit_scale=True,
+                            unit_divisor=1024,
+                        )
                     pbar.update(payload_size)
-
-        if pbar is not None:
-            pbar.close()
+        finally:
+            sink.close()
+            if pbar is not None:
+                pbar.close()
 
         return file_size
 
-    def download_project(self, extensions=None, target_dir=None, progress_bar=False):
+    @protect_grpc
+    def download_to_memory(
+        self,
+        target_name,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        progress_bar=False,
+        dtype=None,
+        compression=None,
+    ):
+        """Download a file from the Mechanical instance into memory.
+
+        The chunks are written into a buffer that is preallocated from the file size
+        reported by the server, so no local file is created.
+
+        Parameters
+        ----------
+        target_name : str
+            Path of the file on the server. You can use the
+            ``mechanical.list_files()`` function to list current files.
+        chunk_size : int or str, optional
+            Chunk size in bytes. The default is ``262144``. The value must be less than 4 MB.
+            If ``"auto"``, the chunk size is chosen from the round-trip time and
+            throughput measured on earlier downloads.
+        progress_bar : bool, optional
+            Whether to show a progress bar using  ``tqdm``. The default is ``False``.
+        dtype : numpy.dtype or str, optional
+            Data type to interpret the bytes as. The default is ``None``, in which
+            case a ``memoryview`` is returned. If a data type is given, a NumPy array
+            that shares memory with the buffer is returned. This requires the
+            ``numpy`` package.
+        compression : str, optional
+            Compression algorithm for the transfer. Options are ``"gzip"``,
+            ``"deflate"``, and ``"none"``. The default is ``None``, in which case the
+            compression algorithm of the session is used.
+
+        Returns
+        -------
+        memoryview or numpy.ndarray
+            Content of the file.
+
+        Examples
+        --------
+        Download a binary file of double-precision values as a NumPy array.
+
+        >>> values = mechanical.download_to_memory("values.bin", dtype="float64")
+        """
+        self.verify_valid_connection()
+
+        if chunk_size != "auto" and chunk_size > 4 * 1024 * 1024:  # 4MB
+            raise ValueError(
+                "Chunk sizes bigger than 4 MB can generate unstable behaviour in PyMechanical. "
+                "Decrease the ``chunk_size`` value."
+            )
+
+        sizer = None
+        if chunk_size == "auto":
+            sizer = self._download_chunk_sizer
+            chunk_size = sizer.chunk_size
+
+        responses, compressed_path = self._request_download(
+            target_name,
+            chunk_size,
+            sizer=sizer,
+            compression=self._resolve_compression(compression),
+        )
+        sink = BufferSink()
+        try:
+            self._write_chunks(
+                responses,
+                sink,
+                progress_bar=progress_bar,
+                description=f"Downloading {self._channel_str}:{target_name} to memory",
+            )
+        finally:
+            if compressed_path:
+                self._remove_server_files("", [compressed_path])
+
+        if dtype is not None:
+            return sink.as_array(dtype)
+        return sink.buffer
+
+    def download_project(
+        self,
+        extensions=None,
+        target_dir=None,
+        progress_bar=False,
+        max_workers=1,
+        resume=False,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        compression=None,
+    ):
         """Download all project files in the working directory of the Mechanical instance.
 
         It downloads them from the working directory to the target directory. It returns the list
@@ -1578,6 +2970,21 @@ class Mechanical(object):
         progress_bar : bool, optional
             Whether to show a progress bar using ``tqdm``. The default is ``False``.
             A progress bar is helpful for viewing download progress.
+        max_workers : int, optional
+            Maximum number of files to download concurrently. The default is ``1``.
+        resume : bool, optional
+            Whether to skip files that are up to date and resume interrupted downloads.
+            The default is ``False``. For more information, see the ``resume`` parameter
+            of the :func:`download() <ansys.mechanical.core.mechanical.Mechanical.download>`
+            method.
+        chunk_size : int or str, optional
+            Chunk size in bytes. The default is ``262144``. If ``"auto"``, the chunk
+            size of each file is chosen from the round-trip time and throughput measured
+            on earlier downloads.
+        compression : str, optional
+            Compression algorithm for the transfers. Options are ``"gzip"``,
+            ``"deflate"``, and ``"none"``. The default is ``None``, in which case the
+            compression algorithm of the session is used.
 
         Returns
         -------
@@ -1589,8 +2996,18 @@ class Mechanical(object):
         Download all the files in the project.
 
         >>> local_file_path_list = mechanical.download_project()
+
+        Download all the files in the project using eight concurrent streams and
+        report the aggregate throughput.
+
+        >>> local_file_path_list = mechanical.download_project(max_workers=8)
+        >>> mechanical.transfer_stats.bytes_per_second
+
+        Synchronize a local copy of the project, transferring only files that changed.
+
+        >>> local_file_path_list = mechanical.download_project(target_dir="sync", resume=True)
         """
-        destination_directory = target_dir.rstrip("\\/")
+        destination_directory = (target_dir or "").rstrip("\\/")
 
         # let us create the directory, if it doesn't exist
         if destination_directory:
@@ -1612,10 +3029,11 @@ class Mechanical(object):
         # this is where .mechddb resides
         parent_directory = os.path.dirname(project_directory)
 
-        list_of_files = []
+        # list the project files once and reuse the listing for every extension
+        self_files = self.list_files()
 
         if not extensions:
-            files = self.list_files()
+            files = self_files
         else:
             files = []
             for each_extension in extensions:
@@ -1626,12 +3044,13 @@ class Mechanical(object):
                     file_temp = os.path.join(project_directory, "**", f"*.{each_extension}")
 
                 if self._local:
-                    list_files_expanded = self._get_files(file_temp, recursive=True)
+                    list_files_expanded = self._get_files(
+                        file_temp, recursive=True, self_files=self_files
+                    )
 
                     if "mechdb" == each_extension.lower():
                         # if we have more than one .mechdb in the parent folder
                         # filter to have only the current mechdb
-                        self_files = self.list_files()
                         filtered_files = []
                         for temp_file in list_files_expanded:
                             if temp_file in self_files:
@@ -1640,20 +3059,23 @@ class Mechanical(object):
                     else:
                         list_files = list_files_expanded
                 else:
-                    list_files = self._get_files(file_temp, recursive=False)
+                    list_files = self._get_files(file_temp, recursive=False, self_files=self_files)
 
                 files.extend(list_files)
 
-        for file in files:
-            # create similar hierarchy locally
-            new_path = file.replace(parent_directory, destination_directory)
-            new_path_dir = os.path.dirname(new_path)
-            temp_files = self.download(
-                files=file, target_dir=new_path_dir, progress_bar=progress_bar
-            )
-            list_of_files.extend(temp_files)
+        # create similar hierarchy locally
+        file_pairs = [
+            (file, file.replace(parent_directory, destination_directory)) for file in files
+        ]
 
-        return list_of_files
+        return self._download_files(
+            file_pairs,
+            chunk_size=chunk_size,
+            progress_bar=progress_bar,
+            max_workers=max_workers,
+            resume=resume,
+            compression=self._resolve_compression(compression),
+        )
 
     def clear(self):
         """Clear the database.
@@ -1689,7 +3111,13 @@ class Mechanical(object):
         return data
 
     def __call_run_python_script(
-        self, script_code: str, enable_logging, log_level, progress_interval
+        self,
+        script_code: str,
+        enable_logging,
+        log_level,
+        progress_interval,
+        logged_script=None,
+        ignore_conversion_error=True,
     ):
         """Run the Python script block on the server.
 
@@ -1704,6 +3132,12 @@ class Mechanical(object):
             and ``"ERROR"``.
         timeout: int, optional
             Frequency in milliseconds for getting log messages from the server.
+        logged_script : str, optional
+            Script to write to the script log instead of the script block. This is
+            used when the script block wraps the script of the user.
+        ignore_conversion_error : bool, optional
+            Whether to return an empty result if the result cannot be converted to
+            a string. The default is ``True``.
 
         Returns
         -------
@@ -1711,18 +3145,40 @@ class Mechanical(object):
             Script result.
 
         """
-        log_level_server = self.convert_to_server_log_level(log_level)
-        request = mechanical_pb2.RunScriptRequest()
-        request.script_code = script_code
-        request.enable_logging = enable_logging
-        request.logger_severity = log_level_server
-        request.progress_interval = progress_interval
+        request = run_script_request(script_code, enable_logging, log_level, progress_interval)
 
-        result = ""
         self._busy = True
+        try:
+            return self._read_script_result(
+                self._stub.RunPythonScript(request),
+                (logged_script or script_code, enable_logging, log_level),
+                ignore_conversion_error,
+            )
+        finally:
+            self._busy = False
 
+    def _read_script_result(self, responses, context, ignore_conversion_error=True):
+        """Read the result of a script from the responses of a ``RunPythonScript`` call.
+
+        Parameters
+        ----------
+        responses : iterable
+            Responses of the call.
+        context : tuple
+            Script code, whether logging is enabled, and the log level.
+        ignore_conversion_error : bool, optional
+            Whether to return an empty result if the result cannot be converted to
+            a string. The default is ``True``.
+
+        Returns
+        -------
+        str
+            Script result.
+        """
+        script_code, enable_logging, log_level = context
+        result = ""
         try:
-            for runscript_response in self._stub.RunPythonScript(request):
+            for runscript_response in responses:
                 if runscript_response.log_info == "__done__":
                     result = runscript_response.script_result
                     break
@@ -1730,20 +3186,13 @@ class Mechanical(object):
                     if enable_logging:
                         self.log_message(log_level, runscript_response.log_info)
         except grpc.RpcError as error:
-            error_info = error.details()
-            error_info_lower = error_info.lower()
             # For the given script, return value cannot be converted to string.
-            if (
-                "the expected result" in error_info_lower
-                and "cannot be return via this API." in error_info
-            ):
+            if ignore_conversion_error and is_result_conversion_error(error):
                 if enable_logging:
-                    self.log_debug(f"Ignoring the conversion error.{error_info}")
+                    self.log_debug(f"Ignoring the conversion error.{error.details()}")
                 result = ""
             else:
                 raise
-        finally:
-            self._busy = False
 
         self._log_mechanical_script(script_code)
 
@@ -2297,7 +3746,9 @@ def launch_mechanical(
 
     if backend == "mechanical":
         try:
+            time_start = time.perf_counter()
             port = launch_grpc(port=port, verbose=verbose_mechanical, **start_parm)
+            launch_time = time.perf_counter() - time_start
             start_parm["local"] = True
             mechanical = Mechanical(
                 ip=ip,
@@ -2310,6 +3761,7 @@ def launch_mechanical(
                 keep_connection_alive=keep_connection_alive,
                 **start_parm,
             )
+            mechanical._startup_timings.launch = launch_time
         except Exception as exception:  # pragma: no cover
             # pass
             raise exception
@@ -22,9 +22,18 @@
 
 """This module is for threaded implementations of the Mechanical interface."""
 
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+import hashlib
+import heapq
+import itertools
 import os
+import threading
 import time
+import uuid
 import warnings
+import weakref
 
 from ansys.tools.path import version_from_path
 
@@ -34,15 +43,41 @@ from ansys.mechanical.core.mechanical import (
     _HAS_TQDM,
     LOG,
     MECHANICAL_DEFAULT_PORT,
+    connect_to_mechanical,
     get_mechanical_path,
     launch_mechanical,
-    port_in_use,
 )
 from ansys.mechanical.core.misc import threaded, threaded_daemon
+from ansys.mechanical.core.ports import find_free_ports, find_mechanical_servers, scan_ports
 
 if _HAS_TQDM:
     from tqdm import tqdm
 
+LATENCY_BASELINE_JOBS = 5
+"""Number of first jobs of an instance that set its baseline latency."""
+
+LATENCY_SMOOTHING = 0.2
+"""Weight of the latest job in the moving average of the latency of an instance."""
+
+LOCKED_POLL_INTERVAL = 0.1
+"""Time in seconds after which callers check again whether idle locked instances are unlocked."""
+
+PROCESS_MEMORY_SCRIPT = """import System
+System.Diagnostics.Process.GetCurrentProcess().WorkingSet64"""
+"""Script that gets the resident memory in bytes of the Mechanical process."""
+
+MAKE_DIRECTORY_SCRIPT = """import os
+if not os.path.isdir(%r):
+    os.makedirs(%r)"""
+"""Script that creates a directory on the server, if it does not exist."""
+
+TEMP_DIRECTORY_SCRIPT = """import System
+System.IO.Path.GetTempPath()"""
+"""Script that gets the temporary directory of the host of the server."""
+
+# same as PYMECHANICAL_DEFAULT_RPC_PORT, whose module requires rpyc
+_RPC_DEFAULT_PORT = 20000
+
 
 def available_ports(n_ports, starting_port=MECHANICAL_DEFAULT_PORT):
     """Get a list of a given number of available ports starting from a specified port number.
@@ -55,12 +90,7 @@ def available_ports(n_ports, starting_port=MECHANICAL_DEFAULT_PORT):
         Number of the port to start the search from. The default is
         ``MECHANICAL_DEFAULT_PORT``.
     """
-    port = starting_port
-    ports = []
-    while port < 65536 and len(ports) < n_ports:
-        if not port_in_use(port):
-            ports.append(port)
-        port += 1
+    ports = find_free_ports(n_ports, starting_port)
 
     if len(ports) < n_ports:
         raise RuntimeError(
@@ -70,6 +100,546 @@ def available_ports(n_ports, starting_port=MECHANICAL_DEFAULT_PORT):
     return ports
 
 
+class PoolMetrics:
+    """Snapshot of the scheduling metrics of a pool.
+
+    Parameters
+    ----------
+    n_idle : int
+        Number of instances waiting for work.
+    n_waiting : int
+        Number of callers waiting for an instance, which is the depth of the work queue.
+    n_acquired : int
+        Number of times that an instance was acquired.
+    total_wait : float
+        Total time in seconds that callers waited for an instance.
+    max_wait : float
+        Longest time in seconds that a caller waited for an instance.
+    current_wait : float, optional
+        Time in seconds that the caller waiting the longest has been waiting.
+        The default is ``0.0``.
+    n_preferred : int, optional
+        Number of times that a caller got the instance it preferred, such as
+        the instance holding the state of its affinity key. The default is ``0``.
+    queue_waits : dict, optional
+        :class:`QueueWaits` of the jobs of the pool for each priority. The default
+        is ``None``, in which case it is empty.
+    """
+
+    def __init__(
+        self,
+        n_idle,
+        n_waiting,
+        n_acquired,
+        total_wait,
+        max_wait,
+        current_wait=0.0,
+        n_preferred=0,
+        queue_waits=None,
+    ):
+        """Initialize the metrics."""
+        self.n_idle = n_idle
+        self.n_waiting = n_waiting
+        self.n_acquired = n_acquired
+        self.total_wait = total_wait
+        self.max_wait = max_wait
+        self.current_wait = current_wait
+        self.n_preferred = n_preferred
+        self.queue_waits = queue_waits or {}
+
+    @property
+    def mean_wait(self):
+        """Average time in seconds that callers waited for an instance."""
+        if not self.n_acquired:
+            return 0.0
+        return self.total_wait / self.n_acquired
+
+    def __repr__(self):
+        """Get the string representation of the metrics."""
+        return (
+            f"PoolMetrics(n_idle={self.n_idle}, n_waiting={self.n_waiting}, "
+            f"n_acquired={self.n_acquired}, mean_wait={self.mean_wait:.3f}, "
+            f"max_wait={self.max_wait:.3f})"
+        )
+
+
+class PoolScheduler:
+    """Thread-safe queue of the idle instances of a pool.
+
+    Instances are identified by their index in the pool. Callers block on a
+    condition variable until an instance is put back in the queue, so waiting
+    for an instance does not use any CPU.
+    """
+
+    def __init__(self):
+        """Initialize an empty queue."""
+        self._condition = threading.Condition()
+        self._ready = deque()
+        self._idle_since = {}
+        self._closed = False
+        self._wait_starts = {}
+        self._n_acquired = 0
+        self._n_preferred = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def put(self, index):
+        """Put an idle instance in the queue."""
+        with self._condition:
+            if index not in self._ready:
+                self._ready.append(index)
+                self._idle_since[index] = time.perf_counter()
+                # waiters can be waiting for different instances
+                self._condition.notify_all()
+
+    def _select(self, is_available, is_locked, prefer, strict):
+        """Get the index of the idle instance to take, or ``None`` if there is none."""
+        # drop the instances that exited while they were idle
+        while self._ready and not is_available(self._ready[0]):
+            self._ready.popleft()
+        # locked instances stay in the queue until they are unlocked
+        ready = [index for index in self._ready if is_available(index) and not is_locked(index)]
+        if prefer is not None:
+            for index in ready:
+                if prefer(index):
+                    return index
+            if strict:
+                return None
+        return ready[0] if ready else None
+
+    def _wait(
+        self,
+        timeout,
+        is_available,
+        remove,
+        prefer=None,
+        strict=False,
+        is_locked=lambda index: False,
+    ):
+        time_start = time.perf_counter()
+        deadline = None if timeout is None else time_start + timeout
+        waiter = object()
+        with self._condition:
+            self._wait_starts[waiter] = time_start
+            try:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("The pool is closed.")
+                    index = self._select(is_available, is_locked, prefer, strict)
+                    if index is not None:
+                        break
+                    remaining = None if deadline is None else deadline - time.perf_counter()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(
+                            f"No Mechanical instance became available within {timeout} seconds."
+                        )
+                    if any(is_locked(index) for index in self._ready):
+                        # unlocking an instance does not notify the waiters
+                        remaining = min(remaining or LOCKED_POLL_INTERVAL, LOCKED_POLL_INTERVAL)
+                    self._condition.wait(remaining)
+            finally:
+                del self._wait_starts[waiter]
+
+            if not remove:
+                # like the first instance found when scanning the pool
+                return min(
+                    index for index in self._ready if is_available(index) and not is_locked(index)
+                )
+            wait = time.perf_counter() - time_start
+            self._n_acquired += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            if prefer is not None and prefer(index):
+                self._n_preferred += 1
+            self._ready.remove(index)
+            return index
+
+    def acquire(
+        self,
+        timeout=None,
+        is_available=lambda index: True,
+        prefer=None,
+        strict=False,
+        is_locked=lambda index: False,
+    ):
+        """Take an idle instance from the queue, waiting until one is available.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait. The default is ``None``, in which
+            case there is no limit.
+        is_available : callable, optional
+            Function that checks whether the instance with a given index can
+            still run work. Instances that cannot are removed from the queue.
+        prefer : callable, optional
+            Function that checks whether the instance with a given index is
+            preferred. The default is ``None``. An idle preferred instance is
+            taken first, and otherwise the instance idle the longest is taken.
+        strict : bool, optional
+            Whether to wait for a preferred instance instead of taking another
+            one. The default is ``False``.
+        is_locked : callable, optional
+            Function that checks whether the instance with a given index is locked
+            by its user. Locked instances are skipped but stay in the queue.
+
+        Returns
+        -------
+        int
+            Index of the instance.
+        """
+        return self._wait(
+            timeout, is_available, remove=True, prefer=prefer, strict=strict, is_locked=is_locked
+        )
+
+    def peek(self, timeout=None, is_available=lambda index: True, is_locked=lambda index: False):
+        """Wait until an idle instance is available and return it without taking it.
+
+        See :meth:`acquire` for a description of the parameters.
+        """
+        return self._wait(timeout, is_available, remove=False, is_locked=is_locked)
+
+    def discard(self, index):
+        """Remove an idle instance from the queue.
+
+        Returns
+        -------
+        bool
+            Whether the instance was idle.
+        """
+        with self._condition:
+            if index not in self._ready:
+                return False
+            self._ready.remove(index)
+            return True
+
+    def retire_idle(self, ttl, max_count):
+        """Remove the instances that have been idle for a given time from the queue.
+
+        Parameters
+        ----------
+        ttl : float
+            Minimum time in seconds that an instance must have been idle.
+        max_count : int
+            Maximum number of instances to remove.
+
+        Returns
+        -------
+        list[int]
+            Indices of the removed instances, starting with the one idle the longest.
+        """
+        with self._condition:
+            now = time.perf_counter()
+            expired = sorted(
+                (index for index in self._ready if now - self._idle_since[index] >= ttl),
+                key=self._idle_since.get,
+            )[: max(max_count, 0)]
+            for index in expired:
+                self._ready.remove(index)
+            return expired
+
+    def close(self):
+        """Wake up the callers waiting for an instance and make them fail."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    @property
+    def metrics(self):
+        """Snapshot of the scheduling metrics."""
+        with self._condition:
+            now = time.perf_counter()
+            return PoolMetrics(
+                len(self._ready),
+                len(self._wait_starts),
+                self._n_acquired,
+                self._total_wait,
+                self._max_wait,
+                max((now - start for start in self._wait_starts.values()), default=0.0),
+                self._n_preferred,
+            )
+
+
+class JobTimings:
+    """Breakdown of the time that a job of a pool took.
+
+    Parameters
+    ----------
+    queued : float
+        Time in seconds from the submission of the job until an instance
+        started running it.
+    run : float or None
+        Time in seconds that the instance ran the job, or ``None`` if the job
+        was cancelled before it started.
+    """
+
+    def __init__(self, queued, run):
+        """Initialize the job timings."""
+        self.queued = queued
+        self.run = run
+
+    @property
+    def total(self):
+        """Total time in seconds from the submission of the job until its end."""
+        return self.queued + (self.run or 0.0)
+
+    def __repr__(self):
+        """Get the string representation of the job timings."""
+        run = "None" if self.run is None else f"{self.run:.3f}"
+        return f"JobTimings(queued={self.queued:.3f}, run={run})"
+
+
+class QueueWaits:
+    """Time that the jobs of a priority class waited before they started.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of jobs that started.
+    total_wait : float
+        Total time in seconds from the submission of the jobs until they started.
+    max_wait : float
+        Longest time in seconds that a job waited.
+    """
+
+    def __init__(self, n_jobs=0, total_wait=0.0, max_wait=0.0):
+        """Initialize the wait times."""
+        self.n_jobs = n_jobs
+        self.total_wait = total_wait
+        self.max_wait = max_wait
+
+    def record(self, wait):
+        """Record the wait time in seconds of a job."""
+        self.n_jobs += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    @property
+    def mean_wait(self):
+        """Average time in seconds that the jobs waited."""
+        if not self.n_jobs:
+            return 0.0
+        return self.total_wait / self.n_jobs
+
+    def __repr__(self):
+        """Get the string representation of the wait times."""
+        return (
+            f"QueueWaits(n_jobs={self.n_jobs}, mean_wait={self.mean_wait:.3f}, "
+            f"max_wait={self.max_wait:.3f})"
+        )
+
+
+class _JobQueue:
+    """Queue of the jobs of a pool, by priority and with weighted fair sharing.
+
+    Jobs of a higher priority run first. Within a priority, the tenants that
+    submitted jobs share the pool in proportion to their weights: each tenant
+    has a virtual time that advances by the inverse of its weight for each job
+    that it runs, and the next job is taken from the tenant with the earliest
+    virtual time. Jobs of a tenant run in the order in which they were submitted.
+    """
+
+    def __init__(self, weights=None):
+        self.weights = dict(weights or {})
+        self._lock = threading.Lock()
+        self._queues = {}
+        self._n_queued = {}
+        self._virtual_time = {}
+        self._clock = 0.0
+
+    def put(self, job, priority=0, tenant=None):
+        """Queue a job."""
+        with self._lock:
+            if not self._n_queued.get(tenant):
+                # a tenant that was idle does not get credit for the time it was idle
+                self._virtual_time[tenant] = max(self._virtual_time.get(tenant, 0.0), self._clock)
+            self._n_queued[tenant] = self._n_queued.get(tenant, 0) + 1
+            self._queues.setdefault(priority, {}).setdefault(tenant, deque()).append(job)
+
+    def get(self):
+        """Take the next job, or return ``None`` if the queue is empty."""
+        with self._lock:
+            if not self._queues:
+                return None
+            priority = max(self._queues)
+            tenants = self._queues[priority]
+            tenant = min(tenants, key=self._virtual_time.__getitem__)
+            jobs = tenants[tenant]
+            job = jobs.popleft()
+            if not jobs:
+                del tenants[tenant]
+                if not tenants:
+                    del self._queues[priority]
+            self._n_queued[tenant] -= 1
+            self._clock = self._virtual_time[tenant]
+            self._virtual_time[tenant] += 1.0 / self.weights.get(tenant, 1.0)
+            return job
+
+    def clear(self):
+        """Remove all jobs and return them."""
+        with self._lock:
+            jobs = [
+                job
+                for tenants in self._queues.values()
+                for tenant_jobs in tenants.values()
+                for job in tenant_jobs
+            ]
+            self._queues = {}
+            self._n_queued = {}
+            return jobs
+
+    def __len__(self):
+        """Get the number of queued jobs."""
+        with self._lock:
+            return sum(self._n_queued.values())
+
+
+class _PoolFuture(Future):
+    """Future of a job of a pool, with the index of its input and its timings."""
+
+    def __init__(self, index=None, priority=0):
+        super().__init__()
+        self.index = index
+        self.priority = priority
+        self._finish_lock = threading.Lock()
+        self._submitted = time.perf_counter()
+        self._started = None
+        self._finished = None
+
+    def start(self):
+        """Record that an instance started running the job."""
+        self._started = time.perf_counter()
+
+    def finish(self, result=None, exception=None):
+        """Set the outcome of the job unless it already has one.
+
+        Returns
+        -------
+        bool
+            Whether the outcome was set.
+        """
+        with self._finish_lock:
+            if self.done():
+                return False
+            self._finished = time.perf_counter()
+            if exception is None:
+                self.set_result(result)
+            else:
+                self.set_exception(exception)
+            return True
+
+    @property
+    def timings(self):
+        """Timings of the job."""
+        end = self._finished or time.perf_counter()
+        if self._started is None:
+            return JobTimings(end - self._submitted, None)
+        return JobTimings(self._started - self._submitted, end - self._started)
+
+
+class _InstanceHealth:
+    """Number of jobs and job latency of an instance of a pool."""
+
+    def __init__(self):
+        self.n_jobs = 0
+        self.baseline = None
+        self.latency = None
+        self._first_latencies = []
+
+    def record(self, latency):
+        """Record the run time of a job in seconds."""
+        self.n_jobs += 1
+        if self.baseline is None:
+            self._first_latencies.append(latency)
+            if len(self._first_latencies) == LATENCY_BASELINE_JOBS:
+                self.baseline = sum(self._first_latencies) / LATENCY_BASELINE_JOBS
+                self.latency = self.baseline
+        else:
+            self.latency += LATENCY_SMOOTHING * (latency - self.latency)
+
+
+class _LaunchThrottle:
+    """Limit the number of Mechanical instances that launch at a time.
+
+    Parameters
+    ----------
+    concurrency : int or None
+        Maximum number of launches at a time, or ``None`` for no limit.
+    stagger : float
+        Minimum time in seconds between the starts of two launches.
+    """
+
+    def __init__(self, concurrency=None, stagger=0.0):
+        self._semaphore = None if concurrency is None else threading.Semaphore(concurrency)
+        self._stagger = stagger
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def __enter__(self):
+        """Wait for a launch slot and return the time in seconds that it took."""
+        time_start = time.perf_counter()
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        if self._stagger:
+            with self._lock:
+                start = max(time.perf_counter(), self._next_start)
+                self._next_start = start + self._stagger
+            time.sleep(max(start - time.perf_counter(), 0))
+        return time.perf_counter() - time_start
+
+    def __exit__(self, *exc_info):
+        """Free the launch slot."""
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+class _Watchdog:
+    """Single thread that enforces the deadlines of the jobs of a pool."""
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._deadlines = []
+        self._counter = itertools.count()
+        self._thread = None
+
+    def schedule(self, timeout, callback):
+        """Call a function after a timeout unless the returned entry is cancelled."""
+        entry = [time.monotonic() + timeout, next(self._counter), callback]
+        with self._condition:
+            heapq.heappush(self._deadlines, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="Mechanical_Pool_Watchdog", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+        return entry
+
+    def cancel(self, entry):
+        """Cancel the callback of an entry."""
+        with self._condition:
+            entry[2] = None
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    while self._deadlines and self._deadlines[0][2] is None:
+                        heapq.heappop(self._deadlines)
+                    if not self._deadlines:
+                        self._condition.wait()
+                        continue
+                    wait = self._deadlines[0][0] - time.monotonic()
+                    if wait <= 0:
+                        callback = heapq.heappop(self._deadlines)[2]
+                        break
+                    self._condition.wait(wait)
+            try:
+                callback()
+            except Exception as error:  # pragma: no cover
+                LOG.error(f"Failed to stop a job that timed out: {error}")
+
+
 class LocalMechanicalPool:
     """Create a pool of Mechanical instances.
 
@@ -89,6 +659,51 @@ class LocalMechanicalPool:
     restart_failed : bool, optional
         Whether to restart any failed instances in the pool. The default is
         ``True``.
+    max_instances : int, optional
+        Maximum number of instances in the pool. The default is ``None``, in
+        which case the pool always has ``n_instance`` instances. If greater than
+        ``n_instance``, the pool is elastic: it starts with ``n_instance``
+        instances, starts more instances when jobs wait for one, and stops the
+        instances that are idle for ``idle_ttl`` seconds down to ``n_instance``.
+    idle_ttl : float, optional
+        Time in seconds after which an elastic pool stops an idle instance. The
+        default is ``300.0``.
+    scale_up_queue_depth : int, optional
+        Number of jobs waiting for an instance from which an elastic pool starts
+        more instances. The default is ``2``.
+    scale_up_wait : float, optional
+        Time in seconds that a job can wait for an instance before an elastic
+        pool starts more instances. The default is ``5.0``.
+    n_standby : int, optional
+        Number of warm standby instances. The default is ``0``. Standby instances
+        are launched, connected, and cleared in the background, and they replace
+        failed instances, or grow an elastic pool, without waiting for a launch.
+    recycle_after_jobs : int, optional
+        Number of jobs after which an instance is replaced. The default is
+        ``None``, in which case instances are not recycled after a number of jobs.
+    recycle_memory : int, optional
+        Resident memory in bytes of the Mechanical process above which an
+        instance is replaced after a job. The default is ``None``.
+    recycle_latency_factor : float, optional
+        Factor by which the average run time of the jobs of an instance can
+        grow from its baseline, which is the average run time of its first
+        five jobs, before the instance is replaced. The default is ``None``.
+    affinity_wait : float, optional
+        Time in seconds that a job with an affinity key waits for the busy
+        instance holding the state of its key before it runs on another
+        instance. The default is ``1.0``.
+    tenant_weights : dict, optional
+        Weight of each tenant that submits jobs to the pool. The default is
+        ``None``, in which case all tenants have a weight of ``1``. Within a
+        priority, tenants run a number of jobs proportional to their weights.
+    launch_concurrency : int, optional
+        Maximum number of instances that launch at a time. The default is
+        ``None``, in which case all instances launch at the same time. Launching
+        many instances at once can be slower than a throttled launch because
+        the launches contend for the disk, the CPU, and the licenses.
+    launch_stagger : float, optional
+        Minimum time in seconds between the starts of two launches. The default
+        is ``0.0``.
     **kwargs : dict, optional
         Additional keyword arguments. For a list of all keyword
         arguments, use the :func:`ansys.mechanical.core.launch_mechanical`
@@ -126,6 +741,23 @@ class LocalMechanicalPool:
     >>> pool = LocalMechanicalPool(10, version="252")
     Creating Pool: 100%|########| 10/10 [00:01<00:00,  1.43it/s]
 
+    Create an elastic pool that grows from 2 to 10 instances when jobs wait
+    and that stops the instances idle for more than a minute.
+
+    >>> pool = LocalMechanicalPool(2, max_instances=10, idle_ttl=60)
+    Creating Pool: 100%|########| 2/2 [00:01<00:00,  1.43it/s]
+
+    Create a pool that keeps two instances ready to replace failed ones.
+
+    >>> pool = LocalMechanicalPool(10, n_standby=2)
+    Creating Pool: 100%|########| 10/10 [00:01<00:00,  1.43it/s]
+
+    Create a pool that replaces its instances every 100 jobs, or when they use
+    more than 8 GB of memory.
+
+    >>> pool = LocalMechanicalPool(10, recycle_after_jobs=100, recycle_memory=8 * 1024**3)
+    Creating Pool: 100%|########| 10/10 [00:01<00:00,  1.43it/s]
+
     """
 
     def __init__(
@@ -135,6 +767,18 @@ class LocalMechanicalPool:
         port=MECHANICAL_DEFAULT_PORT,
         progress_bar=True,
         restart_failed=True,
+        max_instances=None,
+        idle_ttl=300.0,
+        scale_up_queue_depth=2,
+        scale_up_wait=5.0,
+        n_standby=0,
+        recycle_after_jobs=None,
+        recycle_memory=None,
+        recycle_latency_factor=None,
+        affinity_wait=1.0,
+        tenant_weights=None,
+        launch_concurrency=None,
+        launch_stagger=0.0,
         **kwargs,
     ):
         """Initialize several Mechanical instances.
@@ -155,6 +799,42 @@ class LocalMechanicalPool:
             is ``True``, but the progress bar is not shown when ``wait=False``.
         restart_failed : bool, optional
             Whether to restart any failed instances. The default is ``True``.
+        max_instances : int, optional
+            Maximum number of instances in an elastic pool. The default is
+            ``None``, in which case the number of instances is fixed.
+        idle_ttl : float, optional
+            Time in seconds after which an elastic pool stops an idle instance.
+            The default is ``300.0``.
+        scale_up_queue_depth : int, optional
+            Number of waiting jobs from which an elastic pool starts more
+            instances. The default is ``2``.
+        scale_up_wait : float, optional
+            Time in seconds that a job can wait before an elastic pool starts
+            more instances. The default is ``5.0``.
+        n_standby : int, optional
+            Number of warm standby instances. The default is ``0``.
+        recycle_after_jobs : int, optional
+            Number of jobs after which an instance is replaced. The default is
+            ``None``.
+        recycle_memory : int, optional
+            Resident memory in bytes above which an instance is replaced. The
+            default is ``None``.
+        recycle_latency_factor : float, optional
+            Factor by which the run time of the jobs of an instance can grow
+            from its baseline before the instance is replaced. The default is
+            ``None``.
+        affinity_wait : float, optional
+            Time in seconds that a job waits for the busy instance holding the
+            state of its affinity key. The default is ``1.0``.
+        tenant_weights : dict, optional
+            Weight of each tenant that submits jobs to the pool. The default is
+            ``None``, in which case all tenants have a weight of ``1``.
+        launch_concurrency : int, optional
+            Maximum number of instances that launch at a time. The default is
+            ``None``, in which case there is no limit.
+        launch_stagger : float, optional
+            Minimum time in seconds between the starts of two launches. The
+            default is ``0.0``.
         **kwargs : dict, optional
             Additional keyword arguments. For a list of all additional keyword
             arguments, see the :func:`ansys.mechanical.core.launch_mechanical`
@@ -169,6 +849,7 @@ class LocalMechanicalPool:
         self._instances = []
         self._spawn_kwargs = kwargs
         self._remote = False
+        self._scheduler = PoolScheduler()
 
         # Verify that Mechanical is 2023R2 or newer
         exec_file = None
@@ -206,6 +887,26 @@ class LocalMechanicalPool:
         n_instances = int(n_instances)
         if n_instances < 2:
             raise ValueError("You must request at least two instances to create a pool.")
+        max_instances = n_instances if max_instances is None else int(max_instances)
+        if max_instances < n_instances:
+            raise ValueError("'max_instances' must be at least the number of instances.")
+        self._min_instances = n_instances
+        self._max_instances = max_instances
+        self._idle_ttl = idle_ttl
+        self._scale_up_queue_depth = scale_up_queue_depth
+        self._scale_up_wait = scale_up_wait
+        self._n_standby = n_standby
+        self._standby = deque()
+        self._standby_taken = threading.Event()
+        self._last_port = port - 1 if ports is None else ports[-1]
+        self._port_lock = threading.Lock()
+        self._recycle_after_jobs = recycle_after_jobs
+        self._recycle_memory = recycle_memory
+        self._recycle_latency_factor = recycle_latency_factor
+        if launch_concurrency is not None and launch_concurrency < 1:
+            raise ValueError("'launch_concurrency' must be at least 1.")
+        self._launch_throttle = _LaunchThrottle(launch_concurrency, launch_stagger)
+        self._init_jobs(max_instances, affinity_wait, tenant_weights)
 
         pbar = None
         if wait and progress_bar:
@@ -217,8 +918,8 @@ class LocalMechanicalPool:
 
             pbar = tqdm(total=n_instances, desc="Creating Pool")
 
-        # initialize a list of dummy instances
-        self._instances = [None for _ in range(n_instances)]
+        # initialize a list of dummy instances, with room for an elastic pool to grow
+        self._instances = [None for _ in range(max_instances)]
 
         if self._remote:  # pragma: no cover
             threads = [
@@ -246,10 +947,31 @@ class LocalMechanicalPool:
         # monitor pool if requested
         if restart_failed:
             self._pool_monitor_thread = self._monitor_pool(name="Monitoring_Thread started")
+        if max_instances > n_instances:
+            self._autoscale_thread = self._autoscale(name="Autoscaling_Thread started")
+        if n_standby:
+            self._standby_thread = self._maintain_standby(name="Standby_Thread started")
 
         if not self._remote:
             self._verify_unique_ports()
 
+    def _init_jobs(self, n_workers, affinity_wait, tenant_weights):
+        """Set up the queue of the jobs of the pool and the workers that run them."""
+        self._health = weakref.WeakKeyDictionary()
+        self._affinity = weakref.WeakKeyDictionary()
+        self._affinity_wait = affinity_wait
+        self._jobs = _JobQueue()
+        for tenant, weight in (tenant_weights or {}).items():
+            self.set_tenant_weight(tenant, weight)
+        self._queue_waits = {}
+        self._queue_waits_lock = threading.Lock()
+
+        # one worker per instance runs the jobs of map() and run_batch()
+        self._executor = ThreadPoolExecutor(
+            max_workers=n_workers, thread_name_prefix="Mechanical_Pool"
+        )
+        self._watchdog = _Watchdog()
+
     def _verify_unique_ports(self):
         if self._remote:  # pragma: no cover
             raise RuntimeError("PyPIM is used. Port information is not available.")
@@ -266,9 +988,15 @@ class LocalMechanicalPool:
         close_when_finished=False,
         timeout=None,
         wait=True,
+        affinity=None,
+        priority=0,
+        tenant=None,
     ):
         """Run a user-defined function on each Mechanical instance in the pool.
 
+        The iterations run on a fixed set of worker threads, one for each
+        instance in the pool.
+
         Parameters
         ----------
         func : function
@@ -292,20 +1020,32 @@ class LocalMechanicalPool:
             Maximum runtime in seconds for each iteration. The default is
             ``None``, in which case there is no timeout. If you specify a
             value, each iteration is allowed to run only this number of
-            seconds. Once this value is exceeded, the batch process is
-            stopped and treated as a failure.
+            seconds. Once this value is exceeded, the instance running the
+            iteration is stopped and the iteration is treated as a failure.
         wait : bool, optional
             Whether block execution must wait until the batch process is
             complete. The default is ``True``.
+        affinity : callable, optional
+            Function that gets the affinity key of an iteration from its arguments,
+            such as the hash of the geometry that the iteration loads. The default
+            is ``None``. An iteration runs preferably on an idle instance whose
+            last iteration had the same key, in which case Mechanical is not
+            cleared at its start and the function can reuse the loaded state.
+        priority : int, optional
+            Priority of the iterations. The default is ``0``. Queued iterations
+            of a higher priority start before the ones of a lower priority.
+        tenant : hashable, optional
+            Tenant that submits the iterations, such as the name of a team. The
+            default is ``None``. Within a priority, tenants share the pool in
+            proportion to their weights.
 
         Returns
         -------
         list
-            A list containing the return values for the function.
-            Failed runs do not return an output. Because return values
-            are not necessarily in the same order as the iterable,
-            you might want to add some sort of tracker to the return
-            of your function.
+            A list containing the return values for the function, in the
+            order of the iterable. Failed runs do not return an output.
+            If ``wait=False``, a list of ``concurrent.futures.Future``
+            objects for the iterations, in the order of the iterable.
 
         Examples
         --------
@@ -331,8 +1071,6 @@ class LocalMechanicalPool:
             if not all(v is None for v in self._instances):
                 raise RuntimeError("No Mechanical instances available.")
 
-        results = []
-
         if iterable is not None:
             jobs_count = len(iterable)
         else:
@@ -348,90 +1086,234 @@ class LocalMechanicalPool:
 
             pbar = tqdm(total=jobs_count, desc="Mechanical Running")
 
-        @threaded_daemon
-        def func_wrapper(obj, func, clear_at_start, timeout, args=None, name=""):
-            """Expect obj to be an instance of Mechanical."""
-            LOG.debug(name)
-            complete = [False]
-
-            @threaded_daemon
-            def run(name_local=""):
-                LOG.debug(name_local)
-
-                if clear_at_start:
-                    obj.clear()
-
-                if args is not None:
-                    if isinstance(args, (tuple, list)):
-                        results.append(func(obj, *args))
-                    else:
-                        results.append(func(obj, args))
-                else:
-                    results.append(func(obj))
-
-                complete[0] = True
-
-            run_thread = run(name_local=name)
+        if iterable is not None:
+            futures = [
+                self._submit(
+                    func,
+                    args,
+                    clear_at_start,
+                    timeout,
+                    affinity=affinity,
+                    priority=priority,
+                    tenant=tenant,
+                )
+                for args in iterable
+            ]
+        else:  # simply apply to all
+            futures = [
+                self._submit(
+                    func, None, clear_at_start, timeout, instance, priority=priority, tenant=tenant
+                )
+                for instance in self
+            ]
 
-            if timeout:  # pragma: no cover
-                time_start = time.time()
-                while not complete[0]:
-                    time.sleep(0.01)
-                    if (time.time() - time_start) > timeout:
-                        break
+        if pbar:
+            for future in futures:
+                future.add_done_callback(lambda future: pbar.update(1))
 
-                if not complete[0]:
-                    LOG.error(f"Stopped instance due to a timeout of {timeout} seconds.")
-                    obj.exit()
+        if close_when_finished:  # pragma: no cover
+            if wait:
+                self._close_when_done(futures)
             else:
-                run_thread.join()
-                if not complete[0]:  # pragma: no cover
-                    LOG.error("Stopped instance because running failed.")
-                    try:
-                        obj.exit()
-                    except Exception as e:
-                        LOG.error(f"Unexpected error while exiting: {e}")
+                threaded_daemon(self._close_when_done)(futures, name="Map_Close_Thread")
+
+        if not wait:
+            return futures
+
+        wait_futures(futures)
+        if pbar:
+            pbar.close()
+        # failed runs do not return an output
+        return [
+            future.result()
+            for future in futures
+            if not future.cancelled() and not future.exception()
+        ]
+
+    def iter_results(
+        self,
+        func,
+        iterable,
+        clear_at_start=True,
+        timeout=None,
+        max_pending=None,
+        affinity=None,
+        priority=0,
+        tenant=None,
+    ):
+        """Run a user-defined function on the pool and yield each outcome as it completes.
 
-            obj.locked = False
-            if pbar:
-                pbar.update(1)
+        Inputs are taken from the iterable only as instances become free, so
+        that large sweeps, including ones over generators, use a constant
+        amount of memory.
 
-        threads = []
-        if iterable is not None:
-            for args in iterable:
-                # grab the next available instance of mechanical
-                instance, i = self.next_available(return_index=True)
-                instance.locked = True
-
-                threads.append(
-                    func_wrapper(
-                        instance, func, clear_at_start, timeout, args, name=f"Map_Thread{i}"
-                    )
-                )
-        else:  # simply apply to all
-            for instance in self._instances:
-                if instance:
-                    threads.append(
-                        func_wrapper(instance, func, clear_at_start, timeout, name=f"Map_Thread")
+        Parameters
+        ----------
+        func : function
+            Function with ``mechanical`` as the first argument. The subsequent
+            arguments should match the number of items in each iterable.
+        iterable : iterable
+            An iterable containing a set of arguments for the function.
+        clear_at_start : bool, optional
+            Clear Mechanical at the start of execution. The default is
+            ``True``. Setting this to ``False`` might lead to instability.
+        timeout : float, optional
+            Maximum runtime in seconds for each iteration. The default is
+            ``None``, in which case there is no timeout. Once this value is
+            exceeded, the instance is stopped and the iteration fails with
+            a ``TimeoutError``.
+        max_pending : int, optional
+            Maximum number of iterations that are submitted but not complete
+            at a time. The default is ``None``, in which case it is twice the
+            number of instances in the pool.
+        affinity : callable, optional
+            Function that gets the affinity key of an iteration from its arguments,
+            such as the hash of the geometry that the iteration loads. The default
+            is ``None``. An iteration runs preferably on an idle instance whose
+            last iteration had the same key, in which case Mechanical is not
+            cleared at its start and the function can reuse the loaded state.
+        priority : int, optional
+            Priority of the iterations. The default is ``0``. Queued iterations
+            of a higher priority start before the ones of a lower priority.
+        tenant : hashable, optional
+            Tenant that submits the iterations, such as the name of a team. The
+            default is ``None``. Within a priority, tenants share the pool in
+            proportion to their weights.
+
+        Yields
+        ------
+        tuple
+            Index of the input in the iterable, return value of the function or
+            exception raised by the iteration, and :class:`JobTimings` of the
+            iteration, in the order in which the iterations finish. Iterations
+            that have not started are cancelled if the iteration over the
+            outcomes stops early.
+
+        Examples
+        --------
+        Save the results of a sweep as they come.
+
+        >>> def function(mechanical, script):
+        ...     return mechanical.run_python_script(script)
+        >>> inputs = (f"{index}*2" for index in range(10000))
+        >>> for index, output, timings in pool.iter_results(function, inputs):
+        ...     if isinstance(output, Exception):
+        ...         print(f"input {index} failed after {timings.run:.1f} s: {output}")
+        ...     else:
+        ...         save(index, output)
+        """
+        if max_pending is None:
+            max_pending = 2 * len(self._instances)
+        if max_pending < 1:
+            raise ValueError("'max_pending' must be at least 1.")
+
+        inputs = enumerate(iterable)
+        pending = set()
+        try:
+            while True:
+                for index, args in itertools.islice(inputs, max_pending - len(pending)):
+                    pending.add(
+                        self._submit(
+                            func,
+                            args,
+                            clear_at_start,
+                            timeout,
+                            index=index,
+                            affinity=affinity,
+                            priority=priority,
+                            tenant=tenant,
+                        )
                     )
+                if not pending:
+                    return
+                done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda future: future.index):
+                    if future.cancelled():
+                        outcome = CancelledError()
+                    else:
+                        outcome = future.exception()
+                        if outcome is None:
+                            outcome = future.result()
+                    yield future.index, outcome, future.timings
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def imap_unordered(
+        self,
+        func,
+        iterable,
+        clear_at_start=True,
+        timeout=None,
+        affinity=None,
+        priority=0,
+        tenant=None,
+    ):
+        """Run a user-defined function on the pool and yield the results as they complete.
 
-        if close_when_finished:  # pragma: no cover
-            # start closing any instances that are not in execution
-            while not all(v is None for v in self._instances):
-                # grab the next available instance of mechanical and close it
-                instance, i = self.next_available(return_index=True)
-                self._instances[i] = None
+        Unlike the :meth:`map` method, results are available as soon as each
+        iteration finishes. To also get the failures and the timings of the
+        iterations, use the :meth:`iter_results` method.
 
-                try:
-                    instance.exit()
-                except Exception as error:  # pragma: no cover
-                    LOG.error(f"Failed to close instance : str{error}.")
-        else:
-            # wait for all threads to complete
-            if wait:
-                [thread.join() for thread in threads]
+        Parameters
+        ----------
+        func : function
+            Function with ``mechanical`` as the first argument. The subsequent
+            arguments should match the number of items in each iterable.
+        iterable : iterable
+            An iterable containing a set of arguments for the function.
+        clear_at_start : bool, optional
+            Clear Mechanical at the start of execution. The default is
+            ``True``. Setting this to ``False`` might lead to instability.
+        timeout : float, optional
+            Maximum runtime in seconds for each iteration. The default is
+            ``None``, in which case there is no timeout. Once this value is
+            exceeded, the instance is stopped and the iteration is treated
+            as a failure.
+        affinity : callable, optional
+            Function that gets the affinity key of an iteration from its arguments,
+            such as the hash of the geometry that the iteration loads. The default
+            is ``None``. An iteration runs preferably on an idle instance whose
+            last iteration had the same key, in which case Mechanical is not
+            cleared at its start and the function can reuse the loaded state.
+        priority : int, optional
+            Priority of the iterations. The default is ``0``. Queued iterations
+            of a higher priority start before the ones of a lower priority.
+        tenant : hashable, optional
+            Tenant that submits the iterations, such as the name of a team. The
+            default is ``None``. Within a priority, tenants share the pool in
+            proportion to their weights.
+
+        Yields
+        ------
+        object
+            Return value of the function for each iteration, in the order in
+            which the iterations finish. Failed runs do not return an output.
+            The iterations that have not started are cancelled if the iteration
+            over the results stops early.
 
-        return results
+        Examples
+        --------
+        >>> def function(mechanical, name, script):
+        ...     return name, mechanical.run_python_script(script)
+        >>> inputs = [("first", "2+3"), ("second", "3+4")]
+        >>> for name, output in pool.imap_unordered(function, inputs):
+        ...     print(name, output)
+        second 7
+        first 5
+        """
+        outcomes = self.iter_results(
+            func,
+            iterable,
+            clear_at_start,
+            timeout,
+            affinity=affinity,
+            priority=priority,
+            tenant=tenant,
+        )
+        for _, outcome, _ in outcomes:
+            if not isinstance(outcome, BaseException):
+                yield outcome
 
     def run_batch(
         self,
@@ -441,6 +1323,8 @@ class LocalMechanicalPool:
         close_when_finished=False,
         timeout=None,
         wait=True,
+        priority=0,
+        tenant=None,
     ):
         """Run a batch of input files on the Mechanical instances in the pool.
 
@@ -468,15 +1352,21 @@ class LocalMechanicalPool:
         wait : bool, optional
             Whether block execution must wait until the batch process is complete.
             The default is ``True``.
+        priority : int, optional
+            Priority of the batch runs. The default is ``0``. Queued batch runs
+            of a higher priority start before the ones of a lower priority.
+        tenant : hashable, optional
+            Tenant that submits the batch runs, such as the name of a team. The
+            default is ``None``. Within a priority, tenants share the pool in
+            proportion to their weights.
 
         Returns
         -------
         list
-            List of text outputs from Mechanical for each batch run. The outputs
-            are not necessarily listed in the order of the inputs. Failed runs do
-            not return an output. Because the return outputs are not
-            necessarily in the same order as ``iterable``, you might
-            want to add some sort of tracker or note within the input files.
+            List of text outputs from Mechanical for each batch run, in the order
+            of the input files. Failed runs do not return an output. If
+            ``wait=False``, a list of ``concurrent.futures.Future`` objects for
+            the batch runs.
 
         Examples
         --------
@@ -487,6 +1377,20 @@ class LocalMechanicalPool:
         >>> len(outputs)
         20
         """
+        return self.map(
+            self._batch_function(files, clear_at_start),
+            files,
+            progress_bar=progress_bar,
+            close_when_finished=close_when_finished,
+            timeout=timeout,
+            wait=wait,
+            priority=priority,
+            tenant=tenant,
+        )
+
+    @staticmethod
+    def _batch_function(files, clear_at_start):
+        """Get the function that runs an input file of a batch on an instance."""
         # check all files exist before running
         for filename in files:
             if not os.path.isfile(filename):
@@ -497,23 +1401,184 @@ class LocalMechanicalPool:
                 mechanical.clear()
             return mechanical.run_python_script_from_file(input_file)
 
-        return self.map(
-            run_file,
-            files,
-            progress_bar=progress_bar,
-            close_when_finished=close_when_finished,
-            timeout=timeout,
-            wait=wait,
+        return run_file
+
+    def set_tenant_weight(self, tenant, weight):
+        """Set the weight of a tenant that submits jobs to the pool.
+
+        Within a priority, tenants run a number of jobs proportional to their
+        weights. Tenants have a weight of ``1`` by default.
+
+        Parameters
+        ----------
+        tenant : hashable
+            Tenant, such as the name of a team.
+        weight : float
+            Weight of the tenant. It must be positive.
+
+        Examples
+        --------
+        Give the interactive jobs of the design team three times the share of the
+        pool of the jobs of the sweeps.
+
+        >>> pool.set_tenant_weight("design", 3)
+        >>> pool.set_tenant_weight("sweeps", 1)
+        """
+        if weight <= 0:
+            raise ValueError("The weight of a tenant must be positive.")
+        self._jobs.weights[tenant] = weight
+
+    def _submit(
+        self,
+        func,
+        args,
+        clear_at_start,
+        timeout,
+        instance=None,
+        index=None,
+        affinity=None,
+        priority=0,
+        tenant=None,
+    ):
+        """Submit a job to the executor of the pool.
+
+        The job is queued by priority and tenant. It runs on the next idle
+        instance, preferably one holding the state of its affinity key, or
+        on ``instance`` if given.
+
+        Returns
+        -------
+        _PoolFuture
+            Future of the return value of the function. It fails with a
+            ``TimeoutError`` as soon as the job exceeds ``timeout`` seconds.
+        """
+        future = _PoolFuture(index, priority)
+        key = None if affinity is None or args is None else affinity(args)
+        self._jobs.put(
+            (future, func, args, clear_at_start, timeout, instance, key), priority, tenant
         )
+        # each submission runs the most urgent queued job, which may be another one
+        self._executor.submit(self._run_next)
+        return future
+
+    def _run_next(self):
+        """Run the most urgent queued job."""
+        job = self._jobs.get()
+        if job is not None:
+            self._run_job(*job)
+
+    def _run_job(self, future, func, args, clear_at_start, timeout, instance, key=None):
+        """Run a job on an instance of the pool and set its future."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            obj = self.acquire(affinity=key) if instance is None else instance
+        except Exception as error:
+            future.finish(exception=error)
+            return
+        future.start()
+        with self._queue_waits_lock:
+            waits = self._queue_waits.setdefault(future.priority, QueueWaits())
+            waits.record(future.timings.queued)
+
+        watch = None
+        if timeout:
+            watch = self._watchdog.schedule(timeout, lambda: self._stop_job(future, obj, timeout))
+        try:
+            # the state of the previous job is reused if it has the same key
+            reuse = key is not None and self._affinity.get(obj) == key
+            if clear_at_start and not reuse:
+                obj.clear()
+            # the instance holds the state of the key of its last job
+            if key is None:
+                self._affinity.pop(obj, None)
+            else:
+                self._affinity[obj] = key
+            if args is None:
+                result = func(obj)
+            elif isinstance(args, (tuple, list)):
+                result = func(obj, *args)
+            else:
+                result = func(obj, args)
+        except Exception as error:
+            # if the job timed out, the instance is already stopped
+            if future.finish(exception=error):
+                LOG.error(f"Stopped instance because running failed: {error}")
+                try:
+                    self._exit_instance(obj)
+                except Exception as e:
+                    LOG.error(f"Unexpected error while exiting: {e}")
+        else:
+            if future.finish(result):
+                self._health.setdefault(obj, _InstanceHealth()).record(future.timings.run)
+        finally:
+            if watch is not None:
+                self._watchdog.cancel(watch)
+            if instance is None:
+                self.release(obj)
+
+    def _stop_job(self, future, obj, timeout):
+        """Fail a job that exceeded its timeout and stop its instance."""
+        error = TimeoutError(f"The job did not finish within {timeout} seconds.")
+        if future.finish(exception=error):
+            LOG.error(f"Stopped instance due to a timeout of {timeout} seconds.")
+            # stopping the instance can be slow, so it does not delay the other deadlines
+            threaded_daemon(self._exit_timed_out)(obj, name="Timeout_Exit_Thread")
+
+    def _exit_timed_out(self, instance, name=""):
+        """Stop an instance whose job timed out."""
+        LOG.debug(name)
+        try:
+            self._exit_instance(instance)
+        except Exception as error:
+            LOG.error(f"Failed to stop an instance that timed out: {error}")
 
-    def next_available(self, return_index=False):
-        """Wait until a Mechanical instance is available and return this instance.
+    def _close_when_done(self, futures, name=""):
+        """Close the instances of the pool once all futures are done."""
+        LOG.debug(name)
+        wait_futures(futures)
+        for i, instance in enumerate(self._instances):
+            if instance is None:
+                continue
+            self._instances[i] = None
+            try:
+                self._exit_instance(instance)
+            except Exception as error:  # pragma: no cover
+                LOG.error(f"Failed to close instance : str{error}.")
+
+    def _exit_instance(self, instance):
+        """Stop an instance of the pool."""
+        instance.exit()
+
+    def _is_available(self, index):
+        """Whether the instance at an index can run work."""
+        instance = self._instances[index]
+        return instance is not None and not instance._exited
+
+    def _is_locked(self, index):
+        """Whether the instance at an index is locked by its user."""
+        instance = self._instances[index]
+        return instance is not None and getattr(instance, "locked", False)
+
+    def acquire(self, timeout=None, return_index=False, affinity=None):
+        """Wait until a Mechanical instance is idle and reserve it.
+
+        The instance is locked until it is given back with the :meth:`release`
+        method. Callers wait in a queue without using any CPU.
 
         Parameters
         ----------
+        timeout : float, optional
+            Maximum time in seconds to wait for an instance. The default is
+            ``None``, in which case there is no limit.
         return_index : bool, optional
             Whether to return the index along with the instance. The default
             is ``False``.
+        affinity : hashable, optional
+            Affinity key of the state that the caller wants to reuse. The default
+            is ``None``. An instance whose last job run by the pool had the same
+            key is preferred, and if it is busy, the caller waits up to
+            ``affinity_wait`` seconds for it before taking another instance.
 
         Returns
         -------
@@ -524,47 +1589,162 @@ class LocalMechanicalPool:
             Index within the pool of Mechanical instances. This index
             is not returned by default.
 
+        Raises
+        ------
+        TimeoutError
+            If no instance became idle within the timeout.
+
         Examples
         --------
-        >>> mechanical = pool.next_available()
-        >>> mechanical
-        Ansys Mechanical [Ansys Mechanical Enterprise]
-        Product Version:252
-        Software build date: 06/13/2025 15:54:58
+        >>> mechanical = pool.acquire()
+        >>> try:
+        ...     mechanical.run_python_script("2+3")
+        ... finally:
+        ...     pool.release(mechanical)
+        '5'
         """
-        # loop until the next instance is available
-        while True:
-            for i, instance in enumerate(self._instances):
-                # if encounter placeholder
-                if not instance:  # pragma: no cover
-                    continue
+        prefer = None
+        if affinity is not None:
 
-                if not instance.locked and not instance._exited:
-                    # any instance that is not running or exited
-                    # should be available
-                    if not instance.busy:
-                        # double check that this instance is alive:
-                        try:
-                            instance._make_dummy_call()
-                        except:  # pragma: no cover
-                            instance.exit()
-                            continue
-
-                        if return_index:
-                            return instance, i
-                        else:
-                            return instance
-                    # review - not needed
-                    # else:
-                    #     instance._exited = True
+            def prefer(index):
+                return self._affinity.get(self._instances[index]) == affinity
 
-    def __del__(self):
-        """Clean up when complete."""
-        print("pool:Automatic clean up.")
-        self.exit()
+        index = self._acquire_index(timeout, prefer)
+        instance = self._instances[index]
+        instance.locked = True
+        if return_index:
+            return instance, index
+        return instance
 
-    def exit(self, block=False):
-        """Exit all Mechanical instances in the pool.
+    def _acquire_index(self, timeout=None, prefer=None):
+        """Take the index of an idle instance, preferably one for which ``prefer`` is true.
+
+        If a preferred instance is busy, the caller waits up to ``affinity_wait``
+        seconds for it before taking another instance.
+        """
+        index = None
+        if prefer is not None and any(
+            self._is_available(index) and prefer(index) for index in range(len(self._instances))
+        ):
+            wait = self._affinity_wait if timeout is None else min(self._affinity_wait, timeout)
+            time_start = time.perf_counter()
+            try:
+                index = self._scheduler.acquire(
+                    wait,
+                    is_available=self._is_available,
+                    prefer=prefer,
+                    strict=True,
+                    is_locked=self._is_locked,
+                )
+            except TimeoutError:
+                if timeout is not None:
+                    timeout = max(timeout - (time.perf_counter() - time_start), 0)
+
+        if index is None:
+            index = self._scheduler.acquire(
+                timeout, is_available=self._is_available, prefer=prefer, is_locked=self._is_locked
+            )
+        return index
+
+    def release(self, instance):
+        """Give back an instance reserved with the :meth:`acquire` method.
+
+        Instances that exited are not given back to the pool. They are replaced
+        by a standby instance if one is ready, or restarted by the pool monitor if
+        ``restart_failed=True``.
+
+        Parameters
+        ----------
+        instance : pymechanical.Mechanical
+            Instance of Mechanical.
+        """
+        for index, pool_instance in enumerate(self._instances):
+            if pool_instance is instance:
+                if not self._is_available(index) and self._active:
+                    # swap in a standby instance right away
+                    standby = self._take_standby()
+                    if standby is not None:
+                        LOG.debug(
+                            f"Replaced the instance at index {index} with a standby instance."
+                        )
+                        self._instances[index] = standby
+                elif self._active:
+                    reason = self._recycle_reason(instance)
+                    if reason is not None:
+                        # the instance is drained, as it runs no job
+                        LOG.info(f"Recycling the instance at index {index}: {reason}.")
+                        self._recycle(index, instance, name=f"Recycle_Thread{index}")
+                        break
+                if self._is_available(index):
+                    self._scheduler.put(index)
+                break
+        # the pool monitor restarts exited instances once they are unlocked
+        instance.locked = False
+
+    @property
+    def metrics(self):
+        """Scheduling metrics of the pool.
+
+        Returns
+        -------
+        PoolMetrics
+            Number of idle instances, number of callers waiting for an instance,
+            the time that callers waited, and the time that the jobs of each
+            priority waited before they started.
+
+        Examples
+        --------
+        >>> pool.metrics
+        PoolMetrics(n_idle=2, n_waiting=0, n_acquired=20, mean_wait=1.204, max_wait=3.871)
+        """
+        metrics = self._scheduler.metrics
+        with self._queue_waits_lock:
+            metrics.queue_waits = {
+                priority: QueueWaits(waits.n_jobs, waits.total_wait, waits.max_wait)
+                for priority, waits in self._queue_waits.items()
+            }
+        return metrics
+
+    def next_available(self, return_index=False):
+        """Wait until a Mechanical instance is available and return this instance.
+
+        The instance is not reserved. To reserve it, use the :meth:`acquire` method.
+
+        Parameters
+        ----------
+        return_index : bool, optional
+            Whether to return the index along with the instance. The default
+            is ``False``.
+
+        Returns
+        -------
+        pymechanical.Mechanical
+            Instance of Mechanical.
+
+        int
+            Index within the pool of Mechanical instances. This index
+            is not returned by default.
+
+        Examples
+        --------
+        >>> mechanical = pool.next_available()
+        >>> mechanical
+        Ansys Mechanical [Ansys Mechanical Enterprise]
+        Product Version:252
+        Software build date: 06/13/2025 15:54:58
+        """
+        index = self._scheduler.peek(is_available=self._is_available, is_locked=self._is_locked)
+        if return_index:
+            return self._instances[index], index
+        return self._instances[index]
+
+    def __del__(self):
+        """Clean up when complete."""
+        print("pool:Automatic clean up.")
+        self.exit()
+
+    def exit(self, block=False):
+        """Exit all Mechanical instances in the pool.
 
         Parameters
         ----------
@@ -577,32 +1757,38 @@ class LocalMechanicalPool:
         >>> pool.exit()
         """
         self._active = False  # Stops any active instance restart
+        if not hasattr(self, "_executor"):
+            # the constructor failed before the pool could start any instance
+            return
+        self._scheduler.close()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for job in self._jobs.clear():
+            job[0].cancel()
 
         @threaded
         def threaded_exit(index, instance_local):
             if instance_local:
                 try:
-                    instance_local.exit()
+                    self._exit_instance(instance_local)
                 except Exception as e:  # pragma: no cover
                     LOG.error(f"Error while exiting instance {str(instance_local)}: {str(e)}")
                 self._instances[index] = None
                 LOG.debug(f"Exited instance: {str(instance_local)}")
 
         threads = []
-        for i, instance in enumerate(self):
-            threads.append(threaded_exit(i, instance))
+        for i, instance in enumerate(self._instances):
+            if instance:
+                threads.append(threaded_exit(i, instance))
+        while self._standby:
+            standby = self._standby.popleft()
+            threads.append(threaded(lambda instance: instance.exit())(standby))
 
         if block:
             [thread.join() for thread in threads]
 
     def __len__(self):
         """Get the number of instances in the pool."""
-        count = 0
-        for instance in self._instances:
-            if instance:
-                if not instance._exited:
-                    count += 1
-        return count
+        return sum(self._is_available(index) for index in range(len(self._instances)))
 
     def __getitem__(self, key):
         """Get an instance by an index."""
@@ -630,7 +1816,11 @@ class LocalMechanicalPool:
             Name for the instance. The default is ``""``.
         """
         LOG.debug(name)
-        self._instances[index] = launch_mechanical(port=port, **self._spawn_kwargs)
+        instance = self._take_standby()
+        if instance is None:
+            instance = self._launch(port=port)
+        self._instances[index] = instance
+        self._scheduler.put(index)
         # LOG.debug("Spawned instance %d. Name '%s'", index, name)
         if pbar is not None:
             pbar.update(1)
@@ -650,11 +1840,172 @@ class LocalMechanicalPool:
 
         """
         LOG.debug(name)
-        self._instances[index] = launch_mechanical(**self._spawn_kwargs)
+        instance = self._take_standby()
+        if instance is None:
+            instance = self._launch()
+        self._instances[index] = instance
+        self._scheduler.put(index)
         # LOG.debug("Spawned instance %d. Name '%s'", index, name)
         if pbar is not None:
             pbar.update(1)
 
+    def _recycle_reason(self, instance):
+        """Get the reason to recycle an instance, or ``None`` if it is healthy."""
+        health = self._health.get(instance)
+        if health is not None:
+            if self._recycle_after_jobs and health.n_jobs >= self._recycle_after_jobs:
+                return f"it ran {health.n_jobs} jobs"
+            if (
+                self._recycle_latency_factor
+                and health.baseline
+                and health.latency > self._recycle_latency_factor * health.baseline
+            ):
+                return (
+                    f"its job latency of {health.latency:.3f} s drifted from its "
+                    f"baseline of {health.baseline:.3f} s"
+                )
+        if self._recycle_memory:
+            try:
+                memory = int(instance.run_python_script(PROCESS_MEMORY_SCRIPT))
+            except Exception as e:  # pragma: no cover
+                LOG.warning(f"Unable to get the memory usage of {str(instance)}: {str(e)}")
+            else:
+                if memory > self._recycle_memory:
+                    return f"it uses {memory} bytes of memory"
+        return None
+
+    @threaded_daemon
+    def _recycle(self, index, instance, name=""):
+        """Replace an idle instance with a new one and stop the idle instance.
+
+        Parameters
+        ----------
+        index : int
+            Index of the instance.
+        instance : pymechanical.Mechanical
+            Instance to replace. It must not be in the queue of idle instances.
+        name : str, optional
+            Name for the thread. The default is ``""``.
+        """
+        LOG.debug(name)
+        if self._remote:  # pragma: no cover
+            self._spawn_mechanical_remote(index, name=f"Instance {index}").join()
+        else:
+            self._spawn_mechanical(index, port=self._next_port(), name=f"Instance {index}").join()
+
+        if self._instances[index] is instance:  # pragma: no cover
+            # the replacement failed to start, so keep the instance in service
+            self._scheduler.put(index)
+            return
+        try:
+            instance.exit()
+        except Exception as e:  # pragma: no cover
+            LOG.error(f"Error while exiting instance {str(instance)}: {str(e)}")
+
+    def _launch(self, **kwargs):
+        """Launch an instance when the launch throttle of the pool allows it.
+
+        Parameters
+        ----------
+        **kwargs : dict, optional
+            Keyword arguments for the :func:`ansys.mechanical.core.launch_mechanical`
+            function, in addition to the ones of the pool.
+
+        Returns
+        -------
+        pymechanical.Mechanical
+            Instance of Mechanical.
+        """
+        with self._launch_throttle as queued:
+            instance = launch_mechanical(**kwargs, **self._spawn_kwargs)
+        if instance.startup_timings is not None:
+            instance.startup_timings.queued = queued
+        return instance
+
+    @property
+    def startup_timings(self):
+        """Breakdown of the time it took to start each instance of the pool.
+
+        Returns
+        -------
+        list[StartupTimings]
+            Startup timings of the instances, including the time that each launch
+            waited for its turn, or ``None`` for empty slots.
+
+        Examples
+        --------
+        >>> pool = LocalMechanicalPool(4, launch_concurrency=2)
+        >>> pool.startup_timings
+        [StartupTimings(queued=0.000, launch=0.011, channel_ready=20.912, app_ready=3.105),
+         StartupTimings(queued=0.000, launch=0.012, channel_ready=21.342, app_ready=3.174),
+         StartupTimings(queued=24.198, launch=0.010, channel_ready=14.006, app_ready=2.870),
+         StartupTimings(queued=24.530, launch=0.011, channel_ready=13.871, app_ready=2.912)]
+        """
+        return [
+            None if instance is None else instance.startup_timings for instance in self._instances
+        ]
+
+    def _next_port(self):
+        """Get a free port after all the ports that the pool has used.
+
+        Ports are never handed out twice, so instances that are still launching,
+        or that are moving from the standby instances to the pool, keep their port.
+        """
+        with self._port_lock:
+            port = available_ports(1, max(self.ports + [self._last_port]) + 1)[0]
+            self._last_port = port
+            return port
+
+    def _take_standby(self):
+        """Take a standby instance, or return ``None`` if none is ready."""
+        while True:
+            try:
+                instance = self._standby.popleft()
+            except IndexError:
+                return None
+            self._standby_taken.set()
+            if not instance._exited:
+                return instance
+
+    @threaded_daemon
+    def _maintain_standby(self, refresh=1.0, name=""):
+        """Keep ``n_standby`` instances launched, connected, and cleared.
+
+        Parameters
+        ----------
+        refresh : float, optional
+            Maximum time in seconds between two checks of the standby instances.
+            The default is ``1.0``.
+        name : str, optional
+            Name for the thread. The default is ``""``.
+        """
+        LOG.debug(name)
+        while self._active:
+            for instance in list(self._standby):
+                if instance._exited:  # pragma: no cover
+                    self._standby.remove(instance)
+            if len(self._standby) >= self._n_standby:
+                self._standby_taken.wait(refresh)
+                self._standby_taken.clear()
+                continue
+
+            try:
+                if self._remote:  # pragma: no cover
+                    instance = self._launch()
+                else:
+                    instance = self._launch(port=self._next_port())
+                instance.clear()
+            except Exception as e:  # pragma: no cover
+                LOG.error(e, exc_info=True)
+                time.sleep(refresh)
+                continue
+
+            if not self._active:  # pragma: no cover
+                instance.exit()
+                break
+            LOG.debug(f"Launched a standby instance: {str(instance)}")
+            self._standby.append(instance)
+
     @threaded_daemon
     def _monitor_pool(self, refresh=1.0, name=""):
         """Check for instances within a pool that have exited (failed) and restart them.
@@ -672,7 +2023,8 @@ class LocalMechanicalPool:
                 # encountered placeholder
                 if not instance:  # pragma: no cover
                     continue
-                if instance._exited:  # pragma: no cover
+                # a worker that still holds the instance replaces it when releasing it
+                if instance._exited and not instance.locked:  # pragma: no cover
                     try:
                         if self._remote:
                             LOG.debug(
@@ -681,7 +2033,7 @@ class LocalMechanicalPool:
                             self._spawn_mechanical_remote(index, name=f"Instance {index}").join()
                         else:
                             # use the next port after the current available port
-                            port = max(self.ports) + 1
+                            port = self._next_port()
                             LOG.debug(
                                 f"Restarting a Mechanical instance for index : "
                                 f"{index} on port: {port}."
@@ -693,6 +2045,65 @@ class LocalMechanicalPool:
                         LOG.error(e, exc_info=True)
             time.sleep(refresh)
 
+    @threaded_daemon
+    def _autoscale(self, refresh=0.5, name=""):
+        """Start instances when jobs wait for one, and stop the idle instances.
+
+        Parameters
+        ----------
+        refresh : float, optional
+            Time in seconds between two checks of the load of the pool.
+            The default is ``0.5``.
+        name : str, optional
+            Name for the thread. The default is ``""``.
+        """
+        LOG.debug(name)
+        spawning = {}
+        while self._active:
+            spawning = {index: thread for index, thread in spawning.items() if thread.is_alive()}
+            metrics = self._scheduler.metrics
+            n_live = len(self)
+
+            # start instances for the jobs that no instance being started will take
+            n_missing = metrics.n_waiting - len(spawning)
+            if n_missing > 0 and (
+                metrics.n_waiting >= self._scale_up_queue_depth
+                or metrics.current_wait >= self._scale_up_wait
+            ):
+                free = [
+                    index
+                    for index, instance in enumerate(self._instances)
+                    if instance is None and index not in spawning
+                ]
+                for index in free[:n_missing]:
+                    LOG.debug(f"Scaling up the pool with an instance at index : {index}.")
+                    try:
+                        if self._remote:  # pragma: no cover
+                            thread = self._spawn_mechanical_remote(index, name=f"Instance {index}")
+                        else:
+                            port = self._next_port()
+                            thread = self._spawn_mechanical(
+                                index, port=port, name=f"Instance {index}"
+                            )
+                    except Exception as e:  # pragma: no cover
+                        LOG.error(e, exc_info=True)
+                        break
+                    spawning[index] = thread
+
+            # stop the instances that were idle for too long
+            n_extra = n_live - self._min_instances
+            for index in self._scheduler.retire_idle(self._idle_ttl, n_extra):
+                instance = self._instances[index]
+                self._instances[index] = None
+                if instance is None:  # pragma: no cover
+                    continue
+                LOG.debug(f"Scaling down the pool by stopping the instance at index : {index}.")
+                try:
+                    instance.exit()
+                except Exception as e:  # pragma: no cover
+                    LOG.error(f"Error while exiting instance {str(instance)}: {str(e)}")
+            time.sleep(refresh)
+
     @property
     def ports(self):
         """Get a list of the ports that are used.
@@ -710,3 +2121,620 @@ class LocalMechanicalPool:
     def __str__(self):
         """Get the string representation of this object."""
         return "Mechanical pool with %d active instances" % len(self)
+
+
+class _InputFilesJob:
+    """Function of a job along with the local input files that it needs on its host."""
+
+    def __init__(self, func, input_files):
+        self.func = func
+        self.input_files = input_files
+
+
+def _parse_address(address):
+    """Get the host and the port of a server from an ``"ip:port"`` string or a tuple."""
+    if isinstance(address, str):
+        host, _, port = address.rpartition(":")
+        host = host.strip("[]")
+    else:
+        host, port = address
+    if not host:
+        raise ValueError(f"The address of a server must be 'ip:port', not '{address}'.")
+    return host, int(port)
+
+
+def _remote_name(file_name):
+    """Get the name of the subdirectory that a local file is uploaded to on its hosts."""
+    return hashlib.sha256(file_name.encode()).hexdigest()[:12]
+
+
+def _remote_join(directory, *names):
+    """Join names to a directory of a server with the separator of the server."""
+    separator = "\\" if "\\" in directory else "/"
+    return separator.join([directory.rstrip("\\/")] + list(names))
+
+
+def _file_stat(file_name):
+    """Get the size and the modification time of a file, which identify its version."""
+    stat = os.stat(file_name)
+    return stat.st_size, stat.st_mtime_ns
+
+
+class DistributedMechanicalPool(LocalMechanicalPool):
+    """Create a pool of the Mechanical servers that run on several hosts.
+
+    Unlike :class:`LocalMechanicalPool`, this pool does not launch Mechanical. It
+    connects to servers that are already running, which are listed by address or
+    discovered on their hosts. When the pool exits, or when a job fails, only the
+    connection to a server is closed, and the server keeps running.
+
+    The pool has the same methods to run jobs as :class:`LocalMechanicalPool`. In
+    addition, jobs can give the local input files that they need. Each version of
+    a file is uploaded only once per host, and jobs run preferably on the hosts that
+    already hold the most bytes of their input files.
+
+    Parameters
+    ----------
+    servers : list, optional
+        Addresses of the servers as ``"ip:port"`` strings or ``(ip, port)`` tuples.
+        The default is ``None``.
+    hosts : list[str], optional
+        Hosts on which to discover the servers that listen on ``port_range``. The
+        default is ``None``.
+    port_range : iterable[int], optional
+        Ports on which to discover the servers of ``hosts``. The default is
+        ``None``, in which case 100 ports starting from the default port of the
+        backend are scanned.
+    backend : str, optional
+        Type of the servers. Options are ``"mechanical"`` for the gRPC servers of
+        Mechanical and ``"python"`` for the RPC servers of embedded Mechanical, which
+        requires the ``rpyc`` package. The default is ``"mechanical"``.
+    max_jobs_per_host : int or dict, optional
+        Maximum number of jobs that run at a time on a host, either for all hosts
+        or for each host by name. The default is ``None``, in which case there is
+        no limit other than the number of servers of the host.
+    upload_directory : str, optional
+        Directory on the hosts to upload the input files of the jobs to. The
+        default is ``None``, in which case each host uses a directory of the pool
+        in its temporary directory. Each local file is uploaded to its own
+        subdirectory.
+    wait : bool, optional
+        Whether to wait for the connections to the servers. The default is
+        ``True``.
+    progress_bar : bool, optional
+        Whether to show a progress bar when connecting to the servers. The default
+        is ``True``, but the progress bar is not shown when ``wait=False``.
+    restart_failed : bool, optional
+        Whether to reconnect to the servers whose connection was closed or could
+        not be opened. The default is ``True``.
+    affinity_wait : float, optional
+        Time in seconds that a job waits for a busy server that holds the state of
+        its affinity key, or that is on a host holding its input files, before it
+        runs on another server. The default is ``1.0``.
+    tenant_weights : dict, optional
+        Weight of each tenant that submits jobs to the pool. The default is
+        ``None``, in which case all tenants have a weight of ``1``.
+    **kwargs : dict, optional
+        Additional keyword arguments for the
+        :func:`ansys.mechanical.core.connect_to_mechanical` function, or for the
+        client of the embedded servers if ``backend="python"``.
+
+    Examples
+    --------
+    Create a pool of the servers that run on two workstations.
+
+    >>> from ansys.mechanical.core import DistributedMechanicalPool
+    >>> pool = DistributedMechanicalPool(["192.168.1.30:10000", "192.168.1.31:10000"])
+    Connecting Pool: 100%|########| 2/2 [00:00<00:00,  4.12it/s]
+
+    Discover the servers that run on three hosts, and run at most four jobs at a
+    time on each host.
+
+    >>> hosts = ["node1", "node2", "node3"]
+    >>> pool = DistributedMechanicalPool(hosts=hosts, max_jobs_per_host=4)
+    Connecting Pool: 100%|########| 12/12 [00:01<00:00,  8.73it/s]
+
+    """
+
+    def __init__(
+        self,
+        servers=None,
+        hosts=None,
+        port_range=None,
+        backend="mechanical",
+        max_jobs_per_host=None,
+        upload_directory=None,
+        wait=True,
+        progress_bar=True,
+        restart_failed=True,
+        affinity_wait=1.0,
+        tenant_weights=None,
+        **kwargs,
+    ):
+        """Connect to the Mechanical servers of several hosts.
+
+        See :class:`DistributedMechanicalPool` for a description of the parameters.
+        """
+        self._instances = []
+        if backend not in ("mechanical", "python"):
+            raise ValueError("'backend' must be 'mechanical' or 'python'.")
+
+        addresses = [_parse_address(address) for address in servers or []]
+        if hosts:
+            if port_range is None:
+                port = MECHANICAL_DEFAULT_PORT if backend == "mechanical" else _RPC_DEFAULT_PORT
+                port_range = range(port, port + 100)
+            port_range = list(port_range)
+            for host in hosts:
+                addresses.extend((host, port) for port in self._discover(host, port_range, backend))
+        # a server listed and discovered is used once
+        addresses = list(dict.fromkeys(addresses))
+        if not addresses:
+            raise ValueError("No Mechanical server was given or found for the pool.")
+        LOG.debug(f"Connecting a pool to the servers: {addresses}.")
+
+        self._spawn_kwargs = kwargs
+        self._remote = False
+        self._backend = backend
+        self._addresses = addresses
+        self._scheduler = PoolScheduler()
+        self._active = True
+        n_servers = len(addresses)
+        self._min_instances = n_servers
+        self._max_instances = n_servers
+        self._n_standby = 0
+        self._standby = deque()
+        self._standby_taken = threading.Event()
+        self._recycle_after_jobs = None
+        self._recycle_memory = None
+        self._recycle_latency_factor = None
+        self._init_jobs(n_servers, affinity_wait, tenant_weights)
+
+        self._max_jobs_per_host = max_jobs_per_host
+        self._hosts_lock = threading.Lock()
+        self._host_jobs = {}
+        self._parked = {}
+        self._upload_directory = upload_directory
+        self._upload_directories = {}
+        self._upload_name = f"PyMechanical_Pool_{uuid.uuid4().hex[:12]}"
+        self._upload_locks = {host: threading.Lock() for host, _ in addresses}
+        self._files_lock = threading.Lock()
+        self._host_files = {}
+        self._job_files = threading.local()
+
+        pbar = None
+        if wait and progress_bar:
+            if not _HAS_TQDM:  # pragma: no cover
+                raise ModuleNotFoundError(
+                    f"To use the keyword argument 'progress_bar', you must have installed "
+                    f"the 'tqdm' package. To avoid this message, you can set 'progress_bar=False'."
+                )
+
+            pbar = tqdm(total=n_servers, desc="Connecting Pool")
+
+        self._instances = [None for _ in range(n_servers)]
+        threads = [self._connect(i, pbar, name=f"Instance {i}") for i in range(n_servers)]
+        if wait:
+            [thread.join() for thread in threads]
+
+            if len(self) != n_servers:  # pragma: no cover
+                warnings.warn(f"Only {len(self)} clients connected out of {n_servers} servers")
+            if pbar is not None:
+                pbar.close()
+
+        if restart_failed:
+            self._pool_monitor_thread = self._monitor_pool(name="Monitoring_Thread started")
+
+    @staticmethod
+    def _discover(host, port_range, backend):
+        """Get the ports of the servers that listen on a host."""
+        if backend == "mechanical":
+            return find_mechanical_servers(port_range, host, verify=True)
+        return sorted(port for port, is_open in scan_ports(port_range, host).items() if is_open)
+
+    def map(
+        self,
+        func,
+        iterable=None,
+        clear_at_start=True,
+        progress_bar=True,
+        close_when_finished=False,
+        timeout=None,
+        wait=True,
+        affinity=None,
+        priority=0,
+        tenant=None,
+        input_files=None,
+    ):
+        """Run a user-defined function on the servers of the pool.
+
+        See :meth:`LocalMechanicalPool.map` for a description of the other
+        parameters and of the return value.
+
+        Parameters
+        ----------
+        input_files : callable, optional
+            Function that gets the paths of the local input files of a job from
+            its arguments. The default is ``None``. The files that the host of
+            the job does not hold yet are uploaded before the job runs, and the
+            :meth:`remote_path` method gives their paths on the host.
+
+        Examples
+        --------
+        Solve a model for several loads, uploading the geometry of the model only
+        once to each host.
+
+        >>> def solve(mechanical, geometry_file, load):
+        ...     geometry_path = pool.remote_path(mechanical, geometry_file)
+        ...     return mechanical.run_python_script(make_script(geometry_path, load))
+        >>> inputs = [("bracket.x_t", load) for load in loads]
+        >>> outputs = pool.map(solve, inputs, input_files=lambda args: [args[0]])
+        """
+        if input_files is not None:
+            func = _InputFilesJob(func, input_files)
+        return super().map(
+            func,
+            iterable,
+            clear_at_start=clear_at_start,
+            progress_bar=progress_bar,
+            close_when_finished=close_when_finished,
+            timeout=timeout,
+            wait=wait,
+            affinity=affinity,
+            priority=priority,
+            tenant=tenant,
+        )
+
+    def run_batch(
+        self,
+        files,
+        clear_at_start=True,
+        progress_bar=True,
+        close_when_finished=False,
+        timeout=None,
+        wait=True,
+        priority=0,
+        tenant=None,
+        input_files=None,
+    ):
+        """Run a batch of input files on the servers of the pool.
+
+        See :meth:`LocalMechanicalPool.run_batch` for a description of the other
+        parameters and of the return value.
+
+        Parameters
+        ----------
+        input_files : callable, optional
+            Function that gets the paths of the local files that an input file of
+            the batch needs on its host. The default is ``None``.
+
+        Examples
+        --------
+        >>> files = [f"load{index}.py" for index in range(1, 21)]
+        >>> outputs = pool.run_batch(files, input_files=lambda file: ["bracket.x_t"])
+        """
+        return self.map(
+            self._batch_function(files, clear_at_start),
+            files,
+            progress_bar=progress_bar,
+            close_when_finished=close_when_finished,
+            timeout=timeout,
+            wait=wait,
+            priority=priority,
+            tenant=tenant,
+            input_files=input_files,
+        )
+
+    def acquire(self, timeout=None, return_index=False, affinity=None, input_files=None):
+        """Wait until a server is idle and reserve it.
+
+        See :meth:`LocalMechanicalPool.acquire` for a description of the other
+        parameters and of the return value.
+
+        Parameters
+        ----------
+        input_files : list[str], optional
+            Local files that the caller needs on the host of the server. The
+            default is ``None``. If no ``affinity`` is given, a server on a host
+            that holds the most bytes of the current versions of the files is
+            preferred. The files are not uploaded.
+        """
+        if input_files is None:
+            input_files = getattr(self._job_files, "files", None)
+        if affinity is not None or not input_files:
+            return super().acquire(timeout, return_index, affinity)
+
+        holders = self._holders(input_files)
+        prefer = None
+        if holders:
+
+            def prefer(index):
+                return self._addresses[index][0] in holders
+
+        index = self._acquire_index(timeout, prefer)
+        instance = self._instances[index]
+        instance.locked = True
+        if return_index:
+            return instance, index
+        return instance
+
+    def _acquire_index(self, timeout=None, prefer=None):
+        """Take the index of an idle server, within the job limit of its host."""
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - time.perf_counter(), 0)
+            index = super()._acquire_index(remaining, prefer)
+            if self._claim_host(index):
+                return index
+
+    def _host_limit(self, host):
+        """Get the maximum number of jobs that run at a time on a host."""
+        if isinstance(self._max_jobs_per_host, dict):
+            return self._max_jobs_per_host.get(host)
+        return self._max_jobs_per_host
+
+    def _claim_host(self, index):
+        """Count a job on the host of a server, or park the server if the host is full."""
+        host = self._addresses[index][0]
+        limit = self._host_limit(host)
+        with self._hosts_lock:
+            n_jobs = self._host_jobs.get(host, 0)
+            if limit is not None and n_jobs >= limit:
+                # another caller took the last slot of the host first
+                self._parked.setdefault(host, []).append(index)
+                return False
+            self._host_jobs[host] = n_jobs + 1
+            if limit is not None and n_jobs + 1 >= limit:
+                # the idle servers of a full host wait until one of its jobs finishes
+                for other, (other_host, _) in enumerate(self._addresses):
+                    if other_host == host and self._scheduler.discard(other):
+                        self._parked.setdefault(host, []).append(other)
+        return True
+
+    def release(self, instance):
+        """Give back a server reserved with the :meth:`acquire` method.
+
+        Parameters
+        ----------
+        instance : pymechanical.Mechanical
+            Instance of Mechanical.
+        """
+        for index, pool_instance in enumerate(self._instances):
+            if pool_instance is instance:
+                host = self._addresses[index][0]
+                with self._hosts_lock:
+                    self._host_jobs[host] = max(self._host_jobs.get(host, 0) - 1, 0)
+                    parked = self._parked.pop(host, [])
+                for other in parked:
+                    if self._is_available(other):
+                        self._scheduler.put(other)
+                break
+        super().release(instance)
+
+    def _run_job(self, future, func, args, clear_at_start, timeout, instance, key=None):
+        """Run a job on a server of the pool, uploading its input files first."""
+        files = None
+        if isinstance(func, _InputFilesJob):
+            files = [os.path.abspath(file_name) for file_name in func.input_files(args)]
+            job = func.func
+
+            def run_with_files(mechanical, *job_args):
+                self._upload_input_files(mechanical, files)
+                return job(mechanical, *job_args)
+
+            func = run_with_files
+
+        # acquire() prefers the hosts that hold the files of the job of this thread
+        self._job_files.files = files
+        try:
+            super()._run_job(future, func, args, clear_at_start, timeout, instance, key)
+        finally:
+            self._job_files.files = None
+
+    def _holders(self, files):
+        """Get the hosts that hold the most bytes of the current versions of files."""
+        stats = {os.path.abspath(file_name): _file_stat(file_name) for file_name in files}
+        held = {}
+        with self._files_lock:
+            for host, host_files in self._host_files.items():
+                held[host] = sum(
+                    stat[0]
+                    for file_name, stat in stats.items()
+                    if host_files.get(file_name) == stat
+                )
+        # empty files cost nothing to upload
+        most = max(held.values(), default=0)
+        return {host for host, n_bytes in held.items() if n_bytes == most} if most else set()
+
+    def _upload_input_files(self, mechanical, files):
+        """Upload the files that the host of a server does not hold yet."""
+        host = self._addresses[self._index_of(mechanical)][0]
+        # uploads to a host are serialized, so that each file is sent once
+        with self._upload_locks[host]:
+            directory = self._host_directory(host, mechanical)
+            for file_name in files:
+                file_name = os.path.abspath(file_name)
+                stat = _file_stat(file_name)
+                with self._files_lock:
+                    if self._host_files.get(host, {}).get(file_name) == stat:
+                        continue
+                file_directory = _remote_join(directory, _remote_name(file_name))
+                LOG.debug(f"Uploading {file_name} to {file_directory} on {host}.")
+                mechanical.run_python_script(
+                    MAKE_DIRECTORY_SCRIPT % (file_directory, file_directory)
+                )
+                mechanical.upload(file_name, file_directory, progress_bar=False)
+                with self._files_lock:
+                    self._host_files.setdefault(host, {})[file_name] = stat
+
+    def _host_directory(self, host, mechanical):
+        """Get the directory of a host to upload the input files of the jobs to."""
+        if self._upload_directory is not None:
+            return self._upload_directory
+        if host not in self._upload_directories:
+            # the directories of the servers belong to them, so the pool keeps the
+            # files in its own directory under the temporary directory of the host
+            temp_directory = mechanical.run_python_script(TEMP_DIRECTORY_SCRIPT)
+            self._upload_directories[host] = _remote_join(temp_directory, self._upload_name)
+        return self._upload_directories[host]
+
+    def remote_path(self, mechanical, file_name):
+        """Get the path of an input file of a job on the host of a server.
+
+        Parameters
+        ----------
+        mechanical : pymechanical.Mechanical
+            Instance of Mechanical of the pool.
+        file_name : str
+            Local input file, as given by the ``input_files`` function of the job.
+
+        Returns
+        -------
+        str
+            Path of the file on the host. Each local file is uploaded to its own
+            subdirectory of the upload directory, so files with the same name in
+            different local directories do not overwrite each other.
+
+        Examples
+        --------
+        >>> pool.remote_path(mechanical, "bracket.x_t")
+        '/tmp/PyMechanical_Pool_1f0c4a9e2b7d/5d41402abc4b/bracket.x_t'
+        """
+        host = self._addresses[self._index_of(mechanical)][0]
+        with self._upload_locks[host]:
+            directory = self._host_directory(host, mechanical)
+        file_name = os.path.abspath(file_name)
+        return _remote_join(directory, _remote_name(file_name), os.path.basename(file_name))
+
+    def _index_of(self, instance):
+        """Get the index of a server of the pool."""
+        for index, pool_instance in enumerate(self._instances):
+            if pool_instance is instance:
+                return index
+        raise ValueError("The instance is not in the pool.")
+
+    @property
+    def host_files(self):
+        """Local input files that each host holds.
+
+        Returns
+        -------
+        dict
+            Sorted paths of the local files uploaded to each host, whose versions
+            are still current.
+
+        Examples
+        --------
+        >>> pool.host_files
+        {'node1': ['/home/username/bracket.x_t'], 'node2': []}
+        """
+        hosts = {}
+        with self._files_lock:
+            for host, host_files in self._host_files.items():
+                hosts[host] = sorted(
+                    file_name
+                    for file_name, stat in host_files.items()
+                    if os.path.isfile(file_name) and _file_stat(file_name) == stat
+                )
+        return hosts
+
+    @threaded_daemon
+    def _connect(self, index, pbar=None, name=""):
+        """Connect to the server at an index.
+
+        Parameters
+        ----------
+        index : int
+            Index of the server.
+        pbar :
+            The default is ``None``.
+        name : str, optional
+            Name for the thread. The default is ``""``.
+        """
+        LOG.debug(name)
+        host, port = self._addresses[index]
+        try:
+            if self._backend == "python":  # pragma: no cover
+                from ansys.mechanical.core.embedding.rpc import Client
+
+                instance = Client(host, port, cleanup_on_exit=False, **self._spawn_kwargs)
+                instance.locked = False
+            else:
+                instance = connect_to_mechanical(ip=host, port=port, **self._spawn_kwargs)
+        except Exception as error:
+            LOG.error(f"Unable to connect to the server at {host}:{port}: {error}")
+            return
+        # the server may have restarted, so the files of its host are uploaded again
+        with self._files_lock:
+            self._host_files.pop(host, None)
+        self._instances[index] = instance
+        self._scheduler.put(index)
+        if pbar is not None:
+            pbar.update(1)
+
+    def _is_available(self, index):
+        """Whether the server at an index is connected."""
+        instance = self._instances[index]
+        if instance is None:
+            return False
+        if self._backend == "python":  # pragma: no cover
+            return not instance._has_exited
+        return not instance._exited
+
+    def _exit_instance(self, instance):
+        """Close the connection to a server, which keeps running."""
+        if self._backend == "python":  # pragma: no cover
+            # the client of an embedded server only closes its connection
+            instance.exit()
+        else:
+            instance._exited = True
+            instance._release_channel(close=True)
+
+    @threaded_daemon
+    def _monitor_pool(self, refresh=1.0, name=""):
+        """Reconnect to the servers whose connection was closed or could not be opened.
+
+        Parameters
+        ----------
+        refresh : float, optional
+            The default is ``1.0``.
+        name : str, optional
+            Name for the thread. The default is ``""``.
+        """
+        LOG.debug(name)
+        while self._active:
+            for index, instance in enumerate(self._instances):
+                if not self._active:
+                    break
+                # a worker that still holds the server gives it back first
+                if instance is None or (not self._is_available(index) and not instance.locked):
+                    LOG.debug(f"Reconnecting to the server at index : {index}.")
+                    self._connect(index, name=f"Instance {index}").join()
+            time.sleep(refresh)
+
+    @property
+    def servers(self):
+        """Get the addresses of the connected servers.
+
+        Examples
+        --------
+        >>> pool.servers
+        ['192.168.1.30:10000', '192.168.1.31:10000']
+        """
+        return [
+            f"{host}:{port}"
+            for index, (host, port) in enumerate(self._addresses)
+            if self._is_available(index)
+        ]
+
+    @property
+    def ports(self):
+        """Get a list of the ports of the connected servers."""
+        return [
+            port for index, (_, port) in enumerate(self._addresses) if self._is_available(index)
+        ]
+
+    def __str__(self):
+        """Get the string representation of this object."""
+        n_hosts = len({host for host, _ in self._addresses})
+        return "Mechanical pool with %d active servers on %d hosts" % (len(self), n_hosts)
@@ -0,0 +1,276 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Concurrent discovery of open ports and Mechanical gRPC servers."""
+
+from concurrent.futures import ThreadPoolExecutor
+import errno
+import selectors
+import socket
+import time
+
+import ansys.api.mechanical.v0.mechanical_pb2 as mechanical_pb2
+import grpc
+
+from ansys.mechanical.core.scripting import RUN_PYTHON_SCRIPT_METHOD
+
+DEFAULT_SCAN_TIMEOUT = 1.0
+"""Default time in seconds to wait for a port to answer."""
+
+MAX_SOCKETS = 256
+"""Default maximum number of sockets that a scan keeps open at a time."""
+
+HTTP2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+"""Connection preface that an HTTP/2 client sends with prior knowledge."""
+
+HTTP2_SETTINGS_FRAME = b"\x00\x00\x00\x04\x00\x00\x00\x00\x00"
+"""Empty HTTP/2 ``SETTINGS`` frame."""
+
+_HTTP2_FRAME_HEADER_LENGTH = 9
+_HTTP2_SETTINGS_TYPE = 0x04
+
+# connect_ex() results of a non-blocking connection that is in progress,
+# including WSAEWOULDBLOCK on Windows
+_CONNECT_IN_PROGRESS = {0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY, 10035}
+
+
+def _resolve(host):
+    """Get the address family and the address of a host, preferring IPv4."""
+    infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    family, _, _, _, address = next((info for info in infos if info[0] == socket.AF_INET), infos[0])
+    return family, address[0]
+
+
+def scan_ports(
+    port_range,
+    host="127.0.0.1",
+    timeout=DEFAULT_SCAN_TIMEOUT,
+    handshake=False,
+    max_sockets=MAX_SOCKETS,
+):
+    """Probe ports concurrently with non-blocking sockets.
+
+    All ports are probed in a single pass. At most ``max_sockets`` connections are
+    in progress at a time, and each one is given up after ``timeout`` seconds.
+
+    Parameters
+    ----------
+    port_range : iterable[int]
+        Ports to probe.
+    host : str, optional
+        Host to probe. The default is ``"127.0.0.1"``.
+    timeout : float, optional
+        Maximum time in seconds to wait for each port. The default is ``1.0``.
+    handshake : bool, optional
+        Whether to check that the port answers an HTTP/2 handshake, as gRPC
+        servers do. The default is ``False``, in which case a port only has to
+        accept the connection.
+    max_sockets : int, optional
+        Maximum number of sockets open at a time. The default is ``256``.
+
+    Returns
+    -------
+    dict
+        For each port, ``True`` if the port accepted the connection and, if
+        ``handshake=True``, answered the handshake, ``False`` if it did not, and
+        ``None`` if it did not answer within the timeout.
+    """
+    family, address = _resolve(host)
+    ports = list(port_range)
+    results = dict.fromkeys(ports, None)
+    pending = iter(ports)
+    selector = selectors.DefaultSelector()
+
+    def start_next():
+        for port in pending:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            if sock.connect_ex((address, port)) in _CONNECT_IN_PROGRESS:
+                # the data is the port, the deadline, and the bytes received
+                selector.register(
+                    sock, selectors.EVENT_WRITE, [port, time.monotonic() + timeout, b""]
+                )
+                return True
+            results[port] = False
+            sock.close()
+        return False
+
+    def finish(key, is_open):
+        selector.unregister(key.fileobj)
+        key.fileobj.close()
+        results[key.data[0]] = is_open
+        start_next()
+
+    try:
+        for _ in range(max_sockets):
+            if not start_next():
+                break
+
+        while selector.get_map():
+            keys = list(selector.get_map().values())
+            wait = min(key.data[1] for key in keys) - time.monotonic()
+            for key, events in selector.select(timeout=max(wait, 0)):
+                sock = key.fileobj
+                if key.events == selectors.EVENT_WRITE:
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR):
+                        finish(key, False)
+                    elif not handshake:
+                        finish(key, True)
+                    else:
+                        try:
+                            sock.send(HTTP2_PREFACE + HTTP2_SETTINGS_FRAME)
+                        except OSError:
+                            finish(key, False)
+                            continue
+                        selector.modify(sock, selectors.EVENT_READ, key.data)
+                else:
+                    try:
+                        data = sock.recv(_HTTP2_FRAME_HEADER_LENGTH - len(key.data[2]))
+                    except OSError:
+                        data = b""
+                    if not data:
+                        finish(key, False)
+                        continue
+                    key.data[2] += data
+                    if len(key.data[2]) == _HTTP2_FRAME_HEADER_LENGTH:
+                        # the server preface starts with a SETTINGS frame
+                        finish(key, key.data[2][3] == _HTTP2_SETTINGS_TYPE)
+
+            now = time.monotonic()
+            for key in list(selector.get_map().values()):
+                if key.data[1] <= now:
+                    finish(key, None)
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+
+    return results
+
+
+def _is_mechanical(host, port, timeout):
+    """Check whether the gRPC server on a port implements the Mechanical service."""
+    request = mechanical_pb2.RunScriptRequest(script_code="")
+    with grpc.insecure_channel(f"{host}:{port}") as channel:
+        call = channel.unary_stream(RUN_PYTHON_SCRIPT_METHOD)
+        try:
+            for _ in call(request.SerializeToString(), timeout=timeout):
+                pass
+        except grpc.RpcError as error:
+            # other gRPC servers reject the unknown method right away, so a
+            # deadline only means that Mechanical is busy
+            return error.code() not in (
+                grpc.StatusCode.UNIMPLEMENTED,
+                grpc.StatusCode.UNAVAILABLE,
+            )
+    return True
+
+
+def find_mechanical_servers(
+    port_range,
+    host="127.0.0.1",
+    timeout=DEFAULT_SCAN_TIMEOUT,
+    verify=False,
+    max_sockets=MAX_SOCKETS,
+):
+    """Find the Mechanical gRPC servers listening on a range of ports.
+
+    The ports are probed concurrently, and a port is reported if it answers the
+    HTTP/2 handshake that gRPC servers answer.
+
+    Parameters
+    ----------
+    port_range : iterable[int]
+        Ports to probe.
+    host : str, optional
+        Host to probe. The default is ``"127.0.0.1"``.
+    timeout : float, optional
+        Maximum time in seconds to wait for each port. The default is ``1.0``.
+    verify : bool, optional
+        Whether to also check that each gRPC server implements the Mechanical
+        service by sending it an empty script. The default is ``False``, in which
+        case any gRPC server is reported.
+    max_sockets : int, optional
+        Maximum number of sockets open at a time. The default is ``256``.
+
+    Returns
+    -------
+    list[int]
+        Sorted ports of the servers.
+
+    Examples
+    --------
+    Find the Mechanical instances running locally on the default port range.
+
+    >>> from ansys.mechanical.core.ports import find_mechanical_servers
+    >>> find_mechanical_servers(range(10000, 10100))
+    [10000, 10001]
+    """
+    results = scan_ports(port_range, host, timeout, handshake=True, max_sockets=max_sockets)
+    ports = sorted(port for port, is_server in results.items() if is_server)
+    if verify and ports:
+        with ThreadPoolExecutor(max_workers=min(len(ports), 32)) as executor:
+            checks = list(executor.map(lambda port: _is_mechanical(host, port, timeout), ports))
+        ports = [port for port, is_mechanical in zip(ports, checks) if is_mechanical]
+    return ports
+
+
+def _can_bind(family, address, port):
+    """Check whether a port can be bound at an address."""
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        try:
+            sock.bind((address, port))
+        except OSError:
+            return False
+    return True
+
+
+def find_free_ports(n_ports, starting_port, host="127.0.0.1"):
+    """Find ports that can be bound at a host.
+
+    A port is free only if it can actually be bound. Unlike a connection, binding
+    also fails for ports that are reserved or bound by a server that does not
+    listen yet, and it does not have to wait for ports that do not answer.
+
+    Parameters
+    ----------
+    n_ports : int
+        Number of ports to find.
+    starting_port : int
+        Port to start the search from.
+    host : str, optional
+        Local host to bind the ports at. The default is ``"127.0.0.1"``.
+
+    Returns
+    -------
+    list[int]
+        Free ports in increasing order. There are fewer than ``n_ports`` ports if
+        the search reaches port ``65535``.
+    """
+    family, address = _resolve(host)
+    ports = []
+    for port in range(starting_port, 65536):
+        if len(ports) == n_ports:
+            break
+        if _can_bind(family, address, port):
+            ports.append(port)
+    return ports
@@ -0,0 +1,697 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Helpers for running Python scripts on the Mechanical gRPC server."""
+
+import ast
+import base64
+from collections import deque
+from concurrent.futures import Future
+import hashlib
+import json
+import struct
+import textwrap
+import threading
+
+from ansys.mechanical.core.errors import MechanicalRuntimeError
+
+RUN_PYTHON_SCRIPT_METHOD = "/ansys.api.mechanical.scripting.v1.MechanicalService/RunPythonScript"
+"""Full name of the ``RunPythonScript`` method of the gRPC service."""
+
+DEFAULT_PIPELINE_DEPTH = 1
+"""Default number of scripts that a :class:`ScriptPipeline` keeps in flight."""
+
+# Scripts in this module run inside Mechanical, so they must remain
+# compatible with IronPython 2.7 (no f-strings).
+BATCH_SCRIPT = """
+import json
+
+
+def _pymechanical_run_blocks(blocks, stop_on_error):
+    namespace = globals()
+    results = []
+    failed = False
+    for body, expression in blocks:
+        if failed and stop_on_error:
+            results.append(None)
+            continue
+        try:
+            exec(compile(body, "<block>", "exec"), namespace)
+            value = None
+            if expression:
+                value = eval(compile(expression, "<block>", "eval"), namespace)
+            results.append([True, "" if value is None else str(value)])
+        except Exception as error:
+            failed = True
+            results.append([False, "%%s: %%s" %% (type(error).__name__, error)])
+    return json.dumps(results)
+
+
+_pymechanical_run_blocks(json.loads(%r), %r)
+"""
+"""Script that runs several script blocks and returns their results as JSON.
+
+Each block is a ``[body, expression]`` pair. The body is executed, and the value
+of the expression, if any, is the result of the block.
+"""
+
+STREAM_RESULT_SCRIPT = """
+import io
+import os
+import tempfile
+
+
+def _pymechanical_write_result(body, expression):
+    namespace = globals()
+    exec(compile(body, "<script>", "exec"), namespace)
+    value = None
+    if expression:
+        value = eval(compile(expression, "<script>", "eval"), namespace)
+    handle, path = tempfile.mkstemp(suffix=".pymechanical_result")
+    os.close(handle)
+    with io.open(path, "w", encoding="utf-8", newline="\\n") as stream:
+        if value is None:
+            pass
+        elif isinstance(value, type(u"")) or not hasattr(value, "__iter__"):
+            stream.write(type(u"")(value))
+        else:
+            for line in value:
+                stream.write(type(u"")(line) + u"\\n")
+    return path
+
+
+_pymechanical_write_result(%r, %r)
+"""
+"""Script that runs a script block and writes its result to a temporary file.
+
+If the value of the last expression is iterable, such as a list or a generator,
+each item is written on its own line, so the result never has to be built as a
+single string on the server. The script returns the path of the file.
+"""
+
+TYPED_RESULT_SCRIPT = """
+import base64
+import json
+import struct
+
+try:
+    _pymechanical_integers = (int, long)
+except NameError:
+    _pymechanical_integers = (int,)
+_pymechanical_strings = (type(u""), type(b""))
+
+
+def _pymechanical_format(items):
+    format = None
+    for item in items:
+        if isinstance(item, bool):
+            format = format or "?"
+        elif isinstance(item, _pymechanical_integers):
+            format = "d" if format == "d" else "q"
+        elif isinstance(item, float):
+            format = "d"
+        else:
+            return None
+    return format or "d"
+
+
+def _pymechanical_pack(value):
+    shape = []
+    items = [value]
+    if hasattr(value, "__iter__"):
+        items = list(value)
+        shape = [len(items)]
+        if items and all(
+            hasattr(item, "__iter__") and not isinstance(item, _pymechanical_strings)
+            for item in items
+        ):
+            rows = [list(item) for item in items]
+            if len(set(len(row) for row in rows)) == 1:
+                items = [item for row in rows for item in row]
+                shape.append(len(rows[0]))
+    format = _pymechanical_format(items)
+    if format is None:
+        return None
+    try:
+        data = struct.pack("<" + str(len(items)) + format, *items)
+    except (OverflowError, struct.error):
+        return None
+    header = json.dumps({"kind": "array", "format": format, "shape": shape})
+    return header + "\\n" + base64.b64encode(data).decode("ascii")
+
+
+def _pymechanical_encode(body, expression):
+    namespace = globals()
+    exec(compile(body, "<script>", "exec"), namespace)
+    value = None
+    if expression:
+        value = eval(compile(expression, "<script>", "eval"), namespace)
+    if value is None or isinstance(value, _pymechanical_strings) or isinstance(value, dict):
+        result = None
+    else:
+        if hasattr(value, "__iter__"):
+            value = list(value)
+        result = _pymechanical_pack(value)
+    if result is None:
+        try:
+            result = json.dumps({"kind": "json", "value": value})
+        except (TypeError, ValueError):
+            result = json.dumps({"kind": "str", "value": str(value)})
+    return result
+
+
+_pymechanical_encode(%r, %r)
+"""
+"""Script that runs a script block and encodes its result with its type.
+
+Numbers and rectangular sequences of numbers are packed as little-endian binary
+values under a JSON header with their struct format and shape, and encoded in
+base64. Other values are encoded as JSON, or as their string value if they
+cannot be encoded as JSON.
+"""
+
+TYPED_RESULT_DTYPES = {"?": "?", "q": "<i8", "d": "<f8"}
+"""NumPy data types of the struct formats used by :data:`TYPED_RESULT_SCRIPT`."""
+
+UNREGISTERED_SCRIPT = "__pymechanical_unregistered__"
+"""Result of :data:`RUN_REGISTERED_SCRIPT` when the server does not know the handle."""
+
+REGISTER_SCRIPT = """
+import json
+
+try:
+    _pymechanical_scripts
+except NameError:
+    _pymechanical_scripts = {}
+
+
+def _pymechanical_run_registered(handle, arguments):
+    if handle not in _pymechanical_scripts:
+        return %r
+    body, expression = _pymechanical_scripts[handle]
+    namespace = globals()
+    namespace.update(json.loads(arguments))
+    exec(body, namespace)
+    if expression is None:
+        return ""
+    value = eval(expression, namespace)
+    return "" if value is None else str(value)
+
+
+def _pymechanical_register(handle, body, expression):
+    _pymechanical_scripts[handle] = (
+        compile(body, "<script>", "exec"),
+        compile(expression, "<script>", "eval") if expression else None,
+    )
+
+
+_pymechanical_register(%r, %r, %r)
+"""
+"""Script that compiles a script block and keeps it on the server under a handle."""
+
+RUN_REGISTERED_SCRIPT = 'globals().get("_pymechanical_run_registered", lambda *args: %r)(%r, %r)'
+"""Script that runs a registered script block with JSON-encoded arguments."""
+
+DEFAULT_BLOCK_ROWS = 65536
+"""Default number of rows that the result parsers convert to an array at a time."""
+
+
+def check_pipeline_depth(depth):
+    """Check that a pipeline depth is a positive integer and return it."""
+    if not isinstance(depth, int) or depth < 1:
+        raise ValueError(f"The pipeline depth must be a positive integer, not {depth!r}.")
+    return depth
+
+
+class ScriptPipeline:
+    """Send scripts to a session in order while earlier scripts run on the server.
+
+    Requests are serialized by the thread that submits them, and the next call
+    starts as soon as the previous one finishes, without waiting for the caller.
+    With a ``depth`` greater than one, several calls are in flight at once, so the
+    next request is already on the server when the previous script finishes.
+    Calls start in submission order, and a single thread reads their responses
+    in the same order, so results are delivered in submission order.
+
+    Parameters
+    ----------
+    start_call : callable
+        Function that starts a call from a serialized request and returns the
+        iterator of its responses without blocking.
+    read_result : callable
+        Function that reads the result of a call from its responses. It is
+        called with the responses and the context given to :meth:`submit`.
+    depth : int, optional
+        Maximum number of calls in flight. The default is ``1``.
+    """
+
+    def __init__(self, start_call, read_result, depth=DEFAULT_PIPELINE_DEPTH):
+        """Initialize the pipeline. The reader thread starts on the first submission."""
+        self._start_call = start_call
+        self._read_result = read_result
+        self._depth = check_pipeline_depth(depth)
+        self._condition = threading.Condition()
+        self._pending = deque()
+        self._in_flight = deque()
+        self._thread = None
+        self._closed = False
+
+    @property
+    def depth(self):
+        """Maximum number of calls in flight."""
+        return self._depth
+
+    @depth.setter
+    def depth(self, depth):
+        with self._condition:
+            self._depth = check_pipeline_depth(depth)
+            self._start_pending()
+
+    def submit(self, request, context=None):
+        """Queue a serialized request and return the future of its result.
+
+        Parameters
+        ----------
+        request : bytes
+            Serialized request.
+        context : optional
+            Object passed to ``read_result`` with the responses of the call.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the result.
+        """
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The script pipeline is closed.")
+            self._pending.append((request, future, context))
+            self._start_pending()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._read_results, name="pymechanical_script_pipeline", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+        return future
+
+    def _start_pending(self):
+        # the caller holds the lock
+        while self._pending and len(self._in_flight) < self._depth:
+            request, future, context = self._pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                responses = self._start_call(request)
+            except Exception as error:
+                future.set_exception(error)
+                continue
+            self._in_flight.append((responses, future, context))
+
+    def _read_results(self):
+        while True:
+            with self._condition:
+                while not self._in_flight and not self._closed:
+                    self._condition.wait()
+                if not self._in_flight:
+                    return
+                responses, future, context = self._in_flight[0]
+
+            try:
+                result = self._read_result(responses, context)
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+            with self._condition:
+                self._in_flight.popleft()
+                self._start_pending()
+                self._condition.notify_all()
+
+    def wait(self):
+        """Wait until every submitted script has finished."""
+        with self._condition:
+            while self._pending or self._in_flight:
+                self._condition.wait()
+
+    def close(self):
+        """Cancel the scripts that have not been sent and stop the reader thread.
+
+        Scripts that are already in flight finish normally.
+        """
+        with self._condition:
+            self._closed = True
+            while self._pending:
+                _, future, _ = self._pending.popleft()
+                future.cancel()
+            self._condition.notify_all()
+
+
+def split_last_expression(script_block):
+    r"""Split a script block into its statements and its trailing expression.
+
+    Parameters
+    ----------
+    script_block : str
+        Script block (one or more lines).
+
+    Returns
+    -------
+    tuple(str, str)
+        Source of the statements and source of the last expression. The expression
+        is ``None`` if the block does not end with an expression, or if the block
+        cannot be parsed by the client, for example because it uses IronPython 2
+        syntax.
+
+    Examples
+    --------
+    >>> split_last_expression("import math\nmath.pow(2, 3)")
+    ('import math\n', 'math.pow(2, 3)')
+    """
+    script_block = textwrap.dedent(script_block)
+    try:
+        tree = ast.parse(script_block)
+    except SyntaxError:
+        return script_block, None
+
+    if not tree.body or not isinstance(tree.body[-1], ast.Expr):
+        return script_block, None
+
+    last = tree.body[-1]
+    lines = script_block.splitlines(keepends=True)
+    # the column offset counts UTF-8 bytes, not characters
+    line_start = lines[last.lineno - 1].encode()[: last.col_offset].decode()
+    body = "".join(lines[: last.lineno - 1]) + line_start
+    return body, ast.get_source_segment(script_block, last)
+
+
+def batch_script(script_blocks, stop_on_error=True):
+    """Build the script that runs several script blocks in one call.
+
+    Parameters
+    ----------
+    script_blocks : list[str]
+        Script blocks to run in order.
+    stop_on_error : bool, optional
+        Whether to skip the blocks that follow a failed block. The default is ``True``.
+
+    Returns
+    -------
+    str
+        Script to run on the server.
+    """
+    blocks = [split_last_expression(script_block) for script_block in script_blocks]
+    return BATCH_SCRIPT % (json.dumps(blocks), bool(stop_on_error))
+
+
+def parse_batch_results(result):
+    """Parse the output of :data:`BATCH_SCRIPT`.
+
+    Returns
+    -------
+    list
+        For each block, the result string, a
+        :class:`MechanicalRuntimeError <ansys.mechanical.core.errors.MechanicalRuntimeError>`
+        instance if the block failed, or ``None`` if the block was skipped.
+    """
+    results = []
+    for item in json.loads(result):
+        if item is None:
+            results.append(None)
+        elif item[0]:
+            results.append(item[1])
+        else:
+            results.append(MechanicalRuntimeError(item[1]))
+    return results
+
+
+def iter_lines(chunks):
+    """Split a stream of byte chunks into lines.
+
+    Parameters
+    ----------
+    chunks : iterable[bytes]
+        Chunks of UTF-8 encoded text, such as the ones that the
+        ``run_python_script_stream()`` method yields.
+
+    Yields
+    ------
+    str
+        Lines without the trailing newline. Empty lines are skipped.
+    """
+    tail = b""
+    for chunk in chunks:
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield line.decode("utf-8")
+    if tail.strip():
+        yield tail.decode("utf-8")
+
+
+def _blocks(lines, block_rows):
+    """Group lines into lists of at most ``block_rows`` lines."""
+    block = []
+    for line in lines:
+        block.append(line)
+        if len(block) == block_rows:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ModuleNotFoundError:  # pragma: no cover
+        raise ModuleNotFoundError(
+            "To parse script results into arrays, you must have installed the 'numpy' package."
+        ) from None
+    return np
+
+
+def iter_csv_arrays(chunks, dtype=float, delimiter=",", skip_rows=0, block_rows=DEFAULT_BLOCK_ROWS):
+    """Parse a stream of CSV chunks into NumPy arrays, one block of rows at a time.
+
+    Parameters
+    ----------
+    chunks : iterable[bytes]
+        Chunks of CSV text.
+    dtype : numpy.dtype or str, optional
+        Data type of the array elements. The default is ``float``.
+    delimiter : str, optional
+        Column delimiter. The default is ``","``.
+    skip_rows : int, optional
+        Number of header rows to skip. The default is ``0``.
+    block_rows : int, optional
+        Maximum number of rows per array. The default is ``65536``.
+
+    Yields
+    ------
+    numpy.ndarray
+        Two-dimensional array for each block of rows.
+    """
+    np = _import_numpy()
+    lines = iter_lines(chunks)
+    for _ in range(skip_rows):
+        next(lines, None)
+    for block in _blocks(lines, block_rows):
+        yield np.loadtxt(block, dtype=dtype, delimiter=delimiter, ndmin=2)
+
+
+def iter_ndjson_arrays(chunks, dtype=float, block_rows=DEFAULT_BLOCK_ROWS):
+    """Parse a stream of NDJSON chunks into NumPy arrays, one block of rows at a time.
+
+    Each line must be a JSON number or a JSON array of numbers.
+
+    Parameters
+    ----------
+    chunks : iterable[bytes]
+        Chunks of newline-delimited JSON text.
+    dtype : numpy.dtype or str, optional
+        Data type of the array elements. The default is ``float``.
+    block_rows : int, optional
+        Maximum number of rows per array. The default is ``65536``.
+
+    Yields
+    ------
+    numpy.ndarray
+        Array for each block of rows.
+    """
+    np = _import_numpy()
+    for block in _blocks(iter_lines(chunks), block_rows):
+        yield np.array(json.loads("[" + ",".join(block) + "]"), dtype=dtype)
+
+
+def _concatenate(arrays, dtype):
+    np = _import_numpy()
+    arrays = list(arrays)
+    if not arrays:
+        return np.empty(0, dtype=dtype)
+    return np.concatenate(arrays)
+
+
+def load_csv(chunks, dtype=float, delimiter=",", skip_rows=0, block_rows=DEFAULT_BLOCK_ROWS):
+    """Parse a stream of CSV chunks into a single NumPy array.
+
+    The chunks are parsed one block of rows at a time, so the text of the
+    result is never held in memory as a whole. See :func:`iter_csv_arrays`
+    for a description of the parameters.
+
+    Returns
+    -------
+    numpy.ndarray
+        Two-dimensional array with one row per line.
+
+    Examples
+    --------
+    >>> chunks = mechanical.run_python_script_stream(
+    ...     "[','.join(str(c) for c in (n.Id, n.X, n.Y, n.Z)) for n in mesh.Nodes]"
+    ... )
+    >>> nodes = load_csv(chunks)
+    """
+    return _concatenate(
+        iter_csv_arrays(chunks, dtype, delimiter, skip_rows, block_rows), dtype=dtype
+    )
+
+
+def load_ndjson(chunks, dtype=float, block_rows=DEFAULT_BLOCK_ROWS):
+    """Parse a stream of NDJSON chunks into a single NumPy array.
+
+    See :func:`iter_ndjson_arrays` for a description of the parameters.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array with one row per line.
+    """
+    return _concatenate(iter_ndjson_arrays(chunks, dtype, block_rows), dtype=dtype)
+
+
+def typed_result_script(script_block):
+    """Build the script that runs a script block and encodes its result with its type.
+
+    Parameters
+    ----------
+    script_block : str
+        Script block (one or more lines) to run.
+
+    Returns
+    -------
+    str
+        Script to run on the server.
+    """
+    return TYPED_RESULT_SCRIPT % split_last_expression(script_block)
+
+
+def decode_typed_result(result, as_array=True):
+    """Decode the output of :data:`TYPED_RESULT_SCRIPT`.
+
+    Parameters
+    ----------
+    result : str
+        Output of the script.
+    as_array : bool, optional
+        Whether to decode sequences of numbers as NumPy arrays. The default is
+        ``True``. If ``False``, they are decoded as lists, or lists of lists for
+        two-dimensional sequences.
+
+    Returns
+    -------
+    object
+        Decoded value.
+
+    Raises
+    ------
+    ValueError
+        If the output is empty, because the script did not return a result.
+    """
+    if not result:
+        raise ValueError("The script did not return a typed result.")
+    header, _, payload = result.partition("\n")
+    header = json.loads(header)
+    if header["kind"] != "array":
+        return header["value"]
+
+    data = base64.b64decode(payload)
+    format, shape = header["format"], header["shape"]
+    if not shape:
+        return struct.unpack("<" + format, data)[0]
+    if as_array:
+        np = _import_numpy()
+        return np.frombuffer(bytearray(data), dtype=TYPED_RESULT_DTYPES[format]).reshape(shape)
+
+    values = list(struct.unpack(f"<{len(data) // struct.calcsize(format)}{format}", data))
+    if len(shape) == 2:
+        n_columns = shape[1]
+        values = [values[row * n_columns : (row + 1) * n_columns] for row in range(shape[0])]
+    return values
+
+
+def script_handle(script_block):
+    """Get the handle that a script block is registered under.
+
+    The handle is the SHA-256 digest of the script block, so registering the same
+    script block twice gives the same handle.
+    """
+    return hashlib.sha256(script_block.encode("utf-8")).hexdigest()
+
+
+def registration_script(script_block):
+    """Build the script that registers a script block on the server.
+
+    Parameters
+    ----------
+    script_block : str
+        Script block (one or more lines) to register.
+
+    Returns
+    -------
+    tuple(str, str)
+        Handle of the script block and script to run on the server.
+    """
+    handle = script_handle(script_block)
+    body, expression = split_last_expression(script_block)
+    return handle, REGISTER_SCRIPT % (UNREGISTERED_SCRIPT, handle, body, expression or "")
+
+
+def registered_script_call(handle, arguments=None):
+    """Build the script that runs a registered script block.
+
+    Parameters
+    ----------
+    handle : str
+        Handle of the script block.
+    arguments : dict, optional
+        Global variables to set before running the script block. The values must
+        be serializable to JSON. The default is ``None``.
+
+    Returns
+    -------
+    str
+        Script to run on the server.
+    """
+    return RUN_REGISTERED_SCRIPT % (UNREGISTERED_SCRIPT, handle, json.dumps(arguments or {}))
@@ -0,0 +1,806 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Helpers for transferring files to and from the Mechanical gRPC server."""
+
+from collections import namedtuple
+import hashlib
+import mmap
+import os
+import threading
+import time
+import uuid
+import zlib
+
+import grpc
+
+# Scripts in this module run inside Mechanical, so they must remain
+# compatible with IronPython 2.7 (no f-strings).
+MERGE_PARTS_SCRIPT = """
+import hashlib
+import os
+
+
+def _pymechanical_merge_parts(directory, target_name, part_names, block_size):
+    digests = []
+    try:
+        with open(os.path.join(directory, target_name), "wb") as merged:
+            for part_name in part_names:
+                digest = hashlib.sha256()
+                with open(os.path.join(directory, part_name), "rb") as part:
+                    while True:
+                        data = part.read(block_size)
+                        if not data:
+                            break
+                        digest.update(data)
+                        merged.write(data)
+                digests.append(digest.hexdigest())
+    finally:
+        for part_name in part_names:
+            part_path = os.path.join(directory, part_name)
+            if os.path.exists(part_path):
+                os.remove(part_path)
+    return ",".join(digests)
+
+
+_pymechanical_merge_parts(%r, %r, %r, %d)
+"""
+"""Script that concatenates uploaded parts and returns their SHA-256 digests."""
+
+REMOVE_FILES_SCRIPT = """
+import os
+for _pymechanical_path in [os.path.join(%r, name) for name in %r]:
+    if os.path.exists(_pymechanical_path):
+        os.remove(_pymechanical_path)
+"""
+"""Script that removes files from a directory on the server."""
+
+RENAME_FILE_SCRIPT = """
+import os
+
+
+def _pymechanical_rename_file(directory, source_name, target_name):
+    target_path = os.path.join(directory, target_name)
+    if os.path.exists(target_path):
+        os.remove(target_path)
+    os.rename(os.path.join(directory, source_name), target_path)
+
+
+_pymechanical_rename_file(%r, %r, %r)
+"""
+"""Script that renames a file in a directory on the server, replacing any existing file."""
+
+FILE_DIGESTS_SCRIPT = """
+import hashlib
+import os
+
+
+def _pymechanical_file_digests(requests, block_size):
+    lines = []
+    for path, prefix_length in requests:
+        if not os.path.isfile(path):
+            lines.append("-")
+            continue
+        full_digest = hashlib.sha256()
+        prefix_digest = hashlib.sha256()
+        position = 0
+        with open(path, "rb") as source:
+            while True:
+                data = source.read(block_size)
+                if not data:
+                    break
+                if position < prefix_length:
+                    prefix_digest.update(data[: prefix_length - position])
+                full_digest.update(data)
+                position += len(data)
+        lines.append(
+            "%%d,%%s,%%s" %% (position, full_digest.hexdigest(), prefix_digest.hexdigest())
+        )
+    return "\\n".join(lines)
+
+
+_pymechanical_file_digests(%r, %d)
+"""
+"""Script that returns the size, SHA-256 digest, and SHA-256 digest of a prefix of files."""
+
+COPY_TAIL_SCRIPT = """
+def _pymechanical_copy_tail(path, tail_path, offset, block_size):
+    with open(path, "rb") as source:
+        source.seek(offset)
+        with open(tail_path, "wb") as tail:
+            while True:
+                data = source.read(block_size)
+                if not data:
+                    break
+                tail.write(data)
+    return tail_path
+
+
+_pymechanical_copy_tail(%r, %r, %d, %d)
+"""
+"""Script that copies the bytes of a file from an offset onwards into a new file."""
+
+COMPRESS_FILE_SCRIPT = """
+import os
+import zlib
+
+
+def _pymechanical_compress_file(path, compressed_path, wbits, sample_size, block_size):
+    with open(path, "rb") as source:
+        sample = source.read(sample_size)
+        if not sample or len(zlib.compress(sample, 1)) > 0.9 * len(sample):
+            return ""
+        compressor = zlib.compressobj(1, zlib.DEFLATED, wbits)
+        with open(compressed_path, "wb") as target:
+            target.write(compressor.compress(sample))
+            while True:
+                block = source.read(block_size)
+                if not block:
+                    break
+                target.write(compressor.compress(block))
+            target.write(compressor.flush())
+    return "%%d,%%s" %% (os.path.getsize(path), compressed_path)
+
+
+_pymechanical_compress_file(%r, %r, %d, %d, %d)
+"""
+"""Script that compresses a file into a new file unless a sample of it is incompressible.
+
+It returns ``"<size>,<compressed path>"``, or an empty string if the file was not
+compressed.
+"""
+
+DIGEST_BLOCK_SIZE = 1024 * 1024
+"""Block size for reading files when computing digests."""
+
+DEFAULT_MESSAGE_LENGTH = 4 * 1024**2
+"""Default gRPC limit on the size of received messages."""
+
+MESSAGE_OVERHEAD = 64 * 1024
+"""Room left in each message for the fields other than the chunk payload."""
+
+COMPRESSION_ALGORITHMS = {
+    "none": grpc.Compression.NoCompression,
+    "deflate": grpc.Compression.Deflate,
+    "gzip": grpc.Compression.Gzip,
+}
+"""Supported compression algorithms and their gRPC equivalents."""
+
+COMPRESSION_WBITS = {"deflate": zlib.MAX_WBITS, "gzip": 16 + zlib.MAX_WBITS}
+"""``wbits`` argument of :mod:`zlib` for the format of each compression algorithm."""
+
+COMPRESSED_EXTENSIONS = {
+    ".7z",
+    ".bz2",
+    ".gif",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".mp4",
+    ".png",
+    ".rar",
+    ".xz",
+    ".zip",
+    ".zst",
+}
+"""Extensions of file formats that are already compressed."""
+
+COMPRESSION_SAMPLE_SIZE = 64 * 1024
+"""Number of leading bytes to compress when checking whether a file is compressible."""
+
+MIN_AUTO_CHUNK_SIZE = 64 * 1024
+"""Smallest chunk size used by adaptive chunking."""
+
+MAX_AUTO_CHUNK_SIZE = 16 * 1024**2
+"""Largest chunk size used by adaptive chunking."""
+
+
+def split_byte_ranges(file_size, n_ranges, min_length=1):
+    """Split a file into contiguous byte ranges.
+
+    Parameters
+    ----------
+    file_size : int
+        Size of the file in bytes.
+    n_ranges : int
+        Maximum number of ranges to create.
+    min_length : int, optional
+        Minimum length of a range in bytes. The default is ``1``. Fewer than
+        ``n_ranges`` ranges are returned when the file is too small to give
+        each range at least this many bytes.
+
+    Returns
+    -------
+    list[tuple(int, int)]
+        List of ``(offset, length)`` tuples covering the whole file.
+
+    Examples
+    --------
+    >>> split_byte_ranges(10, 3)
+    [(0, 4), (4, 3), (7, 3)]
+    """
+    if n_ranges < 1:
+        raise ValueError("The number of ranges must be at least 1.")
+
+    n_ranges = max(1, min(n_ranges, file_size // max(min_length, 1)))
+    base_length, remainder = divmod(file_size, n_ranges)
+
+    ranges = []
+    offset = 0
+    for index in range(n_ranges):
+        length = base_length + (1 if index < remainder else 0)
+        ranges.append((offset, length))
+        offset += length
+    return ranges
+
+
+def transfer_token():
+    """Get a random token that makes the names of the temporary files of a transfer unique."""
+    return uuid.uuid4().hex[:12]
+
+
+def part_file_name(file_name, index, token):
+    """Get the name of the server-side part file for a byte range of ``file_name``."""
+    return f"{file_name}.{token}.pymechanical_part{index}"
+
+
+def merged_file_name(file_name, token):
+    """Get the name of the server-side file that the parts of ``file_name`` are merged into."""
+    return f"{file_name}.{token}.pymechanical_merged"
+
+
+def partial_file_name(file_name):
+    """Get the name of the local file that holds a partially downloaded ``file_name``."""
+    return f"{file_name}.pymechanical_partial"
+
+
+def tail_file_name(file_name, token):
+    """Get the name of the server-side file that holds the remaining bytes of ``file_name``."""
+    return f"{file_name}.{token}.pymechanical_tail"
+
+
+def compressed_file_name(file_name):
+    """Get the name of the temporary compressed copy of a file."""
+    return f"{file_name}.pymechanical_compressed"
+
+
+def check_compression(compression):
+    """Check the name of a compression algorithm.
+
+    Parameters
+    ----------
+    compression : str
+        Name of the compression algorithm: ``"gzip"``, ``"deflate"``, or ``"none"``.
+
+    Returns
+    -------
+    str
+        Lowercase name of the compression algorithm.
+
+    Raises
+    ------
+    ValueError
+        If the compression algorithm is not supported.
+    """
+    name = str(compression).lower()
+    if name not in COMPRESSION_ALGORITHMS:
+        raise ValueError(
+            f"Compression {compression!r} is not supported. gRPC supports only "
+            f"{', '.join(repr(algorithm) for algorithm in COMPRESSION_ALGORITHMS)}."
+        )
+    return name
+
+
+def is_compressible(file_name, sample=None):
+    """Check whether a file is likely to shrink when compressed.
+
+    Files with the extension of a compressed format are not compressible. Otherwise,
+    the file is compressible if its leading bytes shrink by more than 10 %.
+
+    Parameters
+    ----------
+    file_name : str
+        Path of the file.
+    sample : bool, optional
+        Whether to compress a sample of the leading bytes of the file. The default
+        is ``None``, in which case a sample is compressed if the file exists locally.
+    """
+    if os.path.splitext(file_name)[1].lower() in COMPRESSED_EXTENSIONS:
+        return False
+    if sample is None:
+        sample = os.path.isfile(file_name)
+    if not sample:
+        return True
+
+    with open(file_name, "rb") as f:
+        data = f.read(COMPRESSION_SAMPLE_SIZE)
+    return bool(data) and len(zlib.compress(data, 1)) <= 0.9 * len(data)
+
+
+_Chunk = namedtuple("_Chunk", ["payload"])
+_Response = namedtuple("_Response", ["chunk", "file_size"])
+
+
+def decompress_responses(responses, compression, file_size):
+    """Decompress the payloads of a stream of ``DownloadFile`` responses.
+
+    Parameters
+    ----------
+    responses : iterable
+        Stream of responses for a compressed file.
+    compression : str
+        Compression algorithm of the file.
+    file_size : int
+        Size of the file after decompression.
+
+    Yields
+    ------
+    Response-like objects with the decompressed payloads.
+    """
+    decompressor = zlib.decompressobj(COMPRESSION_WBITS[compression])
+    for response in responses:
+        data = response.chunk.payload
+        while data:
+            # bound the size of each payload, since small inputs can expand a lot
+            payload = decompressor.decompress(data, DEFAULT_MESSAGE_LENGTH)
+            if payload:
+                yield _Response(_Chunk(payload), file_size)
+            data = decompressor.unconsumed_tail
+    payload = decompressor.flush()
+    if payload:
+        yield _Response(_Chunk(payload), file_size)
+
+
+def file_digest(file_name, length=None):
+    """Get the SHA-256 hex digest of a local file.
+
+    Parameters
+    ----------
+    file_name : str
+        Path of the local file.
+    length : int, optional
+        Number of bytes from the start of the file to include in the digest.
+        The default is ``None``, in which case the whole file is used.
+
+    Returns
+    -------
+    str
+        SHA-256 hex digest.
+    """
+    digest = hashlib.sha256()
+    remaining = length
+    with open(file_name, "rb") as f:
+        while remaining is None or remaining > 0:
+            block_size = (
+                DIGEST_BLOCK_SIZE if remaining is None else min(DIGEST_BLOCK_SIZE, remaining)
+            )
+            data = f.read(block_size)
+            if not data:
+                break
+            digest.update(data)
+            if remaining is not None:
+                remaining -= len(data)
+    return digest.hexdigest()
+
+
+def parse_file_digests(result):
+    """Parse the output of :data:`FILE_DIGESTS_SCRIPT`.
+
+    Parameters
+    ----------
+    result : str
+        Output of the script.
+
+    Returns
+    -------
+    list
+        For each requested file, a ``(size, digest, prefix_digest)`` tuple, or
+        ``None`` if the file does not exist on the server.
+    """
+    digests = []
+    for line in result.split("\n"):
+        if line == "-":
+            digests.append(None)
+            continue
+        size, digest, prefix_digest = line.split(",")
+        digests.append((int(size), digest, prefix_digest))
+    return digests
+
+
+class FileTransfer:
+    """Record of a single file transfer.
+
+    Parameters
+    ----------
+    source : str
+        Path of the file that was read.
+    destination : str
+        Path of the file that was written.
+    size : int
+        Number of bytes transferred.
+    elapsed : float
+        Duration of the transfer in seconds.
+    offset : int, optional
+        Offset in bytes that the transfer resumed from. The default is ``0``.
+    chunk_size : int, optional
+        Chunk size in bytes that the transfer used. For adaptive chunking, this is
+        the chunk size chosen at the end of the transfer. The default is ``None``.
+    """
+
+    def __init__(self, source, destination, size, elapsed, offset=0, chunk_size=None):
+        """Initialize the transfer record."""
+        self.source = source
+        self.destination = destination
+        self.size = size
+        self.elapsed = elapsed
+        self.offset = offset
+        self.chunk_size = chunk_size
+
+    @property
+    def bytes_per_second(self):
+        """Throughput of the transfer in bytes per second."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.size / self.elapsed
+
+    def __repr__(self):
+        """Get the string representation of the transfer record."""
+        return (
+            f"FileTransfer({self.source!r}, {self.destination!r}, "
+            f"size={self.size}, elapsed={self.elapsed:.3f}, chunk_size={self.chunk_size})"
+        )
+
+
+class TransferStats:
+    """Aggregate statistics for a batch of file transfers.
+
+    Examples
+    --------
+    Get the throughput of the last project download.
+
+    >>> mechanical.download_project(target_dir="project")
+    >>> mechanical.transfer_stats.bytes_per_second
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.files = []
+        self.skipped = []
+        self.elapsed = 0.0
+
+    def add(self, transfer):
+        """Add a :class:`FileTransfer` record."""
+        self.files.append(transfer)
+
+    def skip(self, source, destination):
+        """Record a file that was not transferred because it was already up to date."""
+        self.skipped.append((source, destination))
+
+    @property
+    def total_bytes(self):
+        """Total number of bytes transferred."""
+        return sum(transfer.size for transfer in self.files)
+
+    @property
+    def bytes_per_second(self):
+        """Aggregate throughput in bytes per second over the wall-clock duration."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.total_bytes / self.elapsed
+
+    def __repr__(self):
+        """Get the string representation of the statistics."""
+        return (
+            f"TransferStats(files={len(self.files)}, skipped={len(self.skipped)}, "
+            f"total_bytes={self.total_bytes}, "
+            f"elapsed={self.elapsed:.3f}, bytes_per_second={self.bytes_per_second:.0f})"
+        )
+
+
+class FileSink:
+    """Write downloaded chunks to a file through a buffered file object.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the local file.
+    append : bool, optional
+        Whether to append to the file instead of overwriting it. The default
+        is ``False``.
+    """
+
+    def __init__(self, filename, append=False):
+        """Open the file."""
+        self.filename = filename
+        self.size = 0
+        self._file = open(filename, "ab" if append else "wb")
+
+    def write(self, payload, file_size):
+        """Write a chunk and return its length in bytes."""
+        length = len(payload)
+        self._file.write(payload)
+        self.size += length
+        return length
+
+    def close(self):
+        """Close the file."""
+        self._file.close()
+
+
+class MmapSink:
+    """Write downloaded chunks into a memory-mapped file.
+
+    The file is preallocated from the total file size reported by the server,
+    and each payload is copied into the mapping at the running offset.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the local file.
+    append : bool, optional
+        Whether to keep the existing content of the file and write after it.
+        The default is ``False``.
+    """
+
+    def __init__(self, filename, append=False):
+        """Open the file."""
+        self.filename = filename
+        self.size = 0
+        if append and os.path.isfile(filename):
+            self._file = open(filename, "r+b")
+            self.size = os.path.getsize(filename)
+        else:
+            self._file = open(filename, "w+b")
+        self._offset = self.size
+        self._mmap = None
+
+    def _map(self, length):
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.truncate(length)
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(self._file.fileno(), 0, length)
+            except OSError:  # pragma: no cover
+                pass  # preallocation is an optimization only
+        self._mmap = mmap.mmap(self._file.fileno(), length)
+
+    def write(self, payload, file_size):
+        """Write a chunk and return its length in bytes.
+
+        Parameters
+        ----------
+        payload : bytes
+            Chunk payload.
+        file_size : int
+            Size of the file on the server. It is used to preallocate the local
+            file when the first chunk is written.
+        """
+        length = len(payload)
+        if not length:
+            # an empty file cannot be mapped, and the file is truncated on close
+            return 0
+        end = self.size + length
+        if self._mmap is None:
+            self._map(max(end, self._offset + file_size))
+        elif end > len(self._mmap):
+            # the file is larger than reported, so grow the mapping geometrically
+            self._map(max(end, 2 * len(self._mmap)))
+        self._mmap[self.size : end] = payload
+        self.size = end
+        return length
+
+    def close(self):
+        """Unmap the file and truncate it to the number of bytes written."""
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+        self._file.truncate(self.size)
+        self._file.close()
+
+
+class BufferSink:
+    """Write downloaded chunks into an in-memory buffer.
+
+    The buffer is preallocated from the total file size reported by the server.
+
+    Examples
+    --------
+    >>> sink = BufferSink()
+    >>> sink.write(b"abc", 6)
+    3
+    >>> bytes(sink.buffer)
+    b'abc'
+    """
+
+    def __init__(self):
+        """Initialize an empty buffer."""
+        self.size = 0
+        self._buffer = bytearray()
+
+    def write(self, payload, file_size):
+        """Write a chunk and return its length in bytes."""
+        length = len(payload)
+        end = self.size + length
+        if end > len(self._buffer):
+            buffer = bytearray(max(end, file_size))
+            buffer[: self.size] = memoryview(self._buffer)[: self.size]
+            self._buffer = buffer
+        memoryview(self._buffer)[self.size : end] = payload
+        self.size = end
+        return length
+
+    def close(self):
+        """Close the sink. The buffer remains available."""
+        pass
+
+    @property
+    def buffer(self):
+        """Memory view of the bytes written to the buffer."""
+        return memoryview(self._buffer)[: self.size]
+
+    def as_array(self, dtype):
+        """Get the bytes written to the buffer as a NumPy array without copying them.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype or str
+            Data type of the array elements.
+
+        Returns
+        -------
+        numpy.ndarray
+            One-dimensional array that shares memory with the buffer.
+        """
+        try:
+            import numpy as np
+        except ModuleNotFoundError:  # pragma: no cover
+            raise ModuleNotFoundError(
+                "To use the 'dtype' keyword argument, you must have installed the 'numpy' package."
+            ) from None
+        return np.frombuffer(self.buffer, dtype=dtype)
+
+
+class AdaptiveChunkSizer:
+    """Choose transfer chunk sizes from the measured round-trip time and throughput.
+
+    The chunk size targets the number of bytes that the link transfers in
+    ``target_interval`` seconds, or in four round trips on high-latency links.
+    Chunk sizes are powers of two within the ``minimum`` and ``maximum`` bounds,
+    and they only change when the target moves more than a factor of two away
+    from the current size. The sizer is thread-safe, so concurrent transfers
+    can share it.
+
+    Parameters
+    ----------
+    chunk_size : int
+        Initial chunk size in bytes.
+    minimum : int, optional
+        Smallest chunk size in bytes. The default is ``65536``.
+    maximum : int, optional
+        Largest chunk size in bytes. The default is ``16777216``.
+    target_interval : float, optional
+        Time in seconds to transfer one chunk on low-latency links. The default
+        is ``0.05``.
+    smoothing : float, optional
+        Weight of new samples in the moving averages of the round-trip time and
+        throughput. The default is ``0.5``.
+
+    Examples
+    --------
+    >>> sizer = AdaptiveChunkSizer(256 * 1024)
+    >>> sizer.add_sample(100 * 1024**2, 1.0)
+    4194304
+    """
+
+    def __init__(
+        self,
+        chunk_size,
+        minimum=MIN_AUTO_CHUNK_SIZE,
+        maximum=MAX_AUTO_CHUNK_SIZE,
+        target_interval=0.05,
+        smoothing=0.5,
+    ):
+        """Initialize the sizer."""
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.target_interval = target_interval
+        self.smoothing = smoothing
+        self.rtt = None
+        self.throughput = None
+        self._chunk_size = self._clamp(chunk_size)
+        self._lock = threading.Lock()
+
+    @property
+    def chunk_size(self):
+        """Current chunk size in bytes."""
+        return self._chunk_size
+
+    def _clamp(self, chunk_size):
+        return int(min(max(chunk_size, self.minimum), self.maximum))
+
+    def _average(self, current, sample):
+        if current is None:
+            return sample
+        return current + self.smoothing * (sample - current)
+
+    def add_rtt(self, seconds):
+        """Add a round-trip time sample in seconds."""
+        with self._lock:
+            self.rtt = self._average(self.rtt, seconds)
+
+    def add_sample(self, n_bytes, seconds):
+        """Add a throughput sample and return the updated chunk size.
+
+        Parameters
+        ----------
+        n_bytes : int
+            Number of bytes transferred.
+        seconds : float
+            Time in seconds that the bytes took to transfer.
+        """
+        if n_bytes <= 0:
+            return self._chunk_size
+
+        with self._lock:
+            self.throughput = self._average(self.throughput, n_bytes / max(seconds, 1e-6))
+            interval = self.target_interval
+            if self.rtt is not None:
+                interval = max(interval, 4 * self.rtt)
+            target = self.throughput * interval
+
+            chunk_size = self._chunk_size
+            if target >= 2 * chunk_size or target < chunk_size / 2:
+                chunk_size = 1 << (max(int(target), 1).bit_length() - 1)
+            self._chunk_size = self._clamp(chunk_size)
+            return self._chunk_size
+
+    def measure(self, responses, time_start):
+        """Measure a stream of ``DownloadFile`` responses while passing them through.
+
+        The time to the first response, less the time to transfer its payload, is
+        added as a round-trip time sample. The throughput of the remaining responses
+        is added when the stream ends.
+
+        Parameters
+        ----------
+        responses : iterable
+            Stream of responses.
+        time_start : float
+            Value of :func:`time.perf_counter` when the request was sent.
+        """
+        time_first = None
+        n_bytes = 0
+        for response in responses:
+            if time_first is None:
+                time_first = time.perf_counter()
+                latency = time_first - time_start
+                if self.throughput:
+                    latency -= len(response.chunk.payload) / self.throughput
+                self.add_rtt(max(latency, 0.0))
+            else:
+                n_bytes += len(response.chunk.payload)
+            yield response
+
+        if n_bytes:
+            self.add_sample(n_bytes, time.perf_counter() - time_first)
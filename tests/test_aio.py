@@ -0,0 +1,81 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import os
+import pathlib
+
+import grpc
+import pytest
+
+from ansys.mechanical.core import AsyncMechanical
+
+
+def run(coroutine):
+    # a private event loop leaves the event loop of the main thread untouched
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.mark.remote_session_launch
+def test_async_mechanical_channel_and_port():
+    async def create():
+        channel = grpc.aio.insecure_channel("127.0.0.1:10000")
+        try:
+            with pytest.raises(ValueError):
+                AsyncMechanical(port=10000, channel=channel)
+        finally:
+            await channel.close()
+
+    run(create())
+
+
+@pytest.mark.remote_session_connect
+def test_async_mechanical(mechanical, tmp_path, assets):
+    if mechanical.backend != "mechanical":
+        pytest.skip("AsyncMechanical requires the gRPC backend.")
+
+    async def session_calls():
+        async with AsyncMechanical(ip=mechanical._ip, port=mechanical._port) as session:
+            assert await session.run_python_script("2+3") == "5"
+
+            # concurrent calls on one event loop
+            results = await asyncio.gather(
+                *(session.run_python_script(f"{index}*2") for index in range(5))
+            )
+            assert results == [str(index * 2) for index in range(5)]
+
+            with pytest.raises(grpc.RpcError):
+                await session.run_python_script("hello_world()")
+
+            await session.upload(os.path.join(assets, "hsec.x_t"))
+            assert any(file.endswith("hsec.x_t") for file in await session.list_files())
+
+            local_files = await session.download("*hsec.x_t", target_dir=str(tmp_path))
+            assert [pathlib.Path(file).name for file in local_files] == ["hsec.x_t"]
+            expected = pathlib.Path(assets, "hsec.x_t").read_bytes()
+            assert pathlib.Path(local_files[0]).read_bytes() == expected
+
+    run(session_calls())
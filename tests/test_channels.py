@@ -0,0 +1,73 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import time
+
+import pytest
+
+from ansys.mechanical.core.channels import ChannelRegistry
+
+
+class FakeChannel:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.remote_session_launch
+def test_channel_registry_reuse():
+    registry = ChannelRegistry(idle_timeout=60)
+    channel = registry.acquire("127.0.0.1:10000", FakeChannel)
+    assert registry.acquire("127.0.0.1:10000", FakeChannel) is channel
+    assert registry.acquire("127.0.0.1:10001", FakeChannel) is not channel
+    assert registry.refcount("127.0.0.1:10000") == 2
+
+    registry.release("127.0.0.1:10000")
+    registry.release("127.0.0.1:10000")
+    # the idle channel is reused if it is acquired again before the timeout
+    assert not channel.closed
+    assert registry.acquire("127.0.0.1:10000", FakeChannel) is channel
+
+    registry.clear()
+    assert channel.closed
+    assert len(registry) == 0
+
+
+@pytest.mark.remote_session_launch
+def test_channel_registry_eviction():
+    registry = ChannelRegistry(idle_timeout=0.05, close_delay=0)
+    channel = registry.acquire("127.0.0.1:10000", FakeChannel)
+    registry.release("127.0.0.1:10000")
+    registry.release("127.0.0.1:10000")
+    assert registry.refcount("127.0.0.1:10000") == 0
+
+    time.sleep(0.5)
+    assert channel.closed
+    assert len(registry) == 0
+
+    channel = registry.acquire("127.0.0.1:10000", FakeChannel)
+    registry.release("127.0.0.1:10000", close=True)
+    assert channel.closed
+    assert registry.acquire("127.0.0.1:10000", FakeChannel) is not channel
@@ -20,17 +20,23 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import hashlib
 import json
 import os
 import pathlib
 import re
+import socket
+import threading
+import time
 
 import ansys.tools.path
+import grpc
 import pytest
 
 import ansys.mechanical.core as pymechanical
 import ansys.mechanical.core.errors as errors
 import ansys.mechanical.core.misc as misc
+import ansys.mechanical.core.scripting as scripting
 import conftest
 
 
@@ -112,6 +118,40 @@ def test_upload(mechanical, file_name, assets):
     assert bool(result)
 
 
+@pytest.mark.remote_session_connect
+def test_download_resume(mechanical, tmpdir, assets):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Resumable download requires the gRPC backend.")
+
+    directory = mechanical.project_directory
+    mechanical.upload(
+        file_name=os.path.join(assets, "hsec.x_t"),
+        file_location_destination=directory,
+        progress_bar=False,
+    )
+    server_file = os.path.join(directory, "hsec.x_t")
+    local_file = os.path.join(tmpdir.strpath, "hsec.x_t")
+    expected = pathlib.Path(assets, "hsec.x_t").read_bytes()
+
+    # the first download transfers the file
+    mechanical.download(server_file, target_dir=tmpdir.strpath, progress_bar=False, resume=True)
+    assert len(mechanical.transfer_stats.files) == 1
+
+    # an unchanged file is skipped
+    mechanical.download(server_file, target_dir=tmpdir.strpath, progress_bar=False, resume=True)
+    assert len(mechanical.transfer_stats.files) == 0
+    assert len(mechanical.transfer_stats.skipped) == 1
+
+    # an interrupted download restarts at the end of the partial file
+    os.remove(local_file)
+    pathlib.Path(local_file + ".pymechanical_partial").write_bytes(expected[:100])
+    mechanical.download(server_file, target_dir=tmpdir.strpath, progress_bar=False, resume=True)
+    transfer = mechanical.transfer_stats.files[0]
+    assert transfer.offset == 100
+    assert transfer.size == len(expected) - 100
+    assert pathlib.Path(local_file).read_bytes() == expected
+
+
 @pytest.mark.remote_session_connect
 # we are using only a small test file
 # change the chunk_size for that
@@ -125,6 +165,505 @@ def test_upload_with_different_chunk_size(mechanical, chunk_size, assets):
     )
 
 
+@pytest.mark.remote_session_connect
+@pytest.mark.parametrize("n_streams", [2, 3])
+def test_upload_parallel(mechanical, n_streams, assets):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Parallel upload requires the gRPC backend.")
+
+    file_path = os.path.join(assets, "hsec.x_t")
+    directory = mechanical.project_directory
+    mechanical.upload(
+        file_name=file_path,
+        file_location_destination=directory,
+        chunk_size=1024,
+        progress_bar=False,
+        n_streams=n_streams,
+    )
+
+    server_path = os.path.join(directory, "hsec.x_t").replace("\\", "\\\\")
+    result = mechanical.run_python_script('import os\nos.path.getsize("%s")' % server_path)
+    assert int(result) == os.path.getsize(file_path)
+
+
+@pytest.mark.remote_session_launch
+def test_upload_parallel_integrity_error(tmp_path):
+    # a server whose merged file does not match the uploaded byte ranges
+    class FakeStub:
+        def UploadFile(self, requests, compression=None):
+            for _ in requests:
+                pass
+            return type("Response", (), {"is_ok": True})()
+
+    file_path = tmp_path / "model.x_t"
+    file_path.write_bytes(os.urandom(4096))
+    mechanical = pymechanical.Mechanical.__new__(pymechanical.Mechanical)
+    mechanical._disable_logging = True
+    mechanical._cleanup_on_exit = False
+    mechanical._stub = FakeStub()
+    mechanical.run_python_script = lambda script: "0,0"
+    removed = []
+    mechanical._remove_server_files = lambda directory, names: removed.append((directory, names))
+
+    with pytest.raises(IOError):
+        mechanical._upload_parallel(str(file_path), "/work", 1024, 2, progress_bar=False)
+    [(directory, [merged_name])] = removed
+    assert directory == "/work"
+    assert merged_name.startswith("model.x_t.") and merged_name.endswith(".pymechanical_merged")
+
+
+def run_server_script(script):
+    """Run a server script locally and return the value of its last line."""
+    body, _, last_line = script.strip().rpartition("\n")
+    namespace = {}
+    exec(body, namespace)
+    return eval(last_line, namespace)
+
+
+@pytest.mark.remote_session_launch
+def test_download_resumable_tail(tmp_path):
+    # a server that copies the tail of the file next to it
+    data = os.urandom(4096)
+    server_path = tmp_path / "model.mechdb"
+    server_path.write_bytes(data)
+    partial_path = tmp_path / "local.mechdb.pymechanical_partial"
+    out_path = tmp_path / "local.mechdb"
+
+    def download(target_name, out_file_name, append=False, **kwargs):
+        with open(target_name, "rb") as source, open(out_file_name, "ab") as target:
+            target.write(source.read())
+
+    mechanical = pymechanical.Mechanical.__new__(pymechanical.Mechanical)
+    mechanical._disable_logging = True
+    mechanical._cleanup_on_exit = False
+    mechanical.run_python_script = run_server_script
+    mechanical._download = download
+    removed = []
+    mechanical._remove_server_files = lambda directory, names: removed.extend(names)
+
+    digest = hashlib.sha256(data).hexdigest()
+    for _ in range(2):
+        partial_path.write_bytes(data[:1000])
+        mechanical._download_resumable(str(server_path), str(out_path), 1000, digest)
+        assert out_path.read_bytes() == data
+    # each download copies the tail to its own file
+    assert len(set(removed)) == 2
+    assert all(name.endswith(".pymechanical_tail") for name in removed)
+
+
+@pytest.mark.remote_session_launch
+def test_download_files_progress_bar(tmp_path):
+    progress_bars = []
+
+    def download(target_name, out_file_name, progress_bar=None, **kwargs):
+        progress_bars.append(progress_bar)
+        pathlib.Path(out_file_name).write_bytes(b"data")
+        return out_file_name
+
+    mechanical = pymechanical.Mechanical.__new__(pymechanical.Mechanical)
+    mechanical._disable_logging = True
+    mechanical._cleanup_on_exit = False
+    mechanical._download = download
+    file_pairs = [(f"/work/{name}", str(tmp_path / name)) for name in ("a.txt", "b.txt")]
+
+    # concurrent downloads do not show a progress bar unless asked to
+    mechanical._download_files(file_pairs, max_workers=2)
+    assert progress_bars == [False, False]
+    progress_bars.clear()
+    mechanical._download_files(file_pairs, progress_bar=False)
+    assert progress_bars == [False, False]
+
+
+@pytest.mark.remote_session_launch
+def test_upload_parallel_same_name(tmp_path):
+    # a server that writes the uploaded parts in its directory
+    class FakeStub:
+        def UploadFile(self, requests, compression=None):
+            for request in requests:
+                path = os.path.join(request.file_location, request.file_name)
+                with open(path, "ab") as part:
+                    part.write(request.chunk.payload)
+            return type("Response", (), {"is_ok": True})()
+
+    server_directory = tmp_path / "server"
+    server_directory.mkdir()
+    contents = []
+    for name in ("first", "second"):
+        (tmp_path / name).mkdir()
+        contents.append(os.urandom(64 * 1024))
+        (tmp_path / name / "model.x_t").write_bytes(contents[-1])
+    mechanical = pymechanical.Mechanical.__new__(pymechanical.Mechanical)
+    mechanical._disable_logging = True
+    mechanical._cleanup_on_exit = False
+    mechanical._stub = FakeStub()
+    mechanical.run_python_script = run_server_script
+
+    # concurrent uploads of files with the same name do not mix their parts
+    threads = [
+        threading.Thread(
+            target=mechanical._upload_parallel,
+            args=(str(tmp_path / name / "model.x_t"), str(server_directory), 1024, 4, False),
+        )
+        for name in ("first", "second")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert os.listdir(server_directory) == ["model.x_t"]
+    assert (server_directory / "model.x_t").read_bytes() in contents
+
+
+@pytest.mark.remote_session_connect
+@pytest.mark.parametrize("chunk_size", [256 * 1024, 1024 * 1024, 2 * 1024 * 1024])
+def test_upload_parallel_benchmark(mechanical, chunk_size, tmp_path):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Parallel upload requires the gRPC backend.")
+
+    file_path = tmp_path / "benchmark.bin"
+    file_path.write_bytes(os.urandom(64 * 1024 * 1024))
+    file_size = file_path.stat().st_size
+    directory = mechanical.project_directory
+
+    for n_streams in [1, 4]:
+        time_start = time.time()
+        mechanical.upload(
+            file_name=str(file_path),
+            file_location_destination=directory,
+            chunk_size=chunk_size,
+            progress_bar=False,
+            n_streams=n_streams,
+        )
+        elapsed = time.time() - time_start
+        print(
+            f"chunk_size={chunk_size} n_streams={n_streams}: "
+            f"{file_size / elapsed / 1024**2:.1f} MB/s"
+        )
+
+
+@pytest.mark.remote_session_connect
+def test_download_to_memory(mechanical, assets):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Downloading to memory requires the gRPC backend.")
+
+    directory = mechanical.project_directory
+    mechanical.upload(
+        file_name=os.path.join(assets, "hsec.x_t"),
+        file_location_destination=directory,
+        progress_bar=False,
+    )
+    buffer = mechanical.download_to_memory(os.path.join(directory, "hsec.x_t"))
+    assert bytes(buffer) == pathlib.Path(assets, "hsec.x_t").read_bytes()
+
+
+@pytest.mark.remote_session_connect
+@pytest.mark.parametrize("chunk_size", [256 * 1024, 4 * 1024 * 1024])
+def test_download_sink_benchmark(mechanical, chunk_size, tmp_path):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Download sinks require the gRPC backend.")
+
+    file_path = tmp_path / "benchmark.bin"
+    file_path.write_bytes(os.urandom(64 * 1024 * 1024))
+    file_size = file_path.stat().st_size
+    directory = mechanical.project_directory
+    mechanical.upload(
+        file_name=str(file_path), file_location_destination=directory, progress_bar=False
+    )
+    server_file = os.path.join(directory, "benchmark.bin")
+    target_dir = tmp_path / "downloads"
+
+    for use_mmap in [False, True]:
+        time_start = time.time()
+        mechanical.download(
+            server_file,
+            target_dir=str(target_dir),
+            chunk_size=chunk_size,
+            progress_bar=False,
+            use_mmap=use_mmap,
+        )
+        elapsed = time.time() - time_start
+        assert (target_dir / "benchmark.bin").stat().st_size == file_size
+        print(
+            f"chunk_size={chunk_size} use_mmap={use_mmap}: "
+            f"{file_size / elapsed / 1024**2:.1f} MB/s"
+        )
+
+    time_start = time.time()
+    buffer = mechanical.download_to_memory(server_file, chunk_size=chunk_size)
+    elapsed = time.time() - time_start
+    assert len(buffer) == file_size
+    print(f"chunk_size={chunk_size} memory: {file_size / elapsed / 1024**2:.1f} MB/s")
+
+
+@pytest.mark.remote_session_connect
+def test_transfer_auto_chunk_size(mechanical, tmp_path):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Adaptive chunk sizes require the gRPC backend.")
+
+    file_path = tmp_path / "auto.bin"
+    file_path.write_bytes(os.urandom(16 * 1024 * 1024))
+    file_size = file_path.stat().st_size
+    directory = mechanical.project_directory
+
+    mechanical.upload(
+        file_name=str(file_path),
+        file_location_destination=directory,
+        chunk_size="auto",
+        progress_bar=False,
+    )
+    transfer = mechanical.transfer_stats.files[0]
+    print(
+        f"upload: chunk_size={transfer.chunk_size} {transfer.bytes_per_second / 1024**2:.1f} MB/s"
+    )
+    assert transfer.size == file_size
+    assert transfer.chunk_size > 0
+
+    target_dir = tmp_path / "downloads"
+    for _ in range(3):
+        mechanical.download(
+            os.path.join(directory, "auto.bin"),
+            target_dir=str(target_dir),
+            chunk_size="auto",
+            progress_bar=False,
+        )
+        transfer = mechanical.transfer_stats.files[0]
+        print(
+            f"download: chunk_size={transfer.chunk_size} "
+            f"{transfer.bytes_per_second / 1024**2:.1f} MB/s"
+        )
+    assert (target_dir / "auto.bin").read_bytes() == file_path.read_bytes()
+
+
+@pytest.mark.remote_session_connect
+def test_run_python_scripts(mechanical):
+    results = mechanical.run_python_scripts(["batch_value = 2", "batch_value * 3", "1/0", "5"])
+    assert results[:2] == ["", "6"]
+    assert isinstance(results[2], errors.MechanicalRuntimeError)
+    assert results[3] is None
+
+    results = mechanical.run_python_scripts(["1/0", "batch_value"], stop_on_error=False)
+    assert results[1] == "2"
+    assert mechanical.run_python_scripts([]) == []
+
+
+@pytest.mark.remote_session_connect
+def test_run_python_scripts_benchmark(mechanical):
+    n_scripts = 200
+    scripts = [f"batch_value = {index}" for index in range(n_scripts)]
+
+    time_start = time.time()
+    for script in scripts:
+        mechanical.run_python_script(script)
+    elapsed = time.time() - time_start
+    print(f"run_python_script: {elapsed / n_scripts * 1000:.2f} ms per script")
+
+    time_start = time.time()
+    mechanical.run_python_scripts(scripts)
+    elapsed = time.time() - time_start
+    print(f"run_python_scripts: {elapsed / n_scripts * 1000:.2f} ms per script")
+
+
+@pytest.mark.remote_session_connect
+def test_run_python_script_stream(mechanical):
+    n_rows = 100000
+    script = f"('%d,%d' % (index, index * 2) for index in range({n_rows}))"
+    chunks = list(mechanical.run_python_script_stream(script, chunk_size=64 * 1024))
+    assert len(chunks) > 1
+    lines = list(scripting.iter_lines(chunks))
+    assert len(lines) == n_rows
+    assert lines[-1] == f"{n_rows - 1},{(n_rows - 1) * 2}"
+
+    assert b"".join(mechanical.run_python_script_stream("2+3")) == b"5"
+
+
+@pytest.mark.remote_session_connect
+def test_run_python_script_typed(mechanical):
+    assert mechanical.run_python_script_typed("1.0/3") == 1.0 / 3
+    assert mechanical.run_python_script_typed("2+3") == 5
+    assert mechanical.run_python_script_typed("'text'") == "text"
+    assert mechanical.run_python_script_typed("typed_value = 1") is None
+    values = mechanical.run_python_script_typed("[(i, i * 0.1) for i in range(3)]", as_array=False)
+    assert values == [[0.0, 0.0], [1.0, 0.1], [2.0, 0.2]]
+
+
+@pytest.mark.remote_session_connect
+def test_run_python_script_typed_benchmark(mechanical):
+    n_values = 200000
+    script = f"[i * 0.1 for i in range({n_values})]"
+
+    time_start = time.time()
+    values = [float(value) for value in mechanical.run_python_script(script)[1:-1].split(",")]
+    print(f"run_python_script: {time.time() - time_start:.3f} s")
+
+    time_start = time.time()
+    typed_values = mechanical.run_python_script_typed(script, as_array=False)
+    print(f"run_python_script_typed: {time.time() - time_start:.3f} s")
+    # IronPython formats floats with 12 significant digits, so only the
+    # typed values are exact
+    assert typed_values == pytest.approx(values, rel=1e-11)
+    assert typed_values[3] == 3 * 0.1
+
+
+@pytest.mark.remote_session_connect
+def test_register_script(mechanical):
+    handle = mechanical.register_script("import math\nmath.pow(base, 2)")
+    assert mechanical.register_script("import math\nmath.pow(base, 2)") == handle
+    assert mechanical.run_registered_script(handle, {"base": 3}) == "9.0"
+    assert mechanical.run_registered_script(handle, {"base": 4}) == "16.0"
+
+    # the script is registered again if the server does not know it
+    mechanical.run_python_script("_pymechanical_scripts.clear()")
+    assert mechanical.run_registered_script(handle, {"base": 5}) == "25.0"
+
+    with pytest.raises(ValueError):
+        mechanical.run_registered_script("unknown")
+
+
+@pytest.mark.remote_session_connect
+def test_register_script_benchmark(mechanical):
+    n_calls = 50
+    script = "\n".join(f"value_{index} = base * {index}" for index in range(2000)) + "\nbase"
+
+    time_start = time.time()
+    for index in range(n_calls):
+        mechanical.run_python_script(f"base = {index}\n{script}")
+    elapsed = time.time() - time_start
+    print(f"run_python_script: {elapsed / n_calls * 1000:.2f} ms per call")
+
+    handle = mechanical.register_script(script)
+    time_start = time.time()
+    for index in range(n_calls):
+        mechanical.run_registered_script(handle, {"base": index})
+    elapsed = time.time() - time_start
+    print(f"run_registered_script: {elapsed / n_calls * 1000:.2f} ms per call")
+
+
+@pytest.mark.remote_session_connect
+def test_submit_script(mechanical):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Submitting scripts requires the gRPC backend.")
+
+    mechanical.run_python_script("pipeline_values = []")
+    futures = [
+        mechanical.submit_script(f"pipeline_values.append({index})\n{index}") for index in range(20)
+    ]
+    assert [future.result() for future in futures] == [str(index) for index in range(20)]
+    assert mechanical.run_python_script("pipeline_values == list(range(20))") == "True"
+
+    with pytest.raises(grpc.RpcError):
+        mechanical.submit_script("hello_world()").result()
+
+
+@pytest.mark.remote_session_connect
+def test_submit_script_benchmark(mechanical):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Submitting scripts requires the gRPC backend.")
+
+    n_scripts = 500
+    time_start = time.time()
+    for index in range(n_scripts):
+        mechanical.run_python_script(f"{index}")
+    print(f"run_python_script: {n_scripts / (time.time() - time_start):.0f} scripts/s")
+
+    for depth in [1, 4]:
+        mechanical.script_pipeline_depth = depth
+        time_start = time.time()
+        futures = [mechanical.submit_script(f"{index}") for index in range(n_scripts)]
+        futures[-1].result()
+        print(
+            f"submit_script depth={depth}: {n_scripts / (time.time() - time_start):.0f} scripts/s"
+        )
+    mechanical.script_pipeline_depth = 1
+
+
+class ThrottledProxy:
+    """TCP proxy that limits the bandwidth in each direction to simulate slow links."""
+
+    def __init__(self, ip, port, bytes_per_second):
+        self._target = (ip, port)
+        self._bytes_per_second = bytes_per_second
+        self._server = socket.create_server(("127.0.0.1", 0))
+        self.port = self._server.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            upstream = socket.create_connection(self._target)
+            for source, target in ((client, upstream), (upstream, client)):
+                threading.Thread(target=self._pipe, args=(source, target), daemon=True).start()
+
+    def _pipe(self, source, target):
+        try:
+            while True:
+                data = source.recv(64 * 1024)
+                if not data:
+                    break
+                target.sendall(data)
+                time.sleep(len(data) / self._bytes_per_second)
+        except OSError:
+            pass
+        finally:
+            target.close()
+
+    def close(self):
+        self._server.close()
+
+
+@pytest.mark.remote_session_connect
+@pytest.mark.parametrize("bytes_per_second", [None, 10 * 1024**2])
+def test_compression_benchmark(mechanical, bytes_per_second, tmp_path):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Compression requires the gRPC backend.")
+
+    # a text file similar to a tabular result export
+    file_path = tmp_path / "results.txt"
+    with open(file_path, "w") as f:
+        for node in range(1000000):
+            f.write(f"{node}, {node * 0.001:.6e}, {node * 0.002:.6e}, {node * 0.003:.6e}\n")
+    file_size = file_path.stat().st_size
+    directory = mechanical.project_directory
+    server_file = os.path.join(directory, "results.txt")
+
+    proxy = None
+    client = mechanical
+    if bytes_per_second is not None:
+        proxy = ThrottledProxy(mechanical._ip, mechanical._port, bytes_per_second)
+        client = pymechanical.Mechanical(port=proxy.port)
+
+    try:
+        for compression in ["none", "gzip", "deflate"]:
+            time_start = time.time()
+            client.upload(
+                file_name=str(file_path),
+                file_location_destination=directory,
+                progress_bar=False,
+                compression=compression,
+            )
+            upload_elapsed = time.time() - time_start
+
+            time_start = time.time()
+            client.download(
+                server_file,
+                target_dir=str(tmp_path / compression),
+                progress_bar=False,
+                compression=compression,
+            )
+            download_elapsed = time.time() - time_start
+            assert (tmp_path / compression / "results.txt").read_bytes() == file_path.read_bytes()
+            print(
+                f"bytes_per_second={bytes_per_second} compression={compression}: "
+                f"upload {file_size / upload_elapsed / 1024**2:.1f} MB/s, "
+                f"download {file_size / download_elapsed / 1024**2:.1f} MB/s"
+            )
+    finally:
+        if proxy is not None:
+            proxy.close()
+
+
 def get_solve_out_path(mechanical):
     solve_out_path = ""
     for file_path in mechanical.list_files():
@@ -353,6 +892,32 @@ def test_download_file(mechanical, tmpdir, file_name):
     verify_download(mechanical, tmpdir, file_name, 1024 * 1024)
 
 
+@pytest.mark.remote_session_connect
+def test_download_concurrent(mechanical, tmpdir, assets):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Concurrent download requires the gRPC backend.")
+
+    directory = mechanical.project_directory
+    file_names = ["hsec.x_t", "Eng157.x_t", "longbar_sat_m.x_t"]
+    for file_name in file_names:
+        mechanical.upload(
+            file_name=os.path.join(assets, file_name),
+            file_location_destination=directory,
+            progress_bar=False,
+        )
+
+    server_files = [os.path.join(directory, file_name) for file_name in file_names]
+    local_files = mechanical.download(
+        server_files, target_dir=tmpdir.strpath, progress_bar=False, max_workers=3
+    )
+
+    assert [os.path.basename(file) for file in local_files] == file_names
+    stats = mechanical.transfer_stats
+    assert len(stats.files) == len(file_names)
+    assert stats.total_bytes == sum(os.path.getsize(file) for file in local_files)
+    print(stats)
+
+
 @pytest.mark.remote_session_connect
 # we are using only a small test file
 # change the chunk_size for that
@@ -376,6 +941,106 @@ def test_launch_result_mode(mechanical_result):
     assert result == "5"
 
 
+@pytest.mark.remote_session_connect
+def test_share_channel(mechanical):
+    if mechanical.backend != "mechanical":
+        pytest.skip("Sharing channels requires the gRPC backend.")
+
+    other = pymechanical.Mechanical(ip=mechanical._ip, port=mechanical._port)
+    assert other.run_python_script("2+3") == "5"
+    if mechanical._channel_key is not None:
+        assert other._channel is mechanical._channel
+        assert pymechanical.mechanical.CHANNEL_REGISTRY.refcount(other._channel_key) == 2
+        del other
+        assert pymechanical.mechanical.CHANNEL_REGISTRY.refcount(mechanical._channel_key) == 1
+
+    separate = pymechanical.Mechanical(
+        ip=mechanical._ip, port=mechanical._port, share_channel=False
+    )
+    assert separate._channel is not mechanical._channel
+
+
+@pytest.mark.remote_session_connect
+def test_startup_timings(mechanical):
+    timings = mechanical.startup_timings
+    assert timings.channel_ready >= 0
+    assert timings.app_ready >= 0
+    assert timings.total >= timings.channel_ready + timings.app_ready
+
+
+@pytest.mark.remote_session_launch
+def test_startup_timings_repr():
+    timings = pymechanical.mechanical.StartupTimings(None, 1.5, 2.25)
+    assert timings.total == 3.75
+    assert repr(timings) == "StartupTimings(launch=None, channel_ready=1.500, app_ready=2.250)"
+    timings.launch = 0.25
+    assert timings.total == 4.0
+
+
+@pytest.mark.remote_session_launch
+def test_run_python_script_typed_conversion_error():
+    # a server that cannot convert the result of the script
+    class ConversionError(grpc.RpcError):
+        def details(self):
+            return "The expected result cannot be return via this API."
+
+    class FakeStub:
+        def RunPythonScript(self, request):
+            raise ConversionError()
+
+    mechanical = pymechanical.Mechanical.__new__(pymechanical.Mechanical)
+    mechanical._disable_logging = True
+    mechanical._cleanup_on_exit = False
+    mechanical._exited = False
+    mechanical._log_mechanical = None
+    mechanical._stub = FakeStub()
+    with pytest.raises(ValueError, match="cannot be return via this API"):
+        mechanical.run_python_script_typed("1")
+
+
+@pytest.mark.remote_session_launch
+def test_registered_script_log(tmp_path):
+    # the script log records the script block, not the generated wrapper
+    class Response:
+        log_info = "__done__"
+        script_result = "9.0"
+
+    class FakeStub:
+        def RunPythonScript(self, request):
+            return iter([Response()])
+
+    mechanical = pymechanical.Mechanical.__new__(pymechanical.Mechanical)
+    mechanical._disable_logging = False
+    mechanical._cleanup_on_exit = False
+    mechanical._exited = False
+    mechanical._log_mechanical = None
+    mechanical._log_file_mechanical = str(tmp_path / "script.log")
+    mechanical._registered_scripts = {}
+    mechanical._stub = FakeStub()
+    handle = mechanical.register_script("import math\nmath.pow(base, 2)")
+    assert mechanical.run_registered_script(handle, {"base": 3}) == "9.0"
+    with open(mechanical._log_file_mechanical, encoding="utf-8") as file:
+        assert file.read() == "import math\nmath.pow(base, 2)\n" * 2
+
+
+@pytest.mark.remote_session_launch
+def test_startup_timings_failed_launch(monkeypatch):
+    # timings of a previous connection are not reported for a launch that did not connect
+    monkeypatch.setattr(pymechanical.mechanical, "launch_grpc", lambda **kwargs: 10001)
+    mechanical = pymechanical.Mechanical.__new__(pymechanical.Mechanical)
+    mechanical._disable_logging = True
+    mechanical._local = True
+    mechanical._cleanup_on_exit = False
+    mechanical._start_parm = {"exec_file": "AnsysWBU.exe"}
+    mechanical._ip = "127.0.0.1"
+    mechanical._channel_finalizer = None
+    mechanical._startup_timings = pymechanical.mechanical.StartupTimings(None, 1.5, 2.25)
+    mechanical._create_channel = lambda ip, port: None
+    mechanical._connect = lambda timeout, launch=None: False
+    mechanical.launch(cleanup_on_exit=False)
+    assert mechanical.startup_timings is None
+
+
 @pytest.mark.remote_session_launch
 def test_close_all_Local_instances(tmpdir):
     list_ports = []
@@ -20,12 +20,23 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import gc
 import pathlib
+import sys
+import threading
+import time
 
+import ansys.tools.path as atp
 import pytest
 
 import ansys.mechanical.core
 from ansys.mechanical.core.errors import VersionError
+from ansys.mechanical.core.mechanical import StartupTimings
+from ansys.mechanical.core.pool import (
+    DistributedMechanicalPool,
+    LocalMechanicalPool,
+    PoolScheduler,
+)
 
 
 def print_info(mechanical, name="no_name", info="no_info"):
@@ -55,6 +66,588 @@ def test_minimum_instances():
         ansys.mechanical.core.pool.LocalMechanicalPool(1)
 
 
+@pytest.mark.remote_session_launch
+def test_failed_constructor_exit(monkeypatch):
+    errors = []
+    monkeypatch.setattr(sys, "unraisablehook", errors.append)
+    with pytest.raises(ValueError):
+        DistributedMechanicalPool()
+    gc.collect()
+    assert errors == []
+
+
+@pytest.mark.remote_session_launch
+def test_pool_scheduler():
+    scheduler = PoolScheduler()
+    for index in (0, 1, 0):
+        scheduler.put(index)
+    assert scheduler.metrics.n_idle == 2
+    assert scheduler.peek() == 0
+    assert scheduler.acquire() == 0
+    # instances that cannot run work are skipped
+    with pytest.raises(TimeoutError):
+        scheduler.acquire(timeout=0.1, is_available=lambda index: index != 1)
+    assert scheduler.metrics.n_idle == 0
+
+    # a waiting caller gets the instance as soon as it is put back
+    threading.Timer(0.2, scheduler.put, (3,)).start()
+    assert scheduler.acquire(timeout=5) == 3
+    metrics = scheduler.metrics
+    assert metrics.n_acquired == 2
+    assert metrics.n_waiting == 0
+    assert 0.1 < metrics.max_wait < 5
+    assert metrics.mean_wait == pytest.approx(metrics.total_wait / 2)
+
+
+@pytest.mark.remote_session_launch
+def test_pool_scheduler_locked():
+    scheduler = PoolScheduler()
+    locked = {0}
+    for index in (0, 1):
+        scheduler.put(index)
+    # a locked instance is skipped but stays in the queue
+    assert scheduler.peek(is_locked=locked.__contains__) == 1
+    assert scheduler.acquire(is_locked=locked.__contains__) == 1
+    with pytest.raises(TimeoutError):
+        scheduler.acquire(timeout=0.2, is_locked=locked.__contains__)
+    assert scheduler.metrics.n_idle == 1
+
+    # a waiting caller takes the instance once it is unlocked
+    threading.Timer(0.2, locked.clear).start()
+    assert scheduler.acquire(timeout=5, is_locked=locked.__contains__) == 0
+
+
+@pytest.mark.remote_session_launch
+def test_pool_scheduler_close():
+    scheduler = PoolScheduler()
+    errors = []
+
+    def wait():
+        try:
+            scheduler.acquire()
+        except RuntimeError as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=wait)
+    thread.start()
+    while not scheduler.metrics.n_waiting:
+        time.sleep(0.01)
+    scheduler.close()
+    thread.join(5)
+    assert len(errors) == 1
+
+
+class FakeMechanical:
+    def __init__(self, port):
+        self._port = port
+        self._exited = False
+        self.locked = False
+        self.memory = 0
+        self.n_clear = 0
+        self.startup_timings = StartupTimings(None, 0.0, 0.0)
+        self.temp_directory = "/tmp/"
+        self.uploads = []
+        self.disconnected = False
+
+    def clear(self):
+        self.n_clear += 1
+
+    def upload(self, file_name, file_location_destination=None, progress_bar=True):
+        self.uploads.append((file_name, file_location_destination))
+
+    def run_python_script(self, script_block):
+        if "makedirs" in script_block:
+            return ""
+        if "GetTempPath" in script_block:
+            return self.temp_directory
+        assert "WorkingSet64" in script_block
+        return str(self.memory)
+
+    def exit(self):
+        self._exited = True
+
+    def _release_channel(self, close=False):
+        self.disconnected = True
+
+
+@pytest.fixture()
+def fake_pool(monkeypatch):
+    # a pool of instances that do not run Mechanical, to check the scheduling
+    monkeypatch.setattr(
+        ansys.mechanical.core.pool, "launch_mechanical", lambda port, **kwargs: FakeMechanical(port)
+    )
+    monkeypatch.setattr(ansys.mechanical.core.pool, "available_ports", lambda n_ports, port: [port])
+    pool = LocalMechanicalPool.__new__(LocalMechanicalPool)
+    pool._remote = False
+    pool._active = True
+    pool._spawn_kwargs = {}
+    pool._scheduler = PoolScheduler()
+    pool._instances = [FakeMechanical(port) for port in (10000, 10001)] + [None, None]
+    for index in range(2):
+        pool._scheduler.put(index)
+    pool._min_instances = 2
+    pool._max_instances = 4
+    pool._n_standby = 0
+    pool._standby = ansys.mechanical.core.pool.deque()
+    pool._standby_taken = threading.Event()
+    pool._last_port = 10001
+    pool._port_lock = threading.Lock()
+    pool._recycle_after_jobs = None
+    pool._recycle_memory = None
+    pool._recycle_latency_factor = None
+    pool._init_jobs(4, 1.0, None)
+    pool._launch_throttle = ansys.mechanical.core.pool._LaunchThrottle()
+    yield pool
+    pool.exit(block=True)
+
+
+def sleep_and_return(mechanical, duration, value):
+    time.sleep(duration)
+    return value
+
+
+@pytest.mark.remote_session_launch
+def test_map_order(fake_pool):
+    inputs = [(0.02 * (10 - index), index) for index in range(10)]
+    results = fake_pool.map(sleep_and_return, inputs, progress_bar=False)
+    assert results == list(range(10))
+    assert fake_pool.metrics.n_idle == 2
+
+    futures = fake_pool.map(sleep_and_return, inputs, progress_bar=False, wait=False)
+    assert [future.result(timeout=5) for future in futures] == list(range(10))
+
+    results = list(fake_pool.imap_unordered(sleep_and_return, [(0.3, "slow"), (0, "fast")]))
+    assert results == ["fast", "slow"]
+
+
+@pytest.mark.remote_session_launch
+def test_locked_instance(fake_pool):
+    first, second = fake_pool
+    first.locked = True
+    assert fake_pool.next_available() is second
+    assert fake_pool.map(sleep_and_return, [(0.05, index) for index in range(4)]) == [0, 1, 2, 3]
+    assert first.n_clear == 0
+    first.locked = False
+    assert fake_pool.metrics.n_idle == 2
+
+
+def fail_if_negative(mechanical, value):
+    if value < 0:
+        raise ValueError(value)
+    time.sleep(0.05)
+    return value
+
+
+@pytest.mark.remote_session_launch
+def test_iter_results(fake_pool):
+    consumed = []
+
+    def inputs():
+        for value in (1, -1, 2, 3, 4, 5):
+            consumed.append(value)
+            yield value
+
+    outcomes = {}
+    for index, outcome, timings in fake_pool.iter_results(
+        fail_if_negative, inputs(), clear_at_start=False, max_pending=2
+    ):
+        # inputs are only taken as jobs complete
+        assert len(consumed) <= len(outcomes) + 2
+        outcomes[index] = outcome
+        assert timings.queued >= 0
+        assert timings.total == pytest.approx(timings.queued + timings.run)
+
+    assert sorted(outcomes) == list(range(6))
+    assert isinstance(outcomes[1], ValueError)
+    assert [outcomes[index] for index in (0, 2, 3, 4, 5)] == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.remote_session_launch
+def test_map_timeout(fake_pool):
+    time_start = time.perf_counter()
+    results = fake_pool.map(
+        sleep_and_return, [(2, "slow"), (0, "fast")], progress_bar=False, timeout=0.2
+    )
+    assert time.perf_counter() - time_start < 1.5
+    # the instance that ran the slow job is stopped
+    assert results == ["fast"]
+    while len(fake_pool) != 1 and time.perf_counter() - time_start < 5:
+        time.sleep(0.01)
+    assert len(fake_pool) == 1
+
+
+@pytest.mark.remote_session_launch
+def test_map_timeout_slow_exit(fake_pool, monkeypatch):
+    # a slow shutdown does not delay the deadlines of the other jobs
+    def slow_exit(self):
+        time.sleep(1)
+        self._exited = True
+
+    monkeypatch.setattr(FakeMechanical, "exit", slow_exit)
+    time_start = time.perf_counter()
+    futures = fake_pool.map(
+        sleep_and_return, [(2, "first"), (2, "second")], timeout=0.2, wait=False
+    )
+    for future in futures:
+        with pytest.raises(TimeoutError):
+            future.result(timeout=5)
+    assert time.perf_counter() - time_start < 0.8
+
+
+@pytest.mark.remote_session_launch
+def test_autoscale(fake_pool):
+    fake_pool._idle_ttl = 0.5
+    fake_pool._scale_up_queue_depth = 1
+    fake_pool._scale_up_wait = 0.0
+    fake_pool._autoscale(refresh=0.02)
+
+    sizes = []
+
+    def record_size(mechanical, value):
+        sizes.append(len(fake_pool))
+        time.sleep(0.2)
+        return value
+
+    results = fake_pool.map(record_size, list(range(12)), progress_bar=False)
+    assert results == list(range(12))
+    assert max(sizes) == 4
+    assert sorted(fake_pool.ports) == [10000, 10001, 10002, 10003]
+
+    # the idle instances above the minimum are stopped
+    time_start = time.perf_counter()
+    while len(fake_pool) > 2 and time.perf_counter() - time_start < 5:
+        time.sleep(0.02)
+    assert len(fake_pool) == 2
+    assert fake_pool.metrics.n_idle == 2
+
+
+@pytest.mark.remote_session_launch
+def test_standby(fake_pool):
+    fake_pool._n_standby = 1
+    fake_pool._maintain_standby(refresh=0.02)
+    time_start = time.perf_counter()
+    while not fake_pool._standby and time.perf_counter() - time_start < 5:
+        time.sleep(0.01)
+    assert [instance._port for instance in fake_pool._standby] == [10002]
+
+    def crash(mechanical):
+        mechanical.exit()
+        raise RuntimeError("Mechanical crashed.")
+
+    # the failed instance is replaced by the standby instance when it is released
+    assert fake_pool.map(crash, [()], progress_bar=False) == []
+    while len(fake_pool) != 2 and time.perf_counter() - time_start < 5:
+        time.sleep(0.01)
+    assert len(fake_pool) == 2
+    assert 10002 in fake_pool.ports
+    assert fake_pool.metrics.n_idle == 2
+
+    # the standby set is refilled in the background
+    while not fake_pool._standby and time.perf_counter() - time_start < 5:
+        time.sleep(0.01)
+    assert [instance._port for instance in fake_pool._standby] == [10003]
+
+
+def wait_for_ports(pool, ports, stopped_instances):
+    def is_done():
+        return sorted(pool.ports) == ports and all(
+            instance._exited for instance in stopped_instances
+        )
+
+    time_start = time.perf_counter()
+    while not is_done() and time.perf_counter() - time_start < 5:
+        time.sleep(0.01)
+    assert is_done()
+
+
+@pytest.mark.remote_session_launch
+def test_recycle(fake_pool):
+    first_instances = list(fake_pool)
+    fake_pool._recycle_after_jobs = 2
+    assert fake_pool.map(sleep_and_return, [(0.05, index) for index in range(4)]) == [0, 1, 2, 3]
+    # each instance is replaced after its second job
+    wait_for_ports(fake_pool, [10002, 10003], first_instances)
+    assert fake_pool.metrics.n_idle == 2
+
+    fake_pool._recycle_after_jobs = None
+    fake_pool._recycle_memory = 1024**3
+    leaking, healthy = fake_pool
+    leaking.memory = 2 * 1024**3
+    assert fake_pool.map(sleep_and_return, [(0.05, index) for index in range(2)]) == [0, 1]
+    wait_for_ports(fake_pool, sorted([healthy._port, 10004]), [leaking])
+
+
+@pytest.mark.remote_session_launch
+def test_instance_health():
+    health = ansys.mechanical.core.pool._InstanceHealth()
+    for _ in range(ansys.mechanical.core.pool.LATENCY_BASELINE_JOBS):
+        health.record(1.0)
+    assert health.baseline == 1.0
+    for _ in range(10):
+        health.record(3.0)
+    assert health.n_jobs == ansys.mechanical.core.pool.LATENCY_BASELINE_JOBS + 10
+    assert 2.5 < health.latency < 3.0
+    assert health.baseline == 1.0
+
+
+@pytest.mark.remote_session_launch
+def test_affinity(fake_pool):
+    def load(mechanical, geometry, index):
+        time.sleep(0.02)
+        return geometry, mechanical._port
+
+    inputs = [(geometry, index) for index in range(4) for geometry in ("bracket", "shaft")]
+    results = fake_pool.map(load, inputs, progress_bar=False, affinity=lambda args: args[0])
+    ports = {}
+    for geometry, port in results:
+        ports.setdefault(geometry, set()).add(port)
+    # each geometry stays on the instance that loaded it first
+    assert all(len(geometry_ports) == 1 for geometry_ports in ports.values())
+    assert sum(instance.n_clear for instance in fake_pool) == 2
+    assert fake_pool.metrics.n_preferred >= 6
+
+
+@pytest.mark.remote_session_launch
+def test_job_queue():
+    jobs = ansys.mechanical.core.pool._JobQueue({"design": 4})
+    for index in range(8):
+        jobs.put(("sweep", index), tenant="sweeps")
+        jobs.put(("design", index), tenant="design")
+    jobs.put(("urgent", 0), priority=1, tenant="sweeps")
+    assert len(jobs) == 17
+
+    order = [jobs.get() for _ in range(9)]
+    assert order[0] == ("urgent", 0)
+    # the design tenant runs four jobs for each job of the sweeps, and the
+    # urgent job counts in the share of the sweeps
+    tenants = [tenant for tenant, _ in order[1:]]
+    assert tenants == ["design"] * 4 + ["sweep"] + ["design"] * 3
+    assert [index for tenant, index in order[1:] if tenant == "design"] == list(range(7))
+
+    # a tenant that was idle does not get the share it did not use
+    assert len(jobs.clear()) == 8
+    for index in range(3):
+        jobs.put(("sweep", index), tenant="sweeps")
+        jobs.put(("late", index), tenant="late")
+    tenants = [jobs.get()[0] for _ in range(6)]
+    assert tenants == ["late", "sweep"] * 3
+    assert jobs.get() is None
+
+
+@pytest.mark.remote_session_launch
+def test_priority(fake_pool):
+    sweep = fake_pool.map(
+        sleep_and_return, [(0.05, index) for index in range(20)], wait=False, tenant="sweeps"
+    )
+    time.sleep(0.1)
+    urgent = fake_pool.map(sleep_and_return, [(0, "urgent")], wait=False, priority=1)
+    assert urgent[0].result(timeout=5) == "urgent"
+    # the urgent job starts as soon as an instance is free
+    assert urgent[0].timings.queued < 0.2
+    assert sum(future.done() for future in sweep) < 10
+    assert [future.result(timeout=5) for future in sweep] == list(range(20))
+
+    queue_waits = fake_pool.metrics.queue_waits
+    assert queue_waits[1].n_jobs == 1
+    assert queue_waits[0].n_jobs == 20
+    assert queue_waits[0].max_wait > queue_waits[1].max_wait
+
+
+@pytest.mark.remote_session_launch
+def test_launch_throttle(fake_pool):
+    fake_pool._launch_throttle = ansys.mechanical.core.pool._LaunchThrottle(1, 0.1)
+    time_start = time.perf_counter()
+    threads = [fake_pool._spawn_mechanical(index, port) for index, port in ((2, 10002), (3, 10003))]
+    for thread in threads:
+        thread.join(5)
+    assert time.perf_counter() - time_start >= 0.1
+    timings = fake_pool.startup_timings
+    assert [timing.queued for timing in timings[:2]] == [None, None]
+    # the second launch waits for the stagger after the first one
+    assert sorted(timing.queued for timing in timings[2:])[1] >= 0.09
+    assert fake_pool.metrics.n_idle == 4
+
+
+@pytest.mark.remote_session_launch
+def test_launch_concurrency_benchmark():
+    # find the launch concurrency that starts a pool the fastest on this host
+    exec_file = atp.get_mechanical_path(False)
+    if not ansys.mechanical.core.mechanical.get_start_instance() or exec_file is None:
+        return
+
+    n_instances = 4
+    durations = {}
+    for concurrency in (1, 2, n_instances):
+        time_start = time.perf_counter()
+        pool = LocalMechanicalPool(n_instances, launch_concurrency=concurrency, exec_file=exec_file)
+        durations[concurrency] = time.perf_counter() - time_start
+        print(f"launch_concurrency={concurrency}: {durations[concurrency]:.3f} s")
+        for timings in pool.startup_timings:
+            print(f"    {timings}")
+        pool.exit(block=True)
+    print(f"Best launch concurrency: {min(durations, key=durations.get)}")
+
+
+@pytest.fixture()
+def distributed_pool(monkeypatch):
+    # servers that run on hosts A and B, and are discovered on host C
+    def connect(ip, port, **kwargs):
+        instance = FakeMechanical(port)
+        instance.host = ip
+        return instance
+
+    monkeypatch.setattr(ansys.mechanical.core.pool, "connect_to_mechanical", connect)
+    monkeypatch.setattr(
+        ansys.mechanical.core.pool,
+        "find_mechanical_servers",
+        lambda port_range, host, verify: [10000, 10002],
+    )
+    pools = []
+
+    def create(**kwargs):
+        pool = DistributedMechanicalPool(
+            ["hostA:10000", ("hostA", 10001), "hostB:10000"],
+            progress_bar=False,
+            restart_failed=False,
+            **kwargs,
+        )
+        pools.append(pool)
+        return pool
+
+    yield create
+    for pool in pools:
+        pool.exit(block=True)
+
+
+@pytest.mark.remote_session_launch
+def test_distributed_pool(distributed_pool):
+    pool = distributed_pool(hosts=["hostC", "hostA"], max_jobs_per_host={"hostA": 1})
+    assert pool.servers == [
+        "hostA:10000",
+        "hostA:10001",
+        "hostB:10000",
+        "hostC:10000",
+        "hostC:10002",
+        "hostA:10002",
+    ]
+    assert str(pool) == "Mechanical pool with 6 active servers on 3 hosts"
+
+    running = {}
+    max_running = {}
+    lock = threading.Lock()
+
+    def count_jobs(mechanical, value):
+        with lock:
+            running[mechanical.host] = running.get(mechanical.host, 0) + 1
+            max_running[mechanical.host] = max(
+                max_running.get(mechanical.host, 0), running[mechanical.host]
+            )
+        time.sleep(0.05)
+        with lock:
+            running[mechanical.host] -= 1
+        return value
+
+    assert pool.map(count_jobs, list(range(30)), progress_bar=False) == list(range(30))
+    # host A runs one job at a time although it has three servers
+    assert max_running["hostA"] == 1
+    assert max_running["hostC"] == 2
+
+    # a failed job only closes the connection to its server
+    def fail(mechanical):
+        raise RuntimeError("failed")
+
+    assert pool.map(fail, [()], progress_bar=False) == []
+    # the job fails before its connection is closed
+    time_start = time.perf_counter()
+    while not any(instance.disconnected for instance in pool):
+        assert time.perf_counter() - time_start < 5
+        time.sleep(0.01)
+    assert len([instance for instance in pool if instance.disconnected]) == 1
+    assert len(pool) == 5
+
+
+@pytest.mark.remote_session_launch
+def test_distributed_pool_input_files(distributed_pool, tmp_path):
+    pool = distributed_pool(affinity_wait=0.0)
+    geometry = tmp_path / "geometry.x_t"
+    geometry.write_bytes(b"0" * 100)
+
+    def get_path(mechanical, file_name):
+        return mechanical.host, pool.remote_path(mechanical, file_name)
+
+    [(host, path)] = pool.map(
+        get_path, [str(geometry)], progress_bar=False, input_files=lambda args: [args]
+    )
+    directory = path.rpartition("/")[0]
+    assert path == f"{directory}/geometry.x_t"
+    assert directory.rpartition("/")[0].startswith("/tmp/PyMechanical_Pool_")
+    assert pool.host_files[host] == [str(geometry)]
+
+    # the jobs that need the file prefer the host that holds it
+    for _ in range(3):
+        instance = pool.acquire(input_files=[str(geometry)])
+        assert instance.host == host
+        pool.release(instance)
+    pool.map(get_path, [str(geometry)], progress_bar=False, input_files=lambda args: [args])
+    uploads = [upload for instance in pool for upload in instance.uploads]
+    assert uploads == [(str(geometry), directory)]
+
+    # a new version of the file is uploaded again
+    geometry.write_bytes(b"1" * 200)
+    assert pool.host_files[host] == []
+    [(host, _)] = pool.map(
+        get_path, [str(geometry)], progress_bar=False, input_files=lambda args: [args]
+    )
+    assert len([upload for instance in pool for upload in instance.uploads]) == 2
+    assert pool.host_files[host] == [str(geometry)]
+
+    # the files of a host are uploaded again after a server of the host reconnects
+    index = next(index for index, instance in enumerate(pool) if instance.host == host)
+    pool._connect(index).join()
+    assert host not in pool.host_files
+
+
+@pytest.mark.remote_session_launch
+def test_distributed_pool_same_file_names(distributed_pool, tmp_path, monkeypatch):
+    pool = distributed_pool()
+    # host B runs on Windows
+    for instance in pool:
+        if instance.host == "hostB":
+            instance.temp_directory = "C:\\Temp\\"
+    for name in ("dir1", "dir2"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "model.x_t").write_text(name)
+    monkeypatch.chdir(tmp_path)
+
+    def read_path(mechanical, file_name):
+        return pool.remote_path(mechanical, file_name)
+
+    for instance in pool:
+        paths = [
+            read_path(instance, file_name) for file_name in ("dir1/model.x_t", "dir2/model.x_t")
+        ]
+        assert paths[0] != paths[1]
+        separator = "\\" if instance.host == "hostB" else "/"
+        prefix = "C:\\Temp" if instance.host == "hostB" else "/tmp"
+        for path in paths:
+            assert path.startswith(prefix + separator) and path.endswith(separator + "model.x_t")
+            assert ("/" if separator == "\\" else "\\") not in path
+        # a relative and an absolute path of the same file share the remote path
+        assert read_path(instance, str(tmp_path / "dir1" / "model.x_t")) == paths[0]
+
+    # jobs that give a relative and an absolute path upload the file once
+    instance = pool[2]
+    pool._upload_input_files(instance, ["dir1/model.x_t", "dir2/model.x_t"])
+    pool._upload_input_files(instance, [str(tmp_path / "dir1" / "model.x_t")])
+    assert [upload[0] for upload in instance.uploads] == [
+        str(tmp_path / "dir1" / "model.x_t"),
+        str(tmp_path / "dir2" / "model.x_t"),
+    ]
+    assert len({upload[1] for upload in instance.uploads}) == 2
+    # and they prefer the host that holds the file
+    assert pool._holders(["dir1/model.x_t"]) == {"hostB"}
+
+
 @pytest.mark.remote_session_launch
 def test_map(mechanical_pool):
     if mechanical_pool is None:
@@ -0,0 +1,85 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from concurrent import futures
+import socket
+
+import grpc
+import pytest
+
+from ansys.mechanical.core import ports
+
+
+@pytest.fixture
+def listeners():
+    """Plain TCP listener, gRPC server without the Mechanical service, and a closed port."""
+    plain = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    plain.bind(("127.0.0.1", 0))
+    plain.listen(1)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+    grpc_port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    closed = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    closed.bind(("127.0.0.1", 0))
+    closed_port = closed.getsockname()[1]
+    closed.close()
+    yield plain.getsockname()[1], grpc_port, closed_port
+    server.stop(None)
+    plain.close()
+
+
+@pytest.mark.remote_session_launch
+def test_scan_ports(listeners):
+    plain_port, grpc_port, closed_port = listeners
+    results = ports.scan_ports([plain_port, grpc_port, closed_port], max_sockets=2)
+    assert results == {plain_port: True, grpc_port: True, closed_port: False}
+
+    # the plain listener never answers the handshake
+    results = ports.scan_ports([plain_port, grpc_port, closed_port], timeout=0.2, handshake=True)
+    assert results == {plain_port: None, grpc_port: True, closed_port: False}
+
+
+@pytest.mark.remote_session_launch
+def test_find_mechanical_servers(listeners):
+    plain_port, grpc_port, closed_port = listeners
+    port_range = [plain_port, grpc_port, closed_port]
+    assert ports.find_mechanical_servers(port_range, timeout=0.2) == [grpc_port]
+    # the gRPC server does not implement the Mechanical service
+    assert ports.find_mechanical_servers(port_range, timeout=0.2, verify=True) == []
+
+
+@pytest.mark.remote_session_launch
+def test_find_free_ports(listeners):
+    plain_port, grpc_port, _ = listeners
+    start = min(plain_port, grpc_port)
+    # a port that is bound but does not listen yet is not free
+    bound = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    bound.bind(("127.0.0.1", 0))
+    bound_port = bound.getsockname()[1]
+    start = min(start, bound_port)
+    with bound:
+        free_ports = ports.find_free_ports(3, start)
+    assert len(free_ports) == 3
+    assert not {plain_port, grpc_port, bound_port} & set(free_ports)
+    assert all(port >= start for port in free_ports)
+    assert ports.find_free_ports(2, 65535) in ([65535], [])
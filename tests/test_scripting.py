@@ -0,0 +1,248 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import threading
+import time
+
+import pytest
+
+import ansys.mechanical.core.errors as errors
+import ansys.mechanical.core.scripting as scripting
+
+
+class FakeCalls:
+    """Start fake calls whose results are the requests, after a delay."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.started = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def start_call(self, request):
+        if request == b"fail to start":
+            raise RuntimeError("fail to start")
+        with self._lock:
+            self.started.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return iter([request])
+
+    def read_result(self, responses, context):
+        time.sleep(self.delay)
+        result = next(responses)
+        with self._lock:
+            self.in_flight -= 1
+        if result == b"fail":
+            raise ValueError(context)
+        return result.decode()
+
+
+@pytest.mark.remote_session_launch
+@pytest.mark.parametrize("depth", [1, 3])
+def test_script_pipeline_order(depth):
+    calls = FakeCalls(delay=0.001)
+    pipeline = scripting.ScriptPipeline(calls.start_call, calls.read_result, depth=depth)
+    futures = [pipeline.submit(str(index).encode()) for index in range(20)]
+    assert [future.result() for future in futures] == [str(index) for index in range(20)]
+    assert calls.started == [str(index).encode() for index in range(20)]
+    assert calls.max_in_flight <= depth
+    pipeline.close()
+
+
+@pytest.mark.remote_session_launch
+def test_script_pipeline_errors():
+    calls = FakeCalls()
+    pipeline = scripting.ScriptPipeline(calls.start_call, calls.read_result)
+    failed = pipeline.submit(b"fail", context="script")
+    not_started = pipeline.submit(b"fail to start")
+    succeeded = pipeline.submit(b"ok")
+
+    with pytest.raises(ValueError, match="script"):
+        failed.result()
+    with pytest.raises(RuntimeError):
+        not_started.result()
+    assert succeeded.result() == "ok"
+
+    pipeline.wait()
+    pipeline.close()
+    with pytest.raises(RuntimeError):
+        pipeline.submit(b"closed")
+
+    with pytest.raises(ValueError):
+        scripting.ScriptPipeline(calls.start_call, calls.read_result, depth=0)
+
+
+@pytest.mark.remote_session_launch
+def test_split_last_expression():
+    assert scripting.split_last_expression("import math\nmath.pow(2, 3)") == (
+        "import math\n",
+        "math.pow(2, 3)",
+    )
+    assert scripting.split_last_expression("a = 1; a") == ("a = 1; ", "a")
+    assert scripting.split_last_expression("    a = 1\n    (a +\n     1)\n") == (
+        "a = 1\n",
+        "(a +\n 1)",
+    )
+    assert scripting.split_last_expression("a = 1") == ("a = 1", None)
+    # non-ASCII text before the expression
+    assert scripting.split_last_expression("a = 'éé'; a") == ("a = 'éé'; ", "a")
+    assert scripting.split_last_expression(
+        'Model.Name = "Bügel"; Model.AddStaticStructuralAnalysis()'
+    ) == ('Model.Name = "Bügel"; ', "Model.AddStaticStructuralAnalysis()")
+    # IronPython 2 syntax cannot be parsed by the client
+    assert scripting.split_last_expression('print "a"') == ('print "a"', None)
+
+
+@pytest.mark.remote_session_launch
+@pytest.mark.parametrize("stop_on_error", [True, False])
+def test_batch_script(stop_on_error):
+    script = scripting.batch_script(["a = 1", "a + 1", "1/0", "a * 5"], stop_on_error)
+
+    # the server script runs in CPython as well
+    namespace = {}
+    body, call = script.rsplit("\n\n\n", 1)
+    exec(body, namespace)
+    results = scripting.parse_batch_results(eval(call, namespace))
+
+    assert results[:2] == ["", "2"]
+    assert isinstance(results[2], errors.MechanicalRuntimeError)
+    assert "ZeroDivisionError" in str(results[2])
+    assert results[3] == (None if stop_on_error else "5")
+
+
+@pytest.mark.remote_session_launch
+def test_iter_lines():
+    chunks = [b"1,2\n3,", b"4\n\n5", b",6"]
+    assert list(scripting.iter_lines(chunks)) == ["1,2", "3,4", "5,6"]
+    assert list(scripting.iter_lines([])) == []
+
+
+@pytest.mark.remote_session_launch
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("'a\\nb'", "a\nb"),
+        ("[1, 2]", "1\n2\n"),
+        ("(i * 2 for i in range(3))", "0\n2\n4\n"),
+        ("2 + 3", "5"),
+    ],
+)
+def test_stream_result_script(expression, expected):
+    script = scripting.STREAM_RESULT_SCRIPT % ("", expression)
+
+    # the server script runs in CPython as well
+    namespace = {}
+    body, call = script.rsplit("\n\n\n", 1)
+    exec(body, namespace)
+    path = eval(call, namespace)
+    try:
+        with open(path, encoding="utf-8", newline="") as stream:
+            assert stream.read() == expected
+    finally:
+        os.remove(path)
+
+
+@pytest.mark.remote_session_launch
+def test_load_arrays():
+    np = pytest.importorskip("numpy")
+    csv_chunks = [b"x,y\n1,2\n3,", b"4\n5,6\n"]
+    array = scripting.load_csv(csv_chunks, skip_rows=1, block_rows=2)
+    assert np.array_equal(array, [[1, 2], [3, 4], [5, 6]])
+
+    arrays = list(scripting.iter_ndjson_arrays([b"[1, 2]\n[3, ", b"4]\n[5, 6]"], block_rows=2))
+    assert [len(array) for array in arrays] == [2, 1]
+    assert np.array_equal(scripting.load_ndjson([b"1\n2\n3"], dtype=int), [1, 2, 3])
+    assert scripting.load_csv([]).size == 0
+
+
+def _run_typed_result_script(expression):
+    # the server script runs in CPython as well
+    namespace = {}
+    body, call = scripting.typed_result_script(expression).rsplit("\n\n\n", 1)
+    exec(body, namespace)
+    return eval(call, namespace)
+
+
+@pytest.mark.remote_session_launch
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("None", None),
+        ("'text'", "text"),
+        ("2**40 + 1", 2**40 + 1),
+        ("1.0/3", 1.0 / 3),
+        ("True", True),
+        ("[1, 2.5]", [1.0, 2.5]),
+        ("(i * 0.1 for i in range(3))", [0.0, 0.1, 0.2]),
+        ("[(1, 2), (3, 4)]", [[1, 2], [3, 4]]),
+        ("[[1, 2], [3]]", [[1, 2], [3]]),
+        ("{'a': [1, 'b']}", {"a": [1, "b"]}),
+        ("2**70", 2**70),
+        ("object", "<class 'object'>"),
+    ],
+)
+def test_typed_result(expression, expected):
+    result = scripting.decode_typed_result(_run_typed_result_script(expression), as_array=False)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.remote_session_launch
+def test_typed_result_array():
+    np = pytest.importorskip("numpy")
+    array = scripting.decode_typed_result(_run_typed_result_script("[(1, 2.5), (3, 4)]"))
+    assert array.dtype == np.float64
+    assert np.array_equal(array, [[1, 2.5], [3, 4]])
+    array[0, 0] = 0
+
+    array = scripting.decode_typed_result(_run_typed_result_script("[True, False]"))
+    assert array.dtype == np.bool_
+
+
+@pytest.mark.remote_session_launch
+def test_typed_result_empty():
+    with pytest.raises(ValueError, match="did not return"):
+        scripting.decode_typed_result("")
+
+
+@pytest.mark.remote_session_launch
+def test_registered_script():
+    handle, script = scripting.registration_script("import math\nmath.pow(base, 2)")
+    assert handle == scripting.script_handle("import math\nmath.pow(base, 2)")
+
+    # the server scripts run in CPython as well
+    namespace = {}
+    call = scripting.registered_script_call(handle, {"base": 3})
+    assert eval(call, namespace) == scripting.UNREGISTERED_SCRIPT
+    exec(script, namespace)
+    assert eval(call, namespace) == "9.0"
+    assert eval(scripting.registered_script_call("unknown"), namespace) == (
+        scripting.UNREGISTERED_SCRIPT
+    )
+
+    handle, script = scripting.registration_script("registered_value = 1")
+    exec(script, namespace)
+    assert eval(scripting.registered_script_call(handle), namespace) == ""
+    assert namespace["registered_value"] == 1
@@ -0,0 +1,264 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import hashlib
+import os
+import pathlib
+import time
+import types
+
+import pytest
+
+import ansys.mechanical.core.transfer as transfer
+
+
+@pytest.mark.remote_session_launch
+def test_split_byte_ranges():
+    assert transfer.split_byte_ranges(10, 3) == [(0, 4), (4, 3), (7, 3)]
+
+    # small files use fewer ranges
+    assert transfer.split_byte_ranges(10, 4, min_length=5) == [(0, 5), (5, 5)]
+    assert transfer.split_byte_ranges(0, 4) == [(0, 0)]
+
+    ranges = transfer.split_byte_ranges(1000003, 7)
+    assert sum(length for _, length in ranges) == 1000003
+    for (offset, length), (next_offset, _) in zip(ranges, ranges[1:]):
+        assert offset + length == next_offset
+
+    with pytest.raises(ValueError):
+        transfer.split_byte_ranges(10, 0)
+
+
+@pytest.mark.remote_session_launch
+def test_server_scripts_compile():
+    script = transfer.MERGE_PARTS_SCRIPT % ("dir", "file.bin", ["a", "b"], 1024)
+    compile(script, "<merge>", "exec")
+
+    script = transfer.RENAME_FILE_SCRIPT % ("dir", "file.bin.merged", "file.bin")
+    compile(script, "<rename>", "exec")
+
+    script = transfer.FILE_DIGESTS_SCRIPT % ([("dir/file.bin", 10)], 1024)
+    compile(script, "<digests>", "exec")
+
+    script = transfer.COPY_TAIL_SCRIPT % ("file.bin", "file.bin.tail", 10, 1024)
+    compile(script, "<tail>", "exec")
+
+    script = transfer.COMPRESS_FILE_SCRIPT % ("file.bin", "file.bin.gz", 31, 1024, 1024)
+    compile(script, "<compress>", "exec")
+
+
+@pytest.mark.remote_session_launch
+def test_file_digest(tmp_path):
+    file_path = tmp_path / "file.bin"
+    file_path.write_bytes(b"0123456789")
+
+    assert transfer.file_digest(file_path) == hashlib.sha256(b"0123456789").hexdigest()
+    assert transfer.file_digest(file_path, length=4) == hashlib.sha256(b"0123").hexdigest()
+
+
+@pytest.mark.remote_session_launch
+def test_parse_file_digests():
+    result = "10,abc,def\n-"
+    assert transfer.parse_file_digests(result) == [(10, "abc", "def"), None]
+
+
+@pytest.mark.remote_session_launch
+def test_transfer_stats():
+    stats = transfer.TransferStats()
+    assert stats.total_bytes == 0
+    assert stats.bytes_per_second == 0.0
+
+    stats.add(transfer.FileTransfer("remote/a.rst", "local/a.rst", 300, 1.5, chunk_size=1024))
+    stats.add(transfer.FileTransfer("remote/b.rst", "local/b.rst", 100, 0.5))
+    stats.elapsed = 2.0
+
+    assert stats.total_bytes == 400
+    assert stats.bytes_per_second == 200.0
+    assert stats.files[0].bytes_per_second == 200.0
+    assert "chunk_size=1024" in repr(stats.files[0])
+    assert "files=2" in repr(stats)
+
+
+def _responses(data, chunk_size):
+    return [
+        types.SimpleNamespace(
+            chunk=types.SimpleNamespace(payload=data[i : i + chunk_size]), file_size=len(data)
+        )
+        for i in range(0, len(data), chunk_size)
+    ]
+
+
+@pytest.mark.remote_session_launch
+@pytest.mark.parametrize("sink_class", [transfer.FileSink, transfer.MmapSink])
+def test_file_sinks(sink_class, tmp_path):
+    data = os.urandom(1000)
+    file_path = tmp_path / "file.bin"
+
+    sink = sink_class(str(file_path))
+    for response in _responses(data, 300):
+        sink.write(response.chunk.payload, response.file_size)
+    sink.close()
+    assert sink.size == len(data)
+    assert file_path.read_bytes() == data
+
+    # appending keeps the existing content
+    sink = sink_class(str(file_path), append=True)
+    sink.write(b"tail", 4)
+    sink.close()
+    assert file_path.read_bytes() == data + b"tail"
+
+
+@pytest.mark.remote_session_launch
+def test_mmap_sink_grows_and_truncates(tmp_path):
+    file_path = tmp_path / "file.bin"
+
+    # the reported file size is smaller than the data
+    sink = transfer.MmapSink(str(file_path))
+    sink.write(b"0123", 2)
+    sink.write(b"4567", 2)
+    sink.close()
+    assert file_path.read_bytes() == b"01234567"
+
+    # the reported file size is larger than the data
+    sink = transfer.MmapSink(str(file_path))
+    sink.write(b"0123", 100)
+    sink.close()
+    assert file_path.read_bytes() == b"0123"
+
+    # the mapping grows geometrically when the reported file size is too small
+    sink = transfer.MmapSink(str(file_path))
+    sizes = set()
+    for index in range(64):
+        sink.write(b"%02d" % index, 2)
+        sizes.add(len(sink._mmap))
+    sink.close()
+    assert len(sizes) <= 7
+    assert file_path.read_bytes() == b"".join(b"%02d" % index for index in range(64))
+
+    # an empty file is created without mapping it
+    sink = transfer.MmapSink(str(tmp_path / "empty.bin"))
+    assert sink.write(b"", 0) == 0
+    sink.close()
+    assert (tmp_path / "empty.bin").read_bytes() == b""
+
+
+@pytest.mark.remote_session_launch
+def test_buffer_sink():
+    data = os.urandom(800)
+    sink = transfer.BufferSink()
+    for response in _responses(data, 300):
+        sink.write(response.chunk.payload, response.file_size)
+    sink.close()
+    assert bytes(sink.buffer) == data
+
+    sink.write(b"more", 0)
+    assert bytes(sink.buffer) == data + b"more"
+
+    np = pytest.importorskip("numpy")
+    array = sink.as_array(np.uint8)
+    assert array.tobytes() == data + b"more"
+
+
+@pytest.mark.remote_session_launch
+def test_adaptive_chunk_sizer():
+    sizer = transfer.AdaptiveChunkSizer(256 * 1024, minimum=64 * 1024, maximum=4 * 1024**2)
+    assert sizer.chunk_size == 256 * 1024
+
+    # fast links use the largest chunks
+    assert sizer.add_sample(1024**3, 1.0) == 4 * 1024**2
+
+    # slow links use smaller chunks
+    sizer = transfer.AdaptiveChunkSizer(256 * 1024, minimum=64 * 1024, smoothing=1.0)
+    assert sizer.add_sample(1024**2, 1.0) == 64 * 1024
+
+    # the target only moves the size when it is more than a factor of two away
+    sizer = transfer.AdaptiveChunkSizer(1024**2, target_interval=1.0, smoothing=1.0)
+    assert sizer.add_sample(int(1.5 * 1024**2), 1.0) == 1024**2
+    assert sizer.add_sample(3 * 1024**2, 1.0) == 2 * 1024**2
+
+    # high latency links send more bytes per chunk
+    sizer = transfer.AdaptiveChunkSizer(256 * 1024, smoothing=1.0)
+    sizer.add_rtt(0.5)
+    assert sizer.add_sample(1024**2, 1.0) == 2 * 1024**2
+
+
+@pytest.mark.remote_session_launch
+def test_adaptive_chunk_sizer_measure():
+    sizer = transfer.AdaptiveChunkSizer(256 * 1024)
+    responses = _responses(os.urandom(1000), 300)
+    assert list(sizer.measure(responses, time.perf_counter())) == responses
+    assert sizer.rtt is not None
+    assert sizer.throughput is not None
+
+
+@pytest.mark.remote_session_launch
+def test_check_compression():
+    assert transfer.check_compression("GZIP") == "gzip"
+    assert transfer.check_compression("none") == "none"
+    with pytest.raises(ValueError, match="zstd"):
+        transfer.check_compression("zstd")
+
+
+@pytest.mark.remote_session_launch
+def test_is_compressible(tmp_path):
+    text_path = tmp_path / "file.out"
+    text_path.write_bytes(b"node result\n" * 1000)
+    random_path = tmp_path / "file.bin"
+    random_path.write_bytes(os.urandom(1000))
+
+    assert transfer.is_compressible(str(text_path))
+    assert not transfer.is_compressible(str(random_path))
+    assert not transfer.is_compressible("remote/file.zip", sample=False)
+    assert transfer.is_compressible("remote/file.out", sample=False)
+
+
+@pytest.mark.remote_session_launch
+@pytest.mark.parametrize("compression", ["gzip", "deflate"])
+def test_compressed_download(compression, tmp_path):
+    data = b"node result\n" * 100000
+    file_path = tmp_path / "file.out"
+    file_path.write_bytes(data)
+    compressed_path = transfer.compressed_file_name(str(file_path))
+
+    # the server script runs in CPython as well
+    namespace = {}
+    script, call = (
+        transfer.COMPRESS_FILE_SCRIPT
+        % (
+            str(file_path),
+            compressed_path,
+            transfer.COMPRESSION_WBITS[compression],
+            transfer.COMPRESSION_SAMPLE_SIZE,
+            1024,
+        )
+    ).rsplit("\n\n\n", 1)
+    exec(script, namespace)
+    result = eval(call, namespace)
+    assert result == f"{len(data)},{compressed_path}"
+
+    compressed = pathlib.Path(compressed_path).read_bytes()
+    assert len(compressed) < len(data) / 10
+
+    responses = _responses(compressed, 100)
+    decompressed = list(transfer.decompress_responses(responses, compression, len(data)))
+    assert b"".join(response.chunk.payload for response in decompressed) == data
+    assert all(response.file_size == len(data) for response in decompressed)